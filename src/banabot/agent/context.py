@@ -4,15 +4,32 @@ import base64
 import json
 import mimetypes
 import platform
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from banabot.agent.memory import MemoryStore
 from banabot.agent.skills import SkillsLoader
 
 if TYPE_CHECKING:
+    from banabot.agent.semantic_memory import AsyncSemanticMemory
     from banabot.v2.skills.skill_loader import SkillLoader as V2SkillLoader
 
+T = TypeVar("T")
+
+
+def _stat_signature(paths: list[Path]) -> tuple:
+    """(mtime, size) of each path, None for missing files."""
+    signature = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
 
 class ContextBuilder:
     """
@@ -20,22 +37,54 @@ class ContextBuilder:
 
     Assembles bootstrap files, memory, skills, and conversation history
     into a coherent prompt for the LLM.
+
+    Prompt fragments backed by files (bootstrap files, MEMORY.md, profile.json,
+    skills) are cached and rebuilt only when the mtime or size of their files
+    changes. Skill availability also depends on installed binaries, so the
+    skills fragment is additionally rebuilt every ``SKILLS_REFRESH_SECONDS``.
+
+    With ``prompt_cache`` enabled the system prompt holds only static content,
+    so its bytes stay identical between turns and provider prompt caching can
+    reuse it. Volatile context (current time, session, recalled memories) is
+    sent at the start of the trailing user message instead.
     """
 
     BOOTSTRAP_FILES = ["AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md"]
+    SKILLS_REFRESH_SECONDS = 60
 
     def __init__(
         self,
         workspace: Path,
         v2_skill_loader: "V2SkillLoader | None" = None,
-        semantic_memory: Any = None,
+        semantic_memory: "AsyncSemanticMemory | None" = None,
+        prompt_cache: bool = True,
     ):
         self.workspace = workspace
+        self.prompt_cache = prompt_cache
         self.memory = MemoryStore(workspace)
         self.skills = SkillsLoader(workspace)
         self.v2_skill_loader = v2_skill_loader
         self.semantic_memory = semantic_memory
         self._profile_path = workspace / "profile.json"
+        self._fragments: dict[str, tuple[tuple, Any]] = {}
+        self._fragment_hits = 0
+        self._fragment_rebuilds = 0
+
+    def _cached(self, name: str, signature: tuple, build: Callable[[], T]) -> T:
+        """Return the cached fragment if its signature is unchanged, else rebuild it."""
+        entry = self._fragments.get(name)
+        if entry is not None and entry[0] == signature:
+            self._fragment_hits += 1
+            return entry[1]
+        value = build()
+        self._fragments[name] = (signature, value)
+        self._fragment_rebuilds += 1
+        return value
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Prompt fragment cache counters: hits and rebuilds."""
+        return {"hits": self._fragment_hits, "rebuilds": self._fragment_rebuilds}
 
     def build_system_prompt(self, skill_names: list[str] | None = None) -> str:
         """
@@ -70,13 +119,21 @@ class ContextBuilder:
             parts.append(self._get_onboarding_instructions())
 
         # Memory context
-        memory = self.memory.get_memory_context()
+        memory = self._cached(
+            "memory",
+            _stat_signature([self.memory.memory_file]),
+            self.memory.get_memory_context,
+        )
         if memory:
             parts.append(f"# Memory\n\n{memory}")
 
         # Skills v2 (XML format) - PONER AL INICIO para que el agente las vea
         if self.v2_skill_loader:
-            v2_skills = self.v2_skill_loader.format_for_prompt()
+            v2_skills = self._cached(
+                "v2_skills",
+                self._skills_signature(self.v2_skill_loader.skills_dir),
+                self.v2_skill_loader.format_for_prompt,
+            )
             if v2_skills:
                 # Add a VERY prominent header with simple rules
                 skills_with_header = f"""# 🚨 IMPORTANT - USE SKILLS FIRST 🚨
@@ -96,33 +153,59 @@ If skill not installed → install it first, then use
                 parts.insert(0, skills_with_header)  # Insert at beginning
         else:
             # Legacy skills format
-            # Skills - progressive loading
-            # 1. Always-loaded skills: include full content
-            always_skills = self.skills.get_always_skills()
-            if always_skills:
-                always_content = self.skills.load_skills_for_context(always_skills)
-                if always_content:
-                    parts.append(f"# Active Skills\n\n{always_content}")
-
-            # 2. Available skills: only show summary (agent uses read_file to load)
-            skills_summary = self.skills.build_skills_summary()
-            if skills_summary:
-                parts.append(f"""# Skills
+            parts.extend(
+                self._cached(
+                    "skills",
+                    self._skills_signature(
+                        self.skills.workspace_skills, self.skills.builtin_skills
+                    ),
+                    self._build_legacy_skills,
+                )
+            )
+
+        return "\n\n---\n\n".join(parts)
+
+    def _build_legacy_skills(self) -> list[str]:
+        """Build the legacy skills sections (progressive loading)."""
+        parts = []
+        # 1. Always-loaded skills: include full content
+        always_skills = self.skills.get_always_skills()
+        if always_skills:
+            always_content = self.skills.load_skills_for_context(always_skills)
+            if always_content:
+                parts.append(f"# Active Skills\n\n{always_content}")
+
+        # 2. Available skills: only show summary (agent uses read_file to load)
+        skills_summary = self.skills.build_skills_summary()
+        if skills_summary:
+            parts.append(f"""# Skills
 
 The following skills extend your capabilities. To use a skill, read its SKILL.md file using the read_file tool.
 Skills with available="false" need dependencies installed first - you can try installing them with apt/brew.
 
 {skills_summary}""")
+        return parts
 
-        return "\n\n---\n\n".join(parts)
+    def _skills_signature(self, *dirs: Path | None) -> tuple:
+        """Signature of the SKILL.md files under the given skill directories."""
+        files = sorted(
+            skill_file for d in dirs if d and d.exists() for skill_file in d.glob("**/SKILL.md")
+        )
+        refresh = int(time.monotonic() // self.SKILLS_REFRESH_SECONDS)
+        return (refresh, tuple(files), _stat_signature(files))
 
-    def _get_identity(self, neutral: bool = False) -> str:
-        """Get the core identity section."""
-        import time as _time
+    @staticmethod
+    def _current_time() -> str:
         from datetime import datetime
 
         now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
-        tz = _time.strftime("%Z") or "UTC"
+        tz = time.strftime("%Z") or "UTC"
+        return f"## Current Time\n{now} ({tz})"
+
+    def _get_identity(self, neutral: bool = False) -> str:
+        """Get the core identity section."""
+        # In prompt cache mode the time goes in the trailing message (see build_messages)
+        current_time = "" if self.prompt_cache else f"{self._current_time()}\n\n"
         workspace_path = str(self.workspace.expanduser().resolve())
         system = platform.system()
         runtime = f"{'macOS' if system == 'Darwin' else system} {platform.machine()}, Python {platform.python_version()}"
@@ -146,10 +229,7 @@ You have access to tools that allow you to:
 - Send messages to users on chat channels
 - Spawn subagents for complex background tasks
 
-## Current Time
-{now} ({tz})
-
-## Web Search Tip
+{current_time}## Web Search Tip
 When searching the web for current events, recent sports, news, or time-sensitive topics, include the current date in your search query to get relevant results.
 
 ## Runtime
@@ -225,15 +305,23 @@ NEVER assume location without asking. This applies to weather, distances, local
 
     def _load_profile(self) -> dict[str, Any]:
         """Load profile.json, return empty dict if not exists."""
+        return self._cached("profile", _stat_signature([self._profile_path]), self._read_profile)
+
+    def _read_profile(self) -> dict[str, Any]:
         if not self._profile_path.exists():
             return {}
         try:
-            return json.loads(self._profile_path.read_text())
+            profile = json.loads(self._profile_path.read_text())
         except (json.JSONDecodeError, Exception):
             return {}
+        return profile if isinstance(profile, dict) else {}
 
     def _load_bootstrap_files(self) -> str:
         """Load all bootstrap files from workspace."""
+        paths = [self.workspace / filename for filename in self.BOOTSTRAP_FILES]
+        return self._cached("bootstrap", _stat_signature(paths), self._read_bootstrap_files)
+
+    def _read_bootstrap_files(self) -> str:
         parts = []
 
         for filename in self.BOOTSTRAP_FILES:
@@ -244,7 +332,7 @@ NEVER assume location without asking. This applies to weather, distances, local
 
         return "\n\n".join(parts) if parts else ""
 
-    def build_messages(
+    async def build_messages(
         self,
         history: list[dict[str, Any]],
         current_message: str,
@@ -272,32 +360,41 @@ NEVER assume location without asking. This applies to weather, distances, local
         # System prompt
         system_prompt = self.build_system_prompt(skill_names)
 
-        # Add semantic memory context if available
-        if self.semantic_memory and self.semantic_memory.is_available:
-            episodic_context = self._build_episodic_context(current_message)
-            if episodic_context:
-                system_prompt += episodic_context
-
+        # Per-turn context: time, semantic memory (recalled off the event loop), session
+        volatile = []
+        if self.prompt_cache:
+            volatile.append(self._current_time())
+        episodic_context = await self._build_episodic_context(current_message)
+        if episodic_context:
+            volatile.append(episodic_context.strip())
         if channel and chat_id:
-            system_prompt += f"\n\n## Current Session\nChannel: {channel}\nChat ID: {chat_id}"
+            volatile.append(f"## Current Session\nChannel: {channel}\nChat ID: {chat_id}")
+
+        if not self.prompt_cache and volatile:
+            system_prompt += "\n\n" + "\n\n".join(volatile)
         messages.append({"role": "system", "content": system_prompt})
 
         # History
         messages.extend(history)
 
         # Current message (with optional image attachments)
+        if self.prompt_cache and volatile:
+            context = "<context>\n" + "\n\n".join(volatile) + "\n</context>"
+            current_message = f"{context}\n\n{current_message}"
         user_content = self._build_user_content(current_message, media)
         messages.append({"role": "user", "content": user_content})
 
         return messages
 
-    def _build_episodic_context(self, query: str) -> str | None:
+    async def _build_episodic_context(self, query: str) -> str | None:
         """Build episodic memory context from semantic search."""
-        if not self.semantic_memory or not self.semantic_memory.is_available:
+        if not self.semantic_memory:
             return None
 
         try:
-            results = self.semantic_memory.recall(
+            if not await self.semantic_memory.available():
+                return None
+            results = await self.semantic_memory.recall(
                 query,
                 k=self.semantic_memory.config.max_recall,
                 min_score=self.semantic_memory.config.min_score,
@@ -391,22 +488,12 @@ NEVER assume location without asking. This applies to weather, distances, local
 
     def needs_onboarding(self) -> bool:
         """Check if onboarding is needed from profile.json."""
-        if not self._profile_path.exists():
-            return True
-
-        try:
-            profile = json.loads(self._profile_path.read_text())
-            return profile.get("needs_onboarding", True)
-        except (json.JSONDecodeError, Exception):
-            return True
+        return self._load_profile().get("needs_onboarding", True)
 
     def _get_user_context(self) -> str:
         """Get user context from profile.json for system prompt."""
-        if not self._profile_path.exists():
-            return ""
-
         try:
-            profile = json.loads(self._profile_path.read_text())
+            profile = self._load_profile()
             user_fields = profile.get("user_fields", {})
             bot_name = profile.get("bot_name", "")
 
@@ -0,0 +1,150 @@
+"""Two-tier cache of text embeddings for semantic memory."""
+
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    LRU cache of embeddings keyed by ``(model, sha256(text))``.
+
+    A small in-memory tier sits in front of an ``embedding_cache`` table in the
+    semantic memory database, so repeated texts (greetings, heartbeat prompts,
+    re-saved memories) skip model inference across restarts. The table is
+    pruned to ``max_disk`` rows, least recently used first.
+    """
+
+    def __init__(
+        self,
+        db: sqlite3.Connection,
+        model: str,
+        max_memory: int = 1024,
+        max_disk: int = 50_000,
+    ):
+        self._db = db
+        self.model = model
+        self.max_memory = max_memory
+        self.max_disk = max_disk
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._init_db()
+        (self._disk_rows,) = self._db.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
+
+    def _init_db(self) -> None:
+        """Initialize SQLite schema."""
+        with self._db:
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    model TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (model, hash)
+                )
+                """
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used "
+                "ON embedding_cache(last_used)"
+            )
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: list[str]) -> list[np.ndarray | None]:
+        """Look up embeddings, returning None for texts found in neither tier."""
+        result: list[np.ndarray | None] = [None] * len(texts)
+        pending: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            h = self._hash(text)
+            vec = self._memory.get(h)
+            if vec is not None:
+                self._memory.move_to_end(h)
+                result[i] = vec
+                self._memory_hits += 1
+            else:
+                pending.setdefault(h, []).append(i)
+
+        if pending:
+            now = time.time()
+            hashes = list(pending)
+            # Stay below SQLite's host parameter limit
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    "SELECT hash, vector FROM embedding_cache "
+                    f"WHERE model = ? AND hash IN ({placeholders})",
+                    (self.model, *chunk),
+                ).fetchall()
+                if not rows:
+                    continue
+                with self._db:
+                    self._db.executemany(
+                        "UPDATE embedding_cache SET last_used = ? WHERE model = ? AND hash = ?",
+                        [(now, self.model, h) for h, _ in rows],
+                    )
+                for h, blob in rows:
+                    vec = np.frombuffer(blob, dtype=np.float32)
+                    self._remember(h, vec)
+                    for i in pending.pop(h):
+                        result[i] = vec
+                        self._disk_hits += 1
+
+        self._misses += sum(len(indices) for indices in pending.values())
+        return result
+
+    def put_many(self, texts: list[str], vectors: np.ndarray) -> None:
+        """Store embeddings in both tiers."""
+        now = time.time()
+        rows = []
+        for text, vec in zip(texts, vectors):
+            h = self._hash(text)
+            vec = np.ascontiguousarray(vec, dtype=np.float32)
+            self._remember(h, vec)
+            rows.append((self.model, h, vec.tobytes(), now))
+
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (model, hash, vector, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._disk_rows += len(rows)
+            if self._disk_rows > self.max_disk:
+                self._db.execute(
+                    "DELETE FROM embedding_cache WHERE rowid IN "
+                    "(SELECT rowid FROM embedding_cache ORDER BY last_used LIMIT ?)",
+                    (self._disk_rows - self.max_disk,),
+                )
+                (self._disk_rows,) = self._db.execute(
+                    "SELECT COUNT(*) FROM embedding_cache"
+                ).fetchone()
+
+    def _remember(self, h: str, vec: np.ndarray) -> None:
+        self._memory[h] = vec
+        self._memory.move_to_end(h)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Cache counters: hits per tier, misses, hit rate and entries per tier."""
+        hits = self._memory_hits + self._disk_hits
+        lookups = hits + self._misses
+        return {
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": self._disk_rows,
+        }
@@ -8,7 +8,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Awaitable, Callable
 
 if TYPE_CHECKING:
-    from banabot.config.schema import ExecToolConfig, SemanticMemoryConfig, WebSearchConfig
+    from banabot.agent.semantic_memory import AsyncSemanticMemory
+    from banabot.config.schema import (
+        ExecToolConfig,
+        SemanticMemoryConfig,
+        WebCacheConfig,
+        WebFetchConfig,
+        WebSearchConfig,
+    )
     from banabot.cron.service import CronService
 
 import json_repair
@@ -16,18 +23,21 @@ from loguru import logger
 
 from banabot.agent.context import ContextBuilder
 from banabot.agent.memory import MemoryStore
+from banabot.agent.streaming import ReplyStream
 from banabot.agent.subagent import SubagentManager
 from banabot.agent.tools.cron import CronTool
 from banabot.agent.tools.filesystem import EditFileTool, ListDirTool, ReadFileTool, WriteFileTool
+from banabot.agent.tools.http_pool import HttpPool, get_http_pool
 from banabot.agent.tools.message import MessageTool
 from banabot.agent.tools.profile import ProfileTool
 from banabot.agent.tools.registry import ToolRegistry
 from banabot.agent.tools.shell import ExecTool
 from banabot.agent.tools.spawn import SpawnTool
 from banabot.agent.tools.web import WebFetchTool, WebSearchTool
+from banabot.agent.tools.web_cache import WebCache
 from banabot.bus.events import InboundMessage, OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.providers.base import LLMProvider
+from banabot.providers.base import LLMProvider, LLMResponse
 from banabot.session.manager import Session, SessionManager
 from banabot.v2.skills.skill_loader import SkillLoader
 
@@ -62,8 +72,23 @@ class AgentLoop:
         mcp_servers: dict | None = None,
         timezone: str = "America/Mexico_City",
         semantic_memory_config: "SemanticMemoryConfig | None" = None,
+        max_concurrent_sessions: int = 4,
+        prompt_cache: bool = True,
+        max_parallel_tools: int = 4,
+        max_tools_per_turn: int = 0,
+        http_pool: HttpPool | None = None,
+        web_cache_config: "WebCacheConfig | None" = None,
+        web_fetch_config: "WebFetchConfig | None" = None,
+        stream: bool = True,
+        stream_interval: float = 1.0,
     ):
-        from banabot.config.schema import ExecToolConfig, SemanticMemoryConfig, WebSearchConfig
+        from banabot.config.schema import (
+            ExecToolConfig,
+            SemanticMemoryConfig,
+            WebCacheConfig,
+            WebFetchConfig,
+            WebSearchConfig,
+        )
 
         self.bus = bus
         self.provider = provider
@@ -78,14 +103,29 @@ class AgentLoop:
         self.cron_service = cron_service
         self.restrict_to_workspace = restrict_to_workspace
         self.timezone = timezone
+        self.max_parallel_tools = max_parallel_tools
+        self.max_tools_per_turn = max_tools_per_turn
+        self.stream = stream
+        self.stream_interval = stream_interval
+        self.http_pool = http_pool or get_http_pool()
+        self.web_cache_config = web_cache_config or WebCacheConfig()
+        self.web_fetch_config = web_fetch_config or WebFetchConfig()
+        self.web_cache: WebCache | None = None
+        if self.web_cache_config.enabled:
+            self.web_cache = WebCache(
+                workspace,
+                max_entries=self.web_cache_config.max_entries,
+                memory_entries=self.web_cache_config.memory_entries,
+            )
         self.semantic_memory_config = semantic_memory_config or SemanticMemoryConfig()
 
+        self.semantic_memory: "AsyncSemanticMemory | None" = None
         if self.semantic_memory_config.enabled:
-            from banabot.agent.semantic_memory import SemanticMemoryStore
+            from banabot.agent.semantic_memory import AsyncSemanticMemory, SemanticMemoryStore
 
-            self.semantic_memory = SemanticMemoryStore(workspace, self.semantic_memory_config)
-        else:
-            self.semantic_memory = None
+            self.semantic_memory = AsyncSemanticMemory(
+                SemanticMemoryStore(workspace, self.semantic_memory_config)
+            )
 
         # Skill loader v2 (XML format) - init BEFORE context
         self.skill_loader = SkillLoader(workspace / "skills")
@@ -93,7 +133,8 @@ class AgentLoop:
         self.context = ContextBuilder(
             workspace,
             v2_skill_loader=self.skill_loader,
-            semantic_memory=self.semantic_memory if hasattr(self, "semantic_memory") else None,
+            semantic_memory=self.semantic_memory,
+            prompt_cache=prompt_cache,
         )
         self.sessions = session_manager or SessionManager(workspace)
 
@@ -108,9 +149,32 @@ class AgentLoop:
             web_search_config=web_search_config,
             exec_config=self.exec_config,
             restrict_to_workspace=restrict_to_workspace,
+            max_parallel_tools=max_parallel_tools,
+            http_pool=self.http_pool,
+            web_cache=self.web_cache,
+            web_cache_config=self.web_cache_config,
+            web_fetch_config=self.web_fetch_config,
         )
 
         self._running = False
+        self._run_task: asyncio.Task | None = None
+        # Per-session lanes: messages of one session run in order, different
+        # sessions run in parallel up to max_concurrent_sessions.
+        self._lanes: dict[str, asyncio.Queue[InboundMessage]] = {}
+        self._lane_tasks: set[asyncio.Task] = set()
+        self._concurrency = asyncio.Semaphore(max(1, max_concurrent_sessions))
+        # Only take a few messages ahead from the bus, so its fair scheduling
+        # and shedding decide what runs next instead of unbounded lanes.
+        self._intake_limit = 2 * max(1, max_concurrent_sessions)
+        self._pending = 0
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._usage = {
+            "requests": 0,
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "completion_tokens": 0,
+        }
         self._mcp_servers = mcp_servers or {}
         self._mcp_stack: AsyncExitStack | None = None
         self._mcp_connected = False
@@ -135,8 +199,23 @@ class AgentLoop:
         )
 
         # Web tools
-        self.tools.register(WebSearchTool(config=self.web_search_config))
-        self.tools.register(WebFetchTool())
+        self.tools.register(
+            WebSearchTool(
+                config=self.web_search_config,
+                http=self.http_pool,
+                cache=self.web_cache,
+                cache_ttl=self.web_cache_config.search_ttl,
+            )
+        )
+        self.tools.register(
+            WebFetchTool(
+                max_chars=self.web_fetch_config.max_chars,
+                max_bytes=self.web_fetch_config.max_bytes,
+                http=self.http_pool,
+                cache=self.web_cache,
+                cache_ttl=self.web_cache_config.fetch_ttl,
+            )
+        )
 
         # Message tool
         message_tool = MessageTool(send_callback=self.bus.publish_outbound)
@@ -158,7 +237,7 @@ class AgentLoop:
         # Weather tool (wttr.in + Open-Meteo)
         from banabot.agent.tools.weather import WeatherTool
 
-        self.tools.register(WeatherTool())
+        self.tools.register(WeatherTool(http=self.http_pool))
 
         # Skill tools (v2 - XML format)
         from banabot.agent.tools.clawhub_install import ClawHubInstallTool
@@ -229,10 +308,76 @@ class AgentLoop:
 
         return ", ".join(_fmt(tc) for tc in tool_calls)
 
+    def _record_usage(self, usage: dict[str, int]) -> None:
+        """Accumulate token usage, including prompt tokens served from the provider cache."""
+        if not usage:
+            return
+        self._usage["requests"] += 1
+        for key in ("prompt_tokens", "cached_tokens", "completion_tokens"):
+            self._usage[key] += usage.get(key) or 0
+        logger.debug(
+            f"LLM usage: {usage} (prompt cache hit rate {self.usage_stats['cache_hit_rate']:.0%})"
+        )
+
+    @property
+    def usage_stats(self) -> dict[str, float]:
+        """Token totals since start and the share of prompt tokens read from cache."""
+        prompt = self._usage["prompt_tokens"]
+        hit_rate = self._usage["cached_tokens"] / prompt if prompt else 0.0
+        return {**self._usage, "cache_hit_rate": round(hit_rate, 3)}
+
+    def _select_tools(self, query: str) -> list[str] | None:
+        """
+        Tool names to offer for a whole turn, or None for every tool.
+
+        Built-in tools are always offered; ``max_tools_per_turn`` bounds the
+        MCP tools only, which are ranked against ``query`` (the raw inbound
+        text, without the ``<context>`` block the prompt adds in front of it).
+        The choice is made once per turn so the tool block (and the cached
+        prompt prefix) stays the same across iterations.
+        """
+        names = self.tools.tool_names
+        mcp = [n for n in names if n.startswith("mcp_")]
+        if self.max_tools_per_turn <= 0 or len(mcp) <= self.max_tools_per_turn:
+            return None
+        builtins = [n for n in names if not n.startswith("mcp_")]
+        return self.tools.select(query, len(builtins) + self.max_tools_per_turn, pinned=builtins)
+
+    def _tool_definitions(self, selected: list[str] | None, tools_used: list[str]) -> list[dict]:
+        """Tool definitions for the next LLM call: the turn's selection plus tools already called."""
+        if selected is None:
+            return self.tools.get_definitions()
+        return self.tools.get_definitions(selected + tools_used)
+
+    async def _call_llm(
+        self, messages: list[dict], tools: list[dict], stream: ReplyStream | None
+    ) -> LLMResponse:
+        """Call the provider, streaming the answer through ``stream`` when given."""
+        kwargs = dict(
+            messages=messages,
+            tools=tools,
+            model=self.model,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
+        if stream is None:
+            return await self.provider.chat(**kwargs)
+
+        stream.begin()
+        response = LLMResponse(content=None, finish_reason="error")
+        async for chunk in self.provider.chat_stream(**kwargs):
+            if chunk.delta:
+                await stream.feed(chunk.delta)
+            if chunk.response is not None:
+                response = chunk.response
+        return response
+
     async def _run_agent_loop(
         self,
         initial_messages: list[dict],
         on_progress: Callable[[str], Awaitable[None]] | None = None,
+        stream: ReplyStream | None = None,
+        query: str = "",
     ) -> tuple[str | None, list[str]]:
         """
         Run the agent iteration loop.
@@ -240,6 +385,8 @@ class AgentLoop:
         Args:
             initial_messages: Starting messages for the LLM conversation.
             on_progress: Optional callback to push intermediate content to the user.
+            stream: Optional reply stream that publishes answers as they are generated.
+            query: The user's message as received, used to pick the turn's tools.
 
         Returns:
             Tuple of (final_content, list_of_tools_used).
@@ -248,21 +395,22 @@ class AgentLoop:
         iteration = 0
         final_content = None
         tools_used: list[str] = []
+        selected_tools = self._select_tools(query)
 
         while iteration < self.max_iterations:
             iteration += 1
 
-            response = await self.provider.chat(
-                messages=messages,
-                tools=self.tools.get_definitions(),
-                model=self.model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
+            response = await self._call_llm(
+                messages, self._tool_definitions(selected_tools, tools_used), stream
             )
+            self._record_usage(response.usage)
 
             if response.has_tool_calls:
-                if on_progress:
-                    clean = self._strip_think(response.content)
+                clean = self._strip_think(response.content)
+                if stream and stream.active:
+                    # Settle the streamed text instead of posting it again
+                    await stream.finish(clean or self._tool_hint(response.tool_calls))
+                elif on_progress:
                     await on_progress(clean or self._tool_hint(response.tool_calls))
 
                 tool_call_dicts = [
@@ -284,7 +432,11 @@ class AgentLoop:
                     tools_used.append(tool_call.name)
                     args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
                     logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
+                results = await self.tools.execute_many(
+                    [(tc.name, tc.arguments) for tc in response.tool_calls],
+                    max_concurrency=self.max_parallel_tools,
+                )
+                for tool_call, result in zip(response.tool_calls, results):
                     messages = self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
@@ -295,29 +447,98 @@ class AgentLoop:
         return final_content, tools_used
 
     async def run(self) -> None:
-        """Run the agent loop, processing messages from the bus."""
+        """
+        Run the agent loop, dispatching messages from the bus to per-session lanes.
+
+        Returns when ``stop`` is called or the bus is closed.
+        """
         self._running = True
-        await self._connect_mcp()
-        logger.info("Agent loop started")
+        self._run_task = asyncio.current_task()
+        try:
+            await self._connect_mcp()
+            if self.semantic_memory:
+                # Load the embedding model now rather than on the first message
+                self.semantic_memory.warm_up().add_done_callback(self._on_semantic_memory_ready)
+            logger.info("Agent loop started")
+
+            async for msg in self.bus.inbound_messages():
+                self._dispatch(msg)
+                await self._has_room.wait()
+        except asyncio.CancelledError:
+            if self._running:
+                raise  # cancelled from outside, not by stop()
+        finally:
+            self._run_task = None
 
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(self.bus.consume_inbound(), timeout=1.0)
+    @staticmethod
+    def _lane_key(msg: InboundMessage) -> str:
+        """Session key a message is serialized on (system messages use their origin)."""
+        if msg.channel == "system":
+            return msg.chat_id if ":" in msg.chat_id else f"cli:{msg.chat_id}"
+        return msg.session_key
+
+    def _dispatch(self, msg: InboundMessage) -> None:
+        """Queue a message on its session lane, starting a lane worker if needed."""
+        key = self._lane_key(msg)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = asyncio.Queue()
+            task = asyncio.create_task(self._drain_lane(key, lane))
+            self._lane_tasks.add(task)
+            task.add_done_callback(self._lane_tasks.discard)
+        lane.put_nowait(msg)
+        self._pending += 1
+        if self._pending >= self._intake_limit:
+            self._has_room.clear()
+
+    async def _drain_lane(self, key: str, lane: asyncio.Queue[InboundMessage]) -> None:
+        """Process one session's messages in arrival order, then retire the lane."""
+        try:
+            while True:
                 try:
-                    response = await self._process_message(msg)
-                    if response:
-                        await self.bus.publish_outbound(response)
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-                    await self.bus.publish_outbound(
-                        OutboundMessage(
-                            channel=msg.channel,
-                            chat_id=msg.chat_id,
-                            content=f"Sorry, I encountered an error: {str(e)}",
-                        )
-                    )
-            except asyncio.TimeoutError:
-                continue
+                    msg = lane.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    async with self._concurrency:
+                        with self.sessions.in_use(key):
+                            await self._handle_inbound(msg)
+                finally:
+                    self._pending -= 1
+                    self._has_room.set()
+        finally:
+            if self._lanes.get(key) is lane:
+                del self._lanes[key]
+
+    async def _handle_inbound(self, msg: InboundMessage) -> None:
+        """Process one bus message and publish the response (or an error reply)."""
+        try:
+            response = await self._process_message(msg)
+            if response:
+                await self.bus.publish_outbound(response)
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            await self.bus.publish_outbound(
+                OutboundMessage(
+                    channel=msg.channel,
+                    chat_id=msg.chat_id,
+                    content=f"Sorry, I encountered an error: {str(e)}",
+                )
+            )
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of sessions with queued or in-flight messages."""
+        return len(self._lanes)
+
+    @staticmethod
+    def _on_semantic_memory_ready(future: asyncio.Future) -> None:
+        if future.cancelled():
+            return
+        if future.exception() or not future.result():
+            logger.warning("Semantic memory unavailable (is fastembed installed?)")
+        else:
+            logger.info("Semantic memory ready")
 
     async def close_mcp(self) -> None:
         """Close MCP connections."""
@@ -329,8 +550,10 @@ class AgentLoop:
             self._mcp_stack = None
 
     def stop(self) -> None:
-        """Stop the agent loop."""
+        """Stop the agent loop (interrupts ``run`` while it waits for messages)."""
         self._running = False
+        if self._run_task:
+            self._run_task.cancel()
         logger.info("Agent loop stopping")
 
     async def _process_message(
@@ -402,7 +625,7 @@ class AgentLoop:
 
         if len(session.messages) > self.memory_window:
             # Run pre-compaction memory flush before consolidation
-            if self.semantic_memory and self.semantic_memory.is_available:
+            if self.semantic_memory and await self.semantic_memory.available():
                 from banabot.agent.memory_flush import run_memory_flush
 
                 asyncio.create_task(
@@ -415,11 +638,11 @@ class AgentLoop:
                     )
                 )
 
-            asyncio.create_task(self._consolidate_memory(session))
+            self._consolidate_in_background(session)
 
         self._set_tool_context(msg.channel, msg.chat_id)
 
-        initial_messages = self.context.build_messages(
+        initial_messages = await self.context.build_messages(
             history=session.get_history(max_messages=self.memory_window),
             current_message=msg.content,
             media=msg.media if msg.media else None,
@@ -437,9 +660,18 @@ class AgentLoop:
                 )
             )
 
+        # Only bus replies are streamed; process_direct callers use the returned text
+        stream = None
+        if self.stream and session_key is None and on_progress is None:
+            stream = ReplyStream(
+                self.bus, msg.channel, msg.chat_id, msg.metadata, self.stream_interval
+            )
+
         final_content, tools_used = await self._run_agent_loop(
             initial_messages,
             on_progress=on_progress or _bus_progress,
+            stream=stream,
+            query=msg.content,
         )
 
         if final_content is None:
@@ -459,8 +691,8 @@ class AgentLoop:
             channel=msg.channel,
             chat_id=msg.chat_id,
             content=final_content,
-            metadata=msg.metadata
-            or {},  # Pass through for channel-specific needs (e.g. Slack thread_ts)
+            # Pass through for channel-specific needs (e.g. Slack thread_ts)
+            metadata=stream.final_metadata() if stream else msg.metadata or {},
         )
 
     async def _process_system_message(self, msg: InboundMessage) -> OutboundMessage | None:
@@ -485,13 +717,13 @@ class AgentLoop:
         session_key = f"{origin_channel}:{origin_chat_id}"
         session = self.sessions.get_or_create(session_key)
         self._set_tool_context(origin_channel, origin_chat_id)
-        initial_messages = self.context.build_messages(
+        initial_messages = await self.context.build_messages(
             history=session.get_history(max_messages=self.memory_window),
             current_message=msg.content,
             channel=origin_channel,
             chat_id=origin_chat_id,
         )
-        final_content, _ = await self._run_agent_loop(initial_messages)
+        final_content, _ = await self._run_agent_loop(initial_messages, query=msg.content)
 
         if final_content is None:
             final_content = "Background task completed."
@@ -504,6 +736,12 @@ class AgentLoop:
             channel=origin_channel, chat_id=origin_chat_id, content=final_content
         )
 
+    def _consolidate_in_background(self, session: Session) -> None:
+        """Consolidate a cached session in a task, keeping it pinned in the cache meanwhile."""
+        self.sessions.pin(session.key)
+        task = asyncio.create_task(self._consolidate_memory(session))
+        task.add_done_callback(lambda _: self.sessions.unpin(session.key))
+
     async def _consolidate_memory(self, session, archive_all: bool = False) -> None:
         """Consolidate old messages into MEMORY.md + HISTORY.md.
 
@@ -618,35 +856,48 @@ Respond with ONLY valid JSON, no markdown fences."""
                 )
                 return
 
+            semantic = (
+                self.semantic_memory
+                if self.semantic_memory and await self.semantic_memory.available()
+                else None
+            )
+            memories: list[dict] = []
             if entry := result.get("history_entry"):
                 memory.append_history(str(entry))
-                if self.semantic_memory and self.semantic_memory.is_available:
-                    self.semantic_memory.save(
-                        content=str(entry),
-                        type="summary",
-                        expires_days=self.semantic_memory_config.summary_ttl_days,
-                    )
+                memories.append(
+                    {
+                        "content": str(entry),
+                        "type": "summary",
+                        "expires_days": self.semantic_memory_config.summary_ttl_days,
+                    }
+                )
             if update := result.get("memory_update"):
                 if str(update) != current_memory:
                     memory.write_long_term(str(update))
-                    if self.semantic_memory and self.semantic_memory.is_available:
+                    if semantic:
                         facts = self._extract_facts_from_memory(str(update), current_memory or "")
-                        for fact in facts:
-                            self.semantic_memory.save(
-                                content=fact,
-                                type="fact",
-                                expires_days=self.semantic_memory_config.fact_ttl_days,
-                            )
-
-            if episodes := result.get("episodes", []):
-                if self.semantic_memory and self.semantic_memory.is_available:
-                    for ep in episodes:
-                        self.semantic_memory.save(
-                            content=str(ep),
-                            type="episodic",
-                            expires_days=self.semantic_memory_config.episodic_ttl_days,
+                        memories.extend(
+                            {
+                                "content": fact,
+                                "type": "fact",
+                                "expires_days": self.semantic_memory_config.fact_ttl_days,
+                            }
+                            for fact in facts
                         )
 
+            for ep in result.get("episodes", []) or []:
+                memories.append(
+                    {
+                        "content": str(ep),
+                        "type": "episodic",
+                        "expires_days": self.semantic_memory_config.episodic_ttl_days,
+                    }
+                )
+
+            if semantic and memories:
+                # One embedding batch and one index write for the whole consolidation
+                await semantic.save_many(memories)
+
             if archive_all:
                 session.last_consolidated = 0
             else:
@@ -1,19 +1,35 @@
 """Semantic memory store with vector embeddings."""
 
+import asyncio
 import math
 import re
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
 
 if TYPE_CHECKING:
+    from banabot.agent.embedding_cache import EmbeddingCache
     from banabot.config.schema import SemanticMemoryConfig
 
 from banabot.utils.helpers import ensure_dir
 
 
+def _locked(method: Callable) -> Callable:
+    """Serialize a SemanticMemoryStore method on the store's lock."""
+
+    @wraps(method)
+    def wrapper(self: "SemanticMemoryStore", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class SemanticMemoryStore:
     """Semantic memory with fastembed + usearch vector store."""
 
@@ -33,6 +49,9 @@ class SemanticMemoryStore:
         self._model = None
         self._index = None
         self._db = None
+        self._cache: "EmbeddingCache | None" = None
+        # Calls may come from the AsyncSemanticMemory worker thread and from sync callers
+        self._lock = threading.RLock()
 
     @property
     def is_available(self) -> bool:
@@ -44,7 +63,12 @@ class SemanticMemoryStore:
         """Lazy load model, index, and DB."""
         if self._model is not None:
             return
+        with self._lock:
+            if self._model is None:
+                self._load()
 
+    def _load(self) -> None:
+        """Load the embedding model, vector index and database."""
         try:
             from fastembed import TextEmbedding
             from usearch.index import Index
@@ -57,6 +81,11 @@ class SemanticMemoryStore:
             if self.index_path.exists():
                 self._index.load(str(self.index_path))
             self._init_db()
+            assert self._db is not None
+            (count,) = self._db.execute("SELECT COUNT(*) FROM memory_meta").fetchone()
+            if count != len(self._index):
+                # Missing or stale index file: restore it from the stored vectors
+                self._rebuild_index()
         except Exception:
             self._model = None
             self._index = None
@@ -65,7 +94,7 @@ class SemanticMemoryStore:
         """Initialize SQLite schema."""
         import sqlite3
 
-        self._db = sqlite3.connect(str(self.db_path))
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self._db.execute(
             """
             CREATE TABLE IF NOT EXISTS memory_meta (
@@ -76,12 +105,26 @@ class SemanticMemoryStore:
                 expires_at TEXT,
                 source_path TEXT,
                 line_start INTEGER,
-                line_end INTEGER
+                line_end INTEGER,
+                embedding BLOB
             )
             """
         )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(memory_meta)")}
+        if "embedding" not in columns:
+            # Databases created before vectors were stored; backfilled on the next rebuild
+            self._db.execute("ALTER TABLE memory_meta ADD COLUMN embedding BLOB")
         self._db.commit()
 
+        from banabot.agent.embedding_cache import EmbeddingCache
+
+        self._cache = EmbeddingCache(
+            self._db,
+            self.config.model,
+            max_memory=self.config.embedding_cache_size,
+            max_disk=self.config.embedding_cache_max_entries,
+        )
+
     def save(
         self,
         content: str,
@@ -92,36 +135,118 @@ class SemanticMemoryStore:
         line_end: int | None = None,
     ) -> int | None:
         """Save an episode with embedding."""
+        return self.save_many(
+            [
+                {
+                    "content": content,
+                    "type": type,
+                    "expires_days": expires_days,
+                    "source_path": source_path,
+                    "line_start": line_start,
+                    "line_end": line_end,
+                }
+            ]
+        )[0]
+
+    @_locked
+    def save_many(self, items: list[dict]) -> list[int | None]:
+        """
+        Save several memories in one batch.
+
+        Each item takes the keyword arguments of ``save`` ("content" is required).
+        Contents already stored, or repeated within the batch, are not inserted
+        again. New contents are embedded in a single model call, inserted in one
+        transaction, and the index is written to disk once.
+
+        Returns:
+            Memory ids in the order of ``items`` (None if unavailable).
+        """
+        if not items:
+            return []
         self._ensure_ready()
         if not self.is_available:
-            return None
+            return [None] * len(items)
         assert self._db is not None
-        assert self._model is not None
         assert self._index is not None
 
-        existing = self._db.execute(
-            "SELECT id FROM memory_meta WHERE content = ?", (content,)
-        ).fetchone()
-        if existing:
-            return existing[0]
-
-        expires = datetime.now().isoformat() if expires_days else None
-
-        cursor = self._db.execute(
-            """INSERT INTO memory_meta (content, type, expires_at, source_path, line_start, line_end)
-            VALUES (?, ?, ?, ?, ?, ?)""",
-            (content, type, expires, source_path, line_start, line_end),
-        )
-        mid = cursor.lastrowid
-        self._db.commit()
-
-        vec = np.array(list(self._model.embed([content]))[0], dtype=np.float32)
-        assert mid is not None
-        self._index.add(mid, vec)
-        self._index.save(str(self.index_path))
+        contents = [str(item["content"]) for item in items]
+        ids = self._find_existing(list(dict.fromkeys(contents)))
+
+        new: dict[str, dict] = {}
+        for content, item in zip(contents, items):
+            if content not in ids and content not in new:
+                new[content] = item
+
+        if new:
+            # Embed before inserting so a model failure leaves no rows without vectors
+            vectors = self._embed(list(new))
+            with self._db:
+                for (content, item), vec in zip(new.items(), vectors):
+                    expires_days = item.get("expires_days", 30)
+                    expires = (
+                        (datetime.now() + timedelta(days=expires_days)).isoformat()
+                        if expires_days
+                        else None
+                    )
+                    cursor = self._db.execute(
+                        """INSERT INTO memory_meta
+                        (content, type, expires_at, source_path, line_start, line_end, embedding)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                        (
+                            content,
+                            item.get("type", "episodic"),
+                            expires,
+                            item.get("source_path"),
+                            item.get("line_start"),
+                            item.get("line_end"),
+                            vec.tobytes(),
+                        ),
+                    )
+                    assert cursor.lastrowid is not None
+                    ids[content] = cursor.lastrowid
+
+            keys = np.array([ids[content] for content in new], dtype=np.uint64)
+            self._index.add(keys, vectors)
+            self._index.save(str(self.index_path))
+
+        return [ids[content] for content in contents]
+
+    def _find_existing(self, contents: list[str]) -> dict[str, int]:
+        """Map already stored contents to their memory ids."""
+        assert self._db is not None
+        found: dict[str, int] = {}
+        # Stay below SQLite's host parameter limit
+        for i in range(0, len(contents), 500):
+            chunk = contents[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._db.execute(
+                f"SELECT content, id FROM memory_meta WHERE content IN ({placeholders}) ORDER BY id",
+                chunk,
+            ).fetchall()
+            for content, mid in rows:
+                found.setdefault(content, mid)
+        return found
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts (one float32 row each), running the model only for cache misses."""
+        assert self._model is not None
+        cached = self._cache.get_many(texts) if self._cache else [None] * len(texts)
+        missing = list(dict.fromkeys(t for t, vec in zip(texts, cached) if vec is None))
+        if missing:
+            embedded = np.array(list(self._model.embed(missing)), dtype=np.float32)
+            embedded = embedded.reshape(len(missing), -1)
+            if self._cache:
+                self._cache.put_many(missing, embedded)
+            fresh = dict(zip(missing, embedded))
+            cached = [fresh[t] if vec is None else vec for t, vec in zip(texts, cached)]
+        return np.stack(cached)
 
-        return mid
+    @property
+    def cache_stats(self) -> dict[str, float]:
+        """Embedding cache counters (empty until the store is loaded)."""
+        return self._cache.stats if self._cache else {}
 
+    @_locked
     def recall(
         self,
         query: str,
@@ -141,8 +266,12 @@ class SemanticMemoryStore:
         if self.config.query_expansion:
             query = self._expand_query(query)
 
-        q_vec = np.array(list(self._model.embed([query]))[0], dtype=np.float32)
-        matches = self._index.search(q_vec, k)
+        use_mmr_val = use_mmr if use_mmr is not None else self.config.mmr_enabled
+        # MMR re-ranks a wider candidate pool down to k
+        pool = max(k, self.config.mmr_candidates) if use_mmr_val else k
+
+        q_vec = self._embed([query])[0]
+        matches = self._index.search(q_vec, pool)
 
         if not len(matches):
             return []
@@ -152,13 +281,14 @@ class SemanticMemoryStore:
 
         placeholders = ",".join("?" * len(ids))
         rows = self._db.execute(
-            f"""SELECT id, content, type, created_at, source_path, line_start, line_end
+            f"""SELECT id, content, type, created_at, source_path, line_start, line_end, embedding
             FROM memory_meta WHERE id IN ({placeholders})""",
             ids,
         ).fetchall()
 
         row_map = {r[0]: r for r in rows}
         results = []
+        vectors: dict[str, np.ndarray] = {}
 
         for i in ids:
             if i not in row_map:
@@ -169,6 +299,9 @@ class SemanticMemoryStore:
             if score < min_score:
                 continue
 
+            if r[7] is not None:
+                vectors[r[1]] = np.frombuffer(r[7], dtype=np.float32)
+
             citation = ""
             if r[4]:
                 start, end = r[5], r[6]
@@ -192,11 +325,10 @@ class SemanticMemoryStore:
         if use_decay and self.config.temporal_decay_half_life_days > 0:
             results = self._apply_temporal_decay(results)
 
-        use_mmr_val = use_mmr if use_mmr is not None else self.config.mmr_enabled
         if use_mmr_val:
-            results = self._apply_mmr(results, k=k)
+            results = self._apply_mmr(results, k=k, vectors=vectors)
 
-        return results
+        return results[:k]
 
     def _expand_query(self, query: str) -> str:
         """Expand query with keywords for better recall."""
@@ -318,34 +450,65 @@ class SemanticMemoryStore:
         results.sort(key=lambda x: x["score"], reverse=True)
         return results
 
-    def _apply_mmr(self, results: list[dict], k: int = 5) -> list[dict]:
-        """Apply Maximal Marginal Relevance for diversification."""
+    def _apply_mmr(
+        self,
+        results: list[dict],
+        k: int = 5,
+        vectors: dict[str, np.ndarray] | None = None,
+    ) -> list[dict]:
+        """
+        Apply Maximal Marginal Relevance for diversification.
+
+        Similarity between memories is the cosine of their stored embeddings
+        (``vectors`` maps content to vector). If any candidate has no stored
+        vector, word-overlap similarity is used instead.
+        """
         if len(results) <= k:
             return results
+        if not vectors or any(r["content"] not in vectors for r in results):
+            return self._apply_mmr_jaccard(results, k=k)
 
         lambda_param = self.config.mmr_lambda
-        selected = []
-        remaining = list(results)
-
-        def tokenize(text: str) -> set:
-            return set(re.findall(r"\b\w+\b", text.lower()))
+        ranked = sorted(results, key=lambda x: x["score"], reverse=True)
+        emb = np.stack([vectors[r["content"]] for r in ranked])
+        emb = emb / np.maximum(np.linalg.norm(emb, axis=1, keepdims=True), 1e-12)
+        sim = emb @ emb.T
+        relevance = lambda_param * np.array([r["score"] for r in ranked])
+
+        selected = [0]
+        max_sim = sim[0].copy()
+        available = np.ones(len(ranked), dtype=bool)
+        available[0] = False
+
+        while len(selected) < k:
+            mmr = relevance - (1 - lambda_param) * max_sim
+            mmr[~available] = -np.inf
+            best = int(np.argmax(mmr))
+            selected.append(best)
+            available[best] = False
+            np.maximum(max_sim, sim[best], out=max_sim)
+
+        return [ranked[i] for i in selected]
+
+    def _apply_mmr_jaccard(self, results: list[dict], k: int = 5) -> list[dict]:
+        """MMR using word-overlap (Jaccard) similarity, for memories without vectors."""
+        lambda_param = self.config.mmr_lambda
+        remaining = sorted(results, key=lambda x: x["score"], reverse=True)
+        tokens = {id(r): set(re.findall(r"\b\w+\b", r["content"].lower())) for r in remaining}
 
         def jaccard(a: set, b: set) -> float:
             if not a or not b:
                 return 0.0
             return len(a & b) / len(a | b)
 
-        remaining.sort(key=lambda x: x["score"], reverse=True)
-        selected.append(remaining.pop(0))
-
+        selected = [remaining.pop(0)]
         while len(selected) < k and remaining:
             best_idx = -1
             best_mmr = float("-inf")
-            sel_tokens = [tokenize(s["content"]) for s in selected]
 
             for i, item in enumerate(remaining):
                 relevance = item["score"]
-                max_sim = max(jaccard(tokenize(item["content"]), st) for st in sel_tokens)
+                max_sim = max(jaccard(tokens[id(item)], tokens[id(s)]) for s in selected)
                 mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
 
                 if mmr > best_mmr:
@@ -359,44 +522,65 @@ class SemanticMemoryStore:
 
         return selected
 
+    @_locked
     def purge_expired(self) -> int:
-        """Delete expired episodes and rebuild index."""
+        """Delete expired memories and drop their vectors from the index."""
         self._ensure_ready()
         if not self.is_available:
             return 0
         assert self._db is not None
+        assert self._index is not None
 
         now = datetime.now().isoformat()
-        cursor = self._db.execute(
-            "DELETE FROM memory_meta WHERE expires_at IS NOT NULL AND expires_at < ?", (now,)
-        )
-        self._db.commit()
-        deleted = cursor.rowcount
-
-        if deleted > 0:
-            self._rebuild_index()
-        return deleted
+        with self._db:
+            ids = [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT id FROM memory_meta WHERE expires_at IS NOT NULL AND expires_at < ?",
+                    (now,),
+                )
+            ]
+            self._db.executemany("DELETE FROM memory_meta WHERE id = ?", [(i,) for i in ids])
+
+        if ids:
+            self._index.remove(np.array(ids, dtype=np.uint64))
+            self._index.save(str(self.index_path))
+        return len(ids)
 
     def _rebuild_index(self) -> None:
-        """Rebuild vector index from active SQLite records."""
+        """
+        Rebuild the vector index from the vectors stored in SQLite.
+
+        Rows saved before vectors were stored are embedded in one batch and
+        their vectors written back, so the model only runs for them once.
+        """
         assert self._db is not None
-        assert self._model is not None
-        rows = self._db.execute("SELECT id, content FROM memory_meta").fetchall()
+        rows = self._db.execute("SELECT id, content, embedding FROM memory_meta").fetchall()
 
-        self._index = None
-        if self.index_path.exists():
-            self.index_path.unlink()
+        vectors: dict[int, np.ndarray] = {
+            row_id: np.frombuffer(blob, dtype=np.float32)
+            for row_id, _, blob in rows
+            if blob is not None
+        }
+        missing = [(row_id, content) for row_id, content, blob in rows if blob is None]
+        if missing:
+            embedded = self._embed([content for _, content in missing])
+            with self._db:
+                self._db.executemany(
+                    "UPDATE memory_meta SET embedding = ? WHERE id = ?",
+                    [(vec.tobytes(), row_id) for (row_id, _), vec in zip(missing, embedded)],
+                )
+            vectors.update((row_id, vec) for (row_id, _), vec in zip(missing, embedded))
 
         from usearch.index import Index
 
         self._index = Index(ndim=self.config.dimensions, metric="cos", dtype="f32")
-
-        for row_id, content in rows:
-            vec = np.array(list(self._model.embed([content]))[0], dtype=np.float32)
-            self._index.add(row_id, vec)
-
+        if vectors:
+            keys = np.fromiter(vectors, dtype=np.uint64, count=len(vectors))
+            self._index.add(keys, np.stack(list(vectors.values())))
         self._index.save(str(self.index_path))
 
+    @_locked
     def stats(self) -> dict:
         """Get memory count by type."""
         self._ensure_ready()
@@ -410,3 +594,63 @@ class SemanticMemoryStore:
             if type_name in stats:
                 stats[type_name] = count
         return stats
+
+
+class AsyncSemanticMemory:
+    """
+    Async facade that runs SemanticMemoryStore work on a dedicated thread.
+
+    Model loading, embedding and index searches are CPU-bound and would
+    otherwise stall the event loop (and every channel with it). At most
+    ``max_pending`` calls are queued or running at once; further callers wait
+    for a slot instead of piling up work.
+    """
+
+    def __init__(self, store: SemanticMemoryStore, max_pending: int = 16):
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="semantic-memory")
+        self._slots = asyncio.Semaphore(max_pending)
+        self._warm_up: asyncio.Future | None = None
+
+    @property
+    def config(self) -> "SemanticMemoryConfig":
+        return self.store.config
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the model is loaded (never blocks)."""
+        return self.store._model is not None
+
+    async def _run(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    def warm_up(self) -> asyncio.Future:
+        """Start loading the model in the background; resolves to availability."""
+        if self._warm_up is None:
+            loop = asyncio.get_running_loop()
+            self._warm_up = loop.run_in_executor(self._executor, lambda: self.store.is_available)
+        return self._warm_up
+
+    async def available(self) -> bool:
+        """Whether semantic memory can be used, loading the model if needed."""
+        if self.is_ready:
+            return True
+        return await self._run(lambda: self.store.is_available)
+
+    async def recall(self, query: str, **kwargs: Any) -> list[dict]:
+        """Async ``SemanticMemoryStore.recall``."""
+        return await self._run(self.store.recall, query, **kwargs)
+
+    async def save_many(self, items: list[dict]) -> list[int | None]:
+        """Async ``SemanticMemoryStore.save_many``."""
+        return await self._run(self.store.save_many, items)
+
+    async def purge_expired(self) -> int:
+        """Async ``SemanticMemoryStore.purge_expired``."""
+        return await self._run(self.store.purge_expired)
+
+    def close(self) -> None:
+        """Stop the worker thread once queued work has finished."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,92 @@
+"""Incremental delivery of streamed LLM replies through the bus."""
+
+import re
+import time
+import uuid
+from typing import Any
+
+from banabot.bus.events import STREAM_KEY, OutboundMessage
+from banabot.bus.queue import MessageBus
+
+# Complete <think> blocks and one still being generated at the end of the text
+_THINK_RE = re.compile(r"<think>[\s\S]*?(?:</think>|$)")
+
+
+class ReplyStream:
+    """
+    Publishes an answer while the LLM generates it, as edit-in-place updates.
+
+    Every LLM call starts a new stream (``begin``). Partial updates carry the
+    whole text so far and are throttled to one per ``interval`` seconds;
+    channels that support edits post the first one and edit it afterwards,
+    other channels drop them and only deliver the final message.
+    """
+
+    def __init__(
+        self,
+        bus: MessageBus,
+        channel: str,
+        chat_id: str,
+        metadata: dict[str, Any] | None = None,
+        interval: float = 1.0,
+    ):
+        self.bus = bus
+        self.channel = channel
+        self.chat_id = chat_id
+        self.interval = interval
+        self._metadata = metadata or {}
+        self.stream_id: str | None = None
+        self._text = ""
+        self._last_sent = 0.0
+        self._sent = False
+
+    def begin(self) -> None:
+        """Start a new stream for the next LLM call."""
+        self.stream_id = str(uuid.uuid4())[:8]
+        self._text = ""
+        self._last_sent = 0.0
+        self._sent = False
+
+    @property
+    def active(self) -> bool:
+        """Whether the current stream has published anything yet."""
+        return self._sent
+
+    async def feed(self, delta: str) -> None:
+        """Add a text delta, publishing an update if the throttle interval has passed."""
+        self._text += delta
+        now = time.monotonic()
+        if now - self._last_sent < self.interval:
+            return
+        text = _THINK_RE.sub("", self._text).strip()
+        if not text:
+            return
+        self._last_sent = now
+        self._sent = True
+        await self.bus.publish_outbound(
+            OutboundMessage(
+                channel=self.channel,
+                chat_id=self.chat_id,
+                content=text,
+                metadata=self._stream_metadata(partial=True),
+            )
+        )
+
+    def final_metadata(self) -> dict[str, Any]:
+        """Metadata for the final message, linking it to the streamed one if any."""
+        return self._stream_metadata(partial=False) if self._sent else self._metadata
+
+    async def finish(self, content: str) -> None:
+        """Publish the final text of the current stream (tool-call turns)."""
+        await self.bus.publish_outbound(
+            OutboundMessage(
+                channel=self.channel,
+                chat_id=self.chat_id,
+                content=content,
+                metadata=self.final_metadata(),
+            )
+        )
+        self._sent = False
+
+    def _stream_metadata(self, partial: bool) -> dict[str, Any]:
+        return {**self._metadata, STREAM_KEY: {"id": self.stream_id, "partial": partial}}
@@ -7,14 +7,21 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from banabot.config.schema import ExecToolConfig, WebSearchConfig
+    from banabot.config.schema import (
+        ExecToolConfig,
+        WebCacheConfig,
+        WebFetchConfig,
+        WebSearchConfig,
+    )
 
 from loguru import logger
 
 from banabot.agent.tools.filesystem import EditFileTool, ListDirTool, ReadFileTool, WriteFileTool
+from banabot.agent.tools.http_pool import HttpPool
 from banabot.agent.tools.registry import ToolRegistry
 from banabot.agent.tools.shell import ExecTool
 from banabot.agent.tools.web import WebFetchTool, WebSearchTool
+from banabot.agent.tools.web_cache import WebCache
 from banabot.bus.events import InboundMessage
 from banabot.bus.queue import MessageBus
 from banabot.providers.base import LLMProvider
@@ -40,8 +47,18 @@ class SubagentManager:
         web_search_config: "WebSearchConfig | None" = None,
         exec_config: "ExecToolConfig | None" = None,
         restrict_to_workspace: bool = False,
+        max_parallel_tools: int = 4,
+        http_pool: HttpPool | None = None,
+        web_cache: WebCache | None = None,
+        web_cache_config: "WebCacheConfig | None" = None,
+        web_fetch_config: "WebFetchConfig | None" = None,
     ):
-        from banabot.config.schema import ExecToolConfig, WebSearchConfig
+        from banabot.config.schema import (
+            ExecToolConfig,
+            WebCacheConfig,
+            WebFetchConfig,
+            WebSearchConfig,
+        )
 
         self.provider = provider
         self.workspace = workspace
@@ -52,6 +69,11 @@ class SubagentManager:
         self.web_search_config = web_search_config or WebSearchConfig()
         self.exec_config = exec_config or ExecToolConfig()
         self.restrict_to_workspace = restrict_to_workspace
+        self.max_parallel_tools = max_parallel_tools
+        self.http_pool = http_pool
+        self.web_cache = web_cache
+        self.web_cache_config = web_cache_config or WebCacheConfig()
+        self.web_fetch_config = web_fetch_config or WebFetchConfig()
         self._running_tasks: dict[str, asyncio.Task[None]] = {}
 
     async def spawn(
@@ -116,8 +138,23 @@ class SubagentManager:
                     restrict_to_workspace=self.restrict_to_workspace,
                 )
             )
-            tools.register(WebSearchTool(config=self.web_search_config))
-            tools.register(WebFetchTool())
+            tools.register(
+                WebSearchTool(
+                    config=self.web_search_config,
+                    http=self.http_pool,
+                    cache=self.web_cache,
+                    cache_ttl=self.web_cache_config.search_ttl,
+                )
+            )
+            tools.register(
+                WebFetchTool(
+                    max_chars=self.web_fetch_config.max_chars,
+                    max_bytes=self.web_fetch_config.max_bytes,
+                    http=self.http_pool,
+                    cache=self.web_cache,
+                    cache_ttl=self.web_cache_config.fetch_ttl,
+                )
+            )
 
             # Build messages with subagent-specific prompt
             system_prompt = self._build_subagent_prompt(task)
@@ -169,7 +206,11 @@ class SubagentManager:
                         logger.debug(
                             f"Subagent [{task_id}] executing: {tool_call.name} with arguments: {args_str}"
                         )
-                        result = await tools.execute(tool_call.name, tool_call.arguments)
+                    results = await tools.execute_many(
+                        [(tc.name, tc.arguments) for tc in response.tool_calls],
+                        max_concurrency=self.max_parallel_tools,
+                    )
+                    for tool_call, result in zip(response.tool_calls, results):
                         messages.append(
                             {
                                 "role": "tool",
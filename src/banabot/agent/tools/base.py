@@ -1,8 +1,11 @@
 """Base class for agent tools."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
+Validator = Callable[[Any, str], list[str]]
+
 
 class Tool(ABC):
     """
@@ -10,8 +13,13 @@ class Tool(ABC):
 
     Tools are capabilities that the agent can use to interact with
     the environment, such as reading files, executing commands, etc.
+
+    Tools that only read state (files, the web) set ``parallel_safe`` so
+    several calls from one LLM turn can run concurrently.
     """
 
+    parallel_safe: bool = False
+
     _TYPE_MAP = {
         "string": str,
         "integer": int,
@@ -54,43 +62,14 @@ class Tool(ABC):
 
     def validate_params(self, params: dict[str, Any]) -> list[str]:
         """Validate tool parameters against JSON schema. Returns error list (empty if valid)."""
-        schema = self.parameters or {}
-        if schema.get("type", "object") != "object":
-            raise ValueError(f"Schema must be object type, got {schema.get('type')!r}")
-        return self._validate(params, {**schema, "type": "object"}, "")
-
-    def _validate(self, val: Any, schema: dict[str, Any], path: str) -> list[str]:
-        t, label = schema.get("type"), path or "parameter"
-        if t in self._TYPE_MAP and not isinstance(val, self._TYPE_MAP[t]):
-            return [f"{label} should be {t}"]
-
-        errors = []
-        if "enum" in schema and val not in schema["enum"]:
-            errors.append(f"{label} must be one of {schema['enum']}")
-        if t in ("integer", "number"):
-            if "minimum" in schema and val < schema["minimum"]:
-                errors.append(f"{label} must be >= {schema['minimum']}")
-            if "maximum" in schema and val > schema["maximum"]:
-                errors.append(f"{label} must be <= {schema['maximum']}")
-        if t == "string":
-            if "minLength" in schema and len(val) < schema["minLength"]:
-                errors.append(f"{label} must be at least {schema['minLength']} chars")
-            if "maxLength" in schema and len(val) > schema["maxLength"]:
-                errors.append(f"{label} must be at most {schema['maxLength']} chars")
-        if t == "object":
-            props = schema.get("properties", {})
-            for k in schema.get("required", []):
-                if k not in val:
-                    errors.append(f"missing required {path + '.' + k if path else k}")
-            for k, v in val.items():
-                if k in props:
-                    errors.extend(self._validate(v, props[k], path + "." + k if path else k))
-        if t == "array" and "items" in schema:
-            for i, item in enumerate(val):
-                errors.extend(
-                    self._validate(item, schema["items"], f"{path}[{i}]" if path else f"[{i}]")
-                )
-        return errors
+        # Compiled on first use; tools whose schema can change must reset _validator
+        validator = self.__dict__.get("_validator")
+        if validator is None:
+            schema = self.parameters or {}
+            if schema.get("type", "object") != "object":
+                raise ValueError(f"Schema must be object type, got {schema.get('type')!r}")
+            validator = self._validator = _compile_schema({**schema, "type": "object"})
+        return validator(params, "")
 
     def to_schema(self) -> dict[str, Any]:
         """Convert tool to OpenAI function schema format."""
@@ -102,3 +81,70 @@ class Tool(ABC):
                 "parameters": self.parameters,
             },
         }
+
+
+def _compile_schema(schema: dict[str, Any]) -> Validator:
+    """
+    Compile a JSON schema into a validator ``(value, path) -> errors``.
+
+    The schema is walked once here; the returned closure only runs the checks
+    that apply, and formats messages only for values that fail them.
+    """
+    t = schema.get("type")
+    expected = Tool._TYPE_MAP.get(t)
+    checks: list[Callable[[Any, str, list[str]], None]] = []
+
+    def bound(key: str, fail: Callable[[Any, Any], bool], message: str) -> None:
+        if key in schema:
+            limit = schema[key]
+            suffix = message.format(limit)
+
+            def check(val: Any, path: str, errors: list[str]) -> None:
+                if fail(val, limit):
+                    errors.append((path or "parameter") + suffix)
+
+            checks.append(check)
+
+    if "enum" in schema:
+        bound("enum", lambda v, enum: v not in enum, " must be one of {}")
+    if t in ("integer", "number"):
+        bound("minimum", lambda v, m: v < m, " must be >= {}")
+        bound("maximum", lambda v, m: v > m, " must be <= {}")
+    if t == "string":
+        bound("minLength", lambda v, m: len(v) < m, " must be at least {} chars")
+        bound("maxLength", lambda v, m: len(v) > m, " must be at most {} chars")
+    if t == "object":
+        required = schema.get("required", [])
+        props = {k: _compile_schema(v) for k, v in schema.get("properties", {}).items()}
+
+        def check_object(val: dict, path: str, errors: list[str]) -> None:
+            for k in required:
+                if k not in val:
+                    errors.append(f"missing required {path + '.' + k if path else k}")
+            if props:
+                for k, v in val.items():
+                    sub = props.get(k)
+                    if sub is not None:
+                        errors.extend(sub(v, path + "." + k if path else k))
+
+        checks.append(check_object)
+    if t == "array" and "items" in schema:
+        items = _compile_schema(schema["items"])
+
+        def check_array(val: list, path: str, errors: list[str]) -> None:
+            for i, item in enumerate(val):
+                errors.extend(items(item, f"{path}[{i}]" if path else f"[{i}]"))
+
+        checks.append(check_array)
+
+    type_error = f" should be {t}"
+
+    def validate(val: Any, path: str) -> list[str]:
+        if expected is not None and not isinstance(val, expected):
+            return [(path or "parameter") + type_error]
+        errors: list[str] = []
+        for check in checks:
+            check(val, path, errors)
+        return errors
+
+    return validate
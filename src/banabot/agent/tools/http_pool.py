@@ -0,0 +1,134 @@
+"""Shared HTTP connection pool for network tools."""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+import httpx
+from loguru import logger
+
+if TYPE_CHECKING:
+    from banabot.config.schema import HttpPoolConfig
+
+MAX_REDIRECTS = 5
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that frees a per-host slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Caps in-flight requests per host; a slot is held until the body is closed."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host: int):
+        self._transport = transport
+        self._per_host = per_host
+        self._slots: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self._per_host)
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slots[request.url.host]
+        await slot.acquire()
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                slot.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:  # Body already buffered
+            release()
+            return response
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpPool:
+    """
+    Process-wide pooled ``httpx.AsyncClient`` for web, search and weather tools.
+
+    Connections are kept alive and reused across tool calls (HTTP/2 when the
+    ``h2`` package is installed), with a global and a per-host connection cap.
+    The client is created lazily on first use and bound to the running event
+    loop; a different loop gets a fresh client.
+    """
+
+    def __init__(self, config: "HttpPoolConfig | None" = None):
+        from banabot.config.schema import HttpPoolConfig
+
+        self.config = config or HttpPoolConfig()
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        cfg = self.config
+        http2 = cfg.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.debug("h2 not installed, HTTP pool falls back to HTTP/1.1")
+                http2 = False
+        limits = httpx.Limits(
+            max_connections=cfg.max_connections,
+            max_keepalive_connections=cfg.max_keepalive_connections,
+            keepalive_expiry=cfg.keepalive_expiry,
+        )
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        return httpx.AsyncClient(
+            transport=_PerHostLimitTransport(transport, max(1, cfg.max_connections_per_host)),
+            timeout=httpx.Timeout(cfg.timeout, connect=cfg.connect_timeout),
+            max_redirects=MAX_REDIRECTS,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections (called at shutdown)."""
+        client, self._client = self._client, None
+        if client is not None and not client.is_closed and self._loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._loop = None
+
+
+_shared: HttpPool | None = None
+
+
+def get_http_pool() -> HttpPool:
+    """Get the default process-wide pool (used when a tool is given none)."""
+    global _shared
+    if _shared is None:
+        _shared = HttpPool()
+    return _shared
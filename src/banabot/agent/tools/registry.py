@@ -1,27 +1,55 @@
 """Tool registry for dynamic tool management."""
 
+import asyncio
+import re
+from collections.abc import Iterable
 from typing import Any
 
 from banabot.agent.tools.base import Tool
 
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _keywords(text: str) -> set[str]:
+    return {w for w in _WORD_RE.findall(text.lower()) if len(w) > 2}
+
 
 class ToolRegistry:
     """
     Registry for agent tools.
 
-    Allows dynamic registration and execution of tools.
+    Allows dynamic registration and execution of tools. Tool definitions are
+    built once and reused until the set of tools changes; ``version`` is
+    bumped on every register/unregister.
     """
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self.version = 0
+        self._definitions: dict[str, dict[str, Any]] | None = None
+        self._definitions_list: list[dict[str, Any]] | None = None
+        self._keywords: dict[str, set[str]] = {}
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._invalidate()
 
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
-        self._tools.pop(name, None)
+        if self._tools.pop(name, None) is not None:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self.version += 1
+        self._definitions = None
+        self._definitions_list = None
+        self._keywords = {}
+
+    def _compiled(self) -> dict[str, dict[str, Any]]:
+        if self._definitions is None:
+            self._definitions = {name: tool.to_schema() for name, tool in self._tools.items()}
+        return self._definitions
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -31,9 +59,59 @@ class ToolRegistry:
         """Check if a tool is registered."""
         return name in self._tools
 
-    def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+    def get_definitions(self, names: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        """
+        Get tool definitions in OpenAI format.
+
+        The full list is cached and shared between calls, so callers must not
+        mutate it.
+
+        Args:
+            names: Optional subset of tool names to include (registration
+                order is kept; unknown names are ignored).
+
+        Returns:
+            List of tool definitions.
+        """
+        definitions = self._compiled()
+        if names is None:
+            if self._definitions_list is None:
+                self._definitions_list = list(definitions.values())
+            return self._definitions_list
+        wanted = set(names)
+        return [schema for name, schema in definitions.items() if name in wanted]
+
+    def select(self, query: str, limit: int, pinned: Iterable[str] = ()) -> list[str]:
+        """
+        Pick the tool names to offer for one turn.
+
+        Pinned tools are always included; the remaining slots go to the tools
+        whose name and description share the most words with ``query``.
+
+        Args:
+            query: Text to match against (usually the user's message).
+            limit: Maximum number of tools; 0 or less means all tools.
+            pinned: Names that must be included even beyond ``limit``.
+
+        Returns:
+            Selected tool names in registration order.
+        """
+        if limit <= 0 or len(self._tools) <= limit:
+            return list(self._tools)
+        if not self._keywords:
+            self._keywords = {
+                name: _keywords(f"{name.replace('_', ' ')} {tool.description}")
+                for name, tool in self._tools.items()
+            }
+        chosen = {name for name in pinned if name in self._tools}
+        words = _keywords(query)
+        ranked = sorted(
+            (name for name in self._tools if name not in chosen),
+            key=lambda name: len(words & self._keywords[name]),
+            reverse=True,
+        )
+        chosen.update(ranked[: max(0, limit - len(chosen))])
+        return [name for name in self._tools if name in chosen]
 
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """
@@ -61,6 +139,44 @@ class ToolRegistry:
         except Exception as e:
             return f"Error executing {name}: {str(e)}"
 
+    async def execute_many(
+        self, calls: list[tuple[str, dict[str, Any]]], max_concurrency: int = 4
+    ) -> list[str]:
+        """
+        Execute several tool calls, running parallel-safe ones concurrently.
+
+        Consecutive parallel-safe calls are gathered (at most ``max_concurrency``
+        at a time); any other call runs alone, after everything before it and
+        before everything after it. Results are returned in call order.
+
+        Args:
+            calls: (name, params) pairs in the order the model emitted them.
+            max_concurrency: Limit on concurrently running calls.
+
+        Returns:
+            One result string per call.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _run(name: str, params: dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.execute(name, params)
+
+        results: list[str] = []
+        batch: list[tuple[str, dict[str, Any]]] = []
+        for name, params in calls:
+            tool = self._tools.get(name)
+            if tool is not None and tool.parallel_safe:
+                batch.append((name, params))
+                continue
+            if batch:
+                results.extend(await asyncio.gather(*(_run(n, p) for n, p in batch)))
+                batch = []
+            results.append(await self.execute(name, params))
+        if batch:
+            results.extend(await asyncio.gather(*(_run(n, p) for n, p in batch)))
+        return results
+
     @property
     def tool_names(self) -> list[str]:
         """Get list of registered tool names."""
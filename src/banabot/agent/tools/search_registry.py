@@ -15,6 +15,8 @@ from dataclasses import dataclass
 
 import httpx
 
+from banabot.agent.tools.http_pool import HttpPool, get_http_pool
+
 
 @dataclass(frozen=True)
 class SearchProviderSpec:
@@ -68,9 +70,64 @@ def find_search_provider(name: str) -> SearchProviderSpec | None:
     return None
 
 
+# Seconds added to a provider's score per unit of error rate
+ERROR_PENALTY = 10.0
+
+
+@dataclass
+class ProviderHealth:
+    """Smoothed (EWMA) latency and error rate of one search provider."""
+
+    latency: float = 0.0
+    error_rate: float = 0.0
+    samples: int = 0
+
+    def record(self, latency: float, error: bool, alpha: float = 0.3) -> None:
+        if self.samples == 0:
+            self.latency, self.error_rate = latency, float(error)
+        else:
+            self.latency += alpha * (latency - self.latency)
+            self.error_rate += alpha * (float(error) - self.error_rate)
+        self.samples += 1
+
+    @property
+    def score(self) -> float:
+        """Expected cost in seconds; lower is better."""
+        return self.latency + self.error_rate * ERROR_PENALTY
+
+
+_HEALTH: dict[str, ProviderHealth] = {}
+
+
+def provider_health(name: str) -> ProviderHealth:
+    """Process-wide health record for a provider (shared by all search tools)."""
+    return _HEALTH.setdefault(name, ProviderHealth())
+
+
+def rank_providers(names: list[str], prior: float = 1.0) -> list[str]:
+    """
+    Order providers by health score, best first.
+
+    Providers without samples count as ``prior`` seconds, and ties keep the
+    given order, so the configured default leads until it proves slow.
+    """
+
+    def score(name: str) -> float:
+        health = _HEALTH.get(name)
+        return health.score if health and health.samples else prior
+
+    return sorted(names, key=score)
+
+
 class SearchProviderBackend(ABC):
     """Abstract base class for search provider backends."""
 
+    http: HttpPool | None = None
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return (self.http or get_http_pool()).client
+
     @abstractmethod
     async def search(self, query: str, count: int) -> str: ...
 
@@ -120,14 +177,13 @@ class BraveSearchBackend(SearchProviderBackend):
             )
 
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": count},
-                    headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
-                    timeout=10.0,
-                )
-                r.raise_for_status()
+            r = await self._client.get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={"q": query, "count": count},
+                headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
+                timeout=10.0,
+            )
+            r.raise_for_status()
 
             results = r.json().get("web", {}).get("results", [])
             if not results:
@@ -154,18 +210,17 @@ class TavilyBackend(SearchProviderBackend):
             return "Error: Tavily requires an API key. Get one at https://tavily.com/"
 
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": self.api_key,
-                        "query": query,
-                        "max_results": count,
-                        "include_answer": False,
-                    },
-                    timeout=10.0,
-                )
-                r.raise_for_status()
+            r = await self._client.post(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": self.api_key,
+                    "query": query,
+                    "max_results": count,
+                    "include_answer": False,
+                },
+                timeout=10.0,
+            )
+            r.raise_for_status()
 
             data = r.json()
             results = data.get("results", [])
@@ -193,14 +248,13 @@ class SerperBackend(SearchProviderBackend):
             return "Error: Serper requires an API key. Get one at https://serper.dev/"
 
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    "https://google.serper.dev/search",
-                    params={"q": query, "num": count},
-                    headers={"X-API-KEY": self.api_key},
-                    timeout=10.0,
-                )
-                r.raise_for_status()
+            r = await self._client.get(
+                "https://google.serper.dev/search",
+                params={"q": query, "num": count},
+                headers={"X-API-KEY": self.api_key},
+                timeout=10.0,
+            )
+            r.raise_for_status()
 
             data = r.json()
             results = data.get("organic", [])
@@ -230,13 +284,12 @@ class SearXNGBackend(SearchProviderBackend):
             )
 
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    f"{self.api_base.rstrip('/')}/search",
-                    params={"q": query, "format": "json"},
-                    timeout=10.0,
-                )
-                r.raise_for_status()
+            r = await self._client.get(
+                f"{self.api_base.rstrip('/')}/search",
+                params={"q": query, "format": "json"},
+                timeout=10.0,
+            )
+            r.raise_for_status()
 
             data = r.json()
             results = data.get("results", [])
@@ -257,6 +310,7 @@ def create_search_backend(
     provider_name: str,
     api_key: str = "",
     api_base: str = "",
+    http: HttpPool | None = None,
 ) -> SearchProviderBackend:
     """Create a search backend instance for the given provider."""
     backends = {
@@ -272,8 +326,10 @@ def create_search_backend(
         raise ValueError(f"Unknown search provider: {provider_name}")
 
     if provider_name == "duckduckgo":
-        return backend_class()
+        backend = backend_class()
     elif provider_name == "searxng":
-        return backend_class(api_base=api_base)
+        backend = backend_class(api_base=api_base)
     else:
-        return backend_class(api_key=api_key)
+        backend = backend_class(api_key=api_key)
+    backend.http = http
+    return backend
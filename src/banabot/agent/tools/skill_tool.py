@@ -192,6 +192,8 @@ class SkillReadTool(Tool):
     it can read the full skill content to get detailed instructions.
     """
 
+    parallel_safe = True
+
     def __init__(self, skill_loader: SkillLoader):
         self.loader = skill_loader
 
@@ -3,14 +3,18 @@
 import urllib.parse
 from typing import Any
 
-import httpx
-
 from banabot.agent.tools.base import Tool
+from banabot.agent.tools.http_pool import HttpPool, get_http_pool
 
 
 class WeatherTool(Tool):
     """Get current weather and forecasts using wttr.in or Open-Meteo."""
 
+    parallel_safe = True
+
+    def __init__(self, http: HttpPool | None = None):
+        self.http = http or get_http_pool()
+
     @property
     def name(self) -> str:
         return "weather"
@@ -82,10 +86,9 @@ class WeatherTool(Tool):
         else:  # compact
             url = f"wttr.in/{encoded}?format=%l:+%c+%t+%h+%w&{unit}"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(f"https://{url}")
-            if resp.status_code == 200:
-                return resp.text.strip()
+        resp = await self.http.client.get(f"https://{url}", timeout=10.0)
+        if resp.status_code == 200:
+            return resp.text.strip()
         return None
 
     async def _open_meteo(self, location: str, units: str) -> str:
@@ -93,37 +96,35 @@ class WeatherTool(Tool):
         # First geocode
         geo_url = f"https://geocoding-api.open-meteo.com/v1/search?name={urllib.parse.quote(location)}&count=1"
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            geo_resp = await client.get(geo_url)
-            geo_data = geo_resp.json()
-
-            if not geo_data.get("results"):
-                return f"Location not found: {location}"
-
-            lat = geo_data["results"][0]["latitude"]
-            lon = geo_data["results"][0]["longitude"]
-            name = geo_data["results"][0]["name"]
-
-            # Get weather
-            unit_sys = "celsius" if units == "metric" else "fahrenheit"
-            weather_url = (
-                f"https://api.open-meteo.com/v1/forecast"
-                f"?latitude={lat}&longitude={lon}"
-                f"&current_weather=true"
-                f"&temperature_unit={unit_sys}"
-            )
-
-            weather_resp = await client.get(weather_url)
-            weather = weather_resp.json()["current_weather"]
-
-            temp = weather["temperature"]
-            wind = weather["windspeed"]
-            code = weather["weathercode"]
-            condition = self._weather_code_to_text(code)
-
-            return (
-                f"{name}: {condition}, {temp}°{'C' if units == 'metric' else 'F'}, wind {wind} km/h"
-            )
+        client = self.http.client
+        geo_resp = await client.get(geo_url, timeout=10.0)
+        geo_data = geo_resp.json()
+
+        if not geo_data.get("results"):
+            return f"Location not found: {location}"
+
+        lat = geo_data["results"][0]["latitude"]
+        lon = geo_data["results"][0]["longitude"]
+        name = geo_data["results"][0]["name"]
+
+        # Get weather
+        unit_sys = "celsius" if units == "metric" else "fahrenheit"
+        weather_url = (
+            f"https://api.open-meteo.com/v1/forecast"
+            f"?latitude={lat}&longitude={lon}"
+            f"&current_weather=true"
+            f"&temperature_unit={unit_sys}"
+        )
+
+        weather_resp = await client.get(weather_url, timeout=10.0)
+        weather = weather_resp.json()["current_weather"]
+
+        temp = weather["temperature"]
+        wind = weather["windspeed"]
+        code = weather["weathercode"]
+        condition = self._weather_code_to_text(code)
+
+        return f"{name}: {condition}, {temp}°{'C' if units == 'metric' else 'F'}, wind {wind} km/h"
 
     def _weather_code_to_text(self, code: int) -> str:
         """Convert WMO weather code to text."""
@@ -1,27 +1,48 @@
 """Web tools: web_search and web_fetch."""
 
+import asyncio
 import html
 import json
 import re
+import time
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import httpx
 
 from banabot.agent.tools.base import Tool
+from banabot.agent.tools.http_pool import HttpPool, get_http_pool
+from banabot.agent.tools.web_cache import WebCache, http_ttl, normalize_query
 
 if TYPE_CHECKING:
     from banabot.config.schema import WebSearchConfig
 
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_7_2) AppleWebKit/537.36"
-MAX_REDIRECTS = 5
+
+
+_SCRIPT_RE = re.compile(r"<script[\s\S]*?</script>", re.I)
+_STYLE_RE = re.compile(r"<style[\s\S]*?</style>", re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_LINK_RE = re.compile(r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>([\s\S]*?)</a>', re.I)
+_HEADING_RE = re.compile(r"<h([1-6])[^>]*>([\s\S]*?)</h\1>", re.I)
+_LIST_ITEM_RE = re.compile(r"<li[^>]*>([\s\S]*?)</li>", re.I)
+_BLOCK_END_RE = re.compile(r"</(p|div|section|article)>", re.I)
+_BREAK_RE = re.compile(r"<(br|hr)\s*/?>", re.I)
+
+# Non-text/* types that web_fetch still reads; anything else is rejected before download
+_TEXT_TYPES = (
+    "application/json",
+    "application/xhtml+xml",
+    "application/xml",
+    "application/javascript",
+)
 
 
 def _strip_tags(text: str) -> str:
     """Remove HTML tags and decode entities."""
-    text = re.sub(r"<script[\s\S]*?</script>", "", text, flags=re.I)
-    text = re.sub(r"<style[\s\S]*?</style>", "", text, flags=re.I)
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _SCRIPT_RE.sub("", text)
+    text = _STYLE_RE.sub("", text)
+    text = _TAG_RE.sub("", text)
     return html.unescape(text).strip()
 
 
@@ -31,6 +52,24 @@ def _normalize(text: str) -> str:
     return re.sub(r"\n{3,}", "\n\n", text).strip()
 
 
+def _is_text_content(content_type: str) -> bool:
+    """Whether a Content-Type is worth downloading (missing counts as text)."""
+    mime = content_type.split(";")[0].strip().lower()
+    return (
+        not mime
+        or mime.startswith("text/")
+        or mime in _TEXT_TYPES
+        or mime.endswith(("+json", "+xml"))
+    )
+
+
+def _decode(body: bytes, charset: str | None) -> str:
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
 def _validate_url(url: str) -> tuple[bool, str]:
     """Validate URL: must be http(s) with valid domain."""
     try:
@@ -47,6 +86,8 @@ def _validate_url(url: str) -> tuple[bool, str]:
 class WebSearchTool(Tool):
     """Search the web using configurable search providers."""
 
+    parallel_safe = True
+
     @property
     def name(self) -> str:
         return "web_search"
@@ -71,10 +112,19 @@ class WebSearchTool(Tool):
             "required": ["query"],
         }
 
-    def __init__(self, config: "WebSearchConfig | None" = None):
+    def __init__(
+        self,
+        config: "WebSearchConfig | None" = None,
+        http: HttpPool | None = None,
+        cache: WebCache | None = None,
+        cache_ttl: float = 3600,
+    ):
         from banabot.config.schema import WebSearchConfig
 
         self.config = config or WebSearchConfig()
+        self.http = http or get_http_pool()
+        self.cache = cache
+        self.cache_ttl = cache_ttl
 
     def _get_backend(self, provider_name: str):
         from banabot.agent.tools.search_registry import create_search_backend
@@ -86,6 +136,7 @@ class WebSearchTool(Tool):
             provider_name,
             api_key=provider_cfg.api_key,
             api_base=provider_cfg.api_base,
+            http=self.http,
         )
 
     def _get_providers_to_try(self) -> list[str]:
@@ -98,12 +149,11 @@ class WebSearchTool(Tool):
                 providers.append(spec.name)
         return providers
 
-    async def execute(self, query: str, count: int | None = None, **kwargs: Any) -> str:
-        from banabot.agent.tools.search_registry import find_search_provider
-
-        n = min(max(count or self.config.max_results, 1), 10)
-        errors = []
+    def _available_providers(self) -> list[str]:
+        """Providers that are enabled and configured, in the order to try them."""
+        from banabot.agent.tools.search_registry import find_search_provider, rank_providers
 
+        available = []
         for provider_name in self._get_providers_to_try():
             provider_cfg = getattr(self.config.providers, provider_name, None)
             if not provider_cfg or not provider_cfg.enabled:
@@ -117,18 +167,99 @@ class WebSearchTool(Tool):
                 continue
             if provider_name == "searxng" and not provider_cfg.api_base:
                 continue
+            available.append(provider_name)
 
-            try:
-                backend = self._get_backend(provider_name)
-                result = await backend.search(query, n)  # type: ignore[union-attr]
-                if result.lower().startswith("error"):
-                    errors.append(f"{provider_name}: {result}")
+        if self.config.adaptive_order:
+            return rank_providers(available, prior=self.config.hedge_delay)
+        return available
+
+    async def _search_one(self, provider_name: str, query: str, n: int) -> tuple[bool, str]:
+        """Query one provider, recording its latency and outcome."""
+        from banabot.agent.tools.search_registry import provider_health
+
+        start = time.monotonic()
+        ok = False
+        try:
+            backend = self._get_backend(provider_name)
+            result = await backend.search(query, n)  # type: ignore[union-attr]
+            ok = not result.lower().startswith("error")
+            return ok, result if ok else f"{provider_name}: {result}"
+        except asyncio.CancelledError:
+            # Lost the race: elapsed time is a lower bound on its latency
+            ok = True
+            raise
+        except Exception as e:
+            return False, f"{provider_name}: {str(e)}"
+        finally:
+            provider_health(provider_name).record(time.monotonic() - start, error=not ok)
+
+    async def _search_hedged(
+        self, providers: list[str], query: str, n: int, errors: list[str]
+    ) -> str | None:
+        """
+        Start the first provider and add the next one whenever the hedge delay
+        passes without a result (or right away in race mode, or on failure).
+        The first good result wins and the remaining requests are cancelled.
+        """
+        delay = 0.0 if self.config.strategy == "race" else self.config.hedge_delay
+        queue = list(providers)
+        pending: set[asyncio.Task[tuple[bool, str]]] = set()
+
+        def launch() -> None:
+            name = queue.pop(0)
+            pending.add(asyncio.create_task(self._search_one(name, query, n)))
+
+        launch()
+        try:
+            while pending:
+                while queue and delay <= 0:
+                    launch()
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=delay if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    launch()
                     continue
-                return result
-            except Exception as e:
-                errors.append(f"{provider_name}: {str(e)}")
-                continue
+                for task in done:
+                    pending.discard(task)
+                    ok, result = task.result()
+                    if ok:
+                        return result
+                    errors.append(result)
+                if not pending and queue:
+                    launch()
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
 
+    async def execute(self, query: str, count: int | None = None, **kwargs: Any) -> str:
+        n = min(max(count or self.config.max_results, 1), 10)
+        cache_key = f"{self.config.default_provider}:{n}:{normalize_query(query)}"
+        if self.cache:
+            entry = self.cache.get("search", cache_key)
+            if entry and entry.fresh:
+                return entry.value
+        errors: list[str] = []
+        providers = self._available_providers()
+
+        result = None
+        if providers and self.config.strategy in ("hedge", "race"):
+            result = await self._search_hedged(providers, query, n, errors)
+        else:
+            for provider_name in providers:
+                ok, text = await self._search_one(provider_name, query, n)
+                if ok:
+                    result = text
+                    break
+                errors.append(text)
+
+        if result is not None:
+            if self.cache and self.cache_ttl > 0:
+                self.cache.put("search", cache_key, result, self.cache_ttl)
+            return result
         if errors:
             return "Search failed for all providers:\n" + "\n".join(errors)
         return f"No search provider available for query: {query}"
@@ -137,6 +268,8 @@ class WebSearchTool(Tool):
 class WebFetchTool(Tool):
     """Fetch and extract content from a URL using Readability."""
 
+    parallel_safe = True
+
     @property
     def name(self) -> str:
         return "web_fetch"
@@ -161,8 +294,19 @@ class WebFetchTool(Tool):
             "required": ["url"],
         }
 
-    def __init__(self, max_chars: int = 50000):
+    def __init__(
+        self,
+        max_chars: int = 50000,
+        http: HttpPool | None = None,
+        cache: WebCache | None = None,
+        cache_ttl: float = 900,
+        max_bytes: int = 2_000_000,
+    ):
         self.max_chars = max_chars
+        self.max_bytes = max_bytes
+        self.http = http or get_http_pool()
+        self.cache = cache
+        self.cache_ttl = cache_ttl
 
     async def execute(
         self,
@@ -171,8 +315,6 @@ class WebFetchTool(Tool):
         maxChars: int | None = None,  # noqa: N803
         **kwargs: Any,
     ) -> str:
-        from readability import Document
-
         max_chars = maxChars or self.max_chars
 
         is_valid, error_msg = _validate_url(url)
@@ -180,38 +322,18 @@ class WebFetchTool(Tool):
             return json.dumps({"error": f"URL validation failed: {error_msg}", "url": url})
 
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, max_redirects=MAX_REDIRECTS, timeout=30.0
-            ) as client:
-                r = await client.get(url, headers={"User-Agent": USER_AGENT})
-                r.raise_for_status()
-
-            ctype = r.headers.get("content-type", "")
-
-            if "application/json" in ctype:
-                text, extractor = json.dumps(r.json(), indent=2), "json"
-            elif "text/html" in ctype or r.text[:256].lower().startswith(("<!doctype", "<html")):
-                doc = Document(r.text)
-                content = (
-                    self._to_markdown(doc.summary())
-                    if extractMode == "markdown"
-                    else _strip_tags(doc.summary())
-                )
-                text = f"# {doc.title()}\n\n{content}" if doc.title() else content
-                extractor = "readability"
-            else:
-                text, extractor = r.text, "raw"
-
-            truncated = len(text) > max_chars
-            if truncated:
+            page = await self._fetch(url, extractMode)
+            text = page["text"]
+            truncated = len(text) > max_chars or page.get("partial", False)
+            if len(text) > max_chars:
                 text = text[:max_chars]
 
             return json.dumps(
                 {
                     "url": url,
-                    "finalUrl": str(r.url),
-                    "status": r.status_code,
-                    "extractor": extractor,
+                    "finalUrl": page["finalUrl"],
+                    "status": page["status"],
+                    "extractor": page["extractor"],
                     "truncated": truncated,
                     "length": len(text),
                     "text": text,
@@ -220,22 +342,88 @@ class WebFetchTool(Tool):
         except Exception as e:
             return json.dumps({"error": str(e), "url": url})
 
+    async def _fetch(self, url: str, extract_mode: str) -> dict[str, Any]:
+        """Fetch and extract a page, going through the response cache when set."""
+        cache_key = f"{extract_mode}:{url}"
+        entry = self.cache.get("fetch", cache_key) if self.cache else None
+        if entry and entry.fresh:
+            return entry.value
+
+        headers = {"User-Agent": USER_AGENT}
+        if entry and entry.revalidatable:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        async with self.http.client.stream(
+            "GET", url, headers=headers, follow_redirects=True, timeout=30.0
+        ) as r:
+            if r.status_code == 304 and entry and self.cache:
+                ttl = http_ttl(r.headers, self.cache_ttl) or 0
+                self.cache.refresh("fetch", cache_key, entry, ttl)
+                return entry.value
+            r.raise_for_status()
+
+            ctype = r.headers.get("content-type", "")
+            if not _is_text_content(ctype):
+                raise ValueError(f"Unsupported content type: {ctype.split(';')[0]}")
+            body, partial = await self._read_body(r)
+
+        text = _decode(body, r.charset_encoding)
+        # Readability and the markdown regexes are CPU-bound; keep them off the loop
+        extracted = await asyncio.to_thread(self._extract, text, ctype, extract_mode)
+        page = {"finalUrl": str(r.url), "status": r.status_code, **extracted}
+        if partial:
+            page["partial"] = True
+        if self.cache and (ttl := http_ttl(r.headers, self.cache_ttl)) is not None:
+            self.cache.put(
+                "fetch",
+                cache_key,
+                page,
+                ttl,
+                etag=r.headers.get("etag"),
+                last_modified=r.headers.get("last-modified"),
+            )
+        return page
+
+    async def _read_body(self, r: httpx.Response) -> tuple[bytes, bool]:
+        """Read at most ``max_bytes`` of the body; the flag is set if it was cut."""
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in r.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_bytes:
+                return b"".join(chunks)[: self.max_bytes], True
+        return b"".join(chunks), False
+
+    def _extract(self, text: str, ctype: str, extract_mode: str) -> dict[str, str]:
+        """Turn a body into text: JSON pretty-printed, HTML via Readability."""
+        from readability import Document
+
+        if "application/json" in ctype:
+            try:
+                return {"extractor": "json", "text": json.dumps(json.loads(text), indent=2)}
+            except ValueError:
+                return {"extractor": "raw", "text": text}
+        if "text/html" in ctype or text[:256].lower().startswith(("<!doctype", "<html")):
+            doc = Document(text)
+            content = (
+                self._to_markdown(doc.summary())
+                if extract_mode == "markdown"
+                else _strip_tags(doc.summary())
+            )
+            title = doc.title()
+            return {
+                "extractor": "readability",
+                "text": f"# {title}\n\n{content}" if title else content,
+            }
+        return {"extractor": "raw", "text": text}
+
     def _to_markdown(self, html: str) -> str:
-        text = re.sub(
-            r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>([\s\S]*?)</a>',
-            lambda m: f"[{_strip_tags(m[2])}]({m[1]})",
-            html,
-            flags=re.I,
-        )
-        text = re.sub(
-            r"<h([1-6])[^>]*>([\s\S]*?)</h\1>",
-            lambda m: f"\n{'#' * int(m[1])} {_strip_tags(m[2])}\n",
-            text,
-            flags=re.I,
-        )
-        text = re.sub(
-            r"<li[^>]*>([\s\S]*?)</li>", lambda m: f"\n- {_strip_tags(m[1])}", text, flags=re.I
-        )
-        text = re.sub(r"</(p|div|section|article)>", "\n\n", text, flags=re.I)
-        text = re.sub(r"<(br|hr)\s*/?>", "\n", text, flags=re.I)
+        text = _LINK_RE.sub(lambda m: f"[{_strip_tags(m[2])}]({m[1]})", html)
+        text = _HEADING_RE.sub(lambda m: f"\n{'#' * int(m[1])} {_strip_tags(m[2])}\n", text)
+        text = _LIST_ITEM_RE.sub(lambda m: f"\n- {_strip_tags(m[1])}", text)
+        text = _BLOCK_END_RE.sub("\n\n", text)
+        text = _BREAK_RE.sub("\n", text)
         return _normalize(_strip_tags(text))
@@ -0,0 +1,190 @@
+"""Response cache for web_search and web_fetch."""
+
+import json
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+from banabot.utils.helpers import ensure_dir
+
+
+@dataclass
+class CacheEntry:
+    """A cached tool response and the validators needed to revalidate it."""
+
+    value: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class WebCache:
+    """
+    TTL cache of web tool responses, shared by the agent, subagents and cron.
+
+    An in-memory LRU sits in front of a ``web_cache`` table in
+    ``<workspace>/cache/web.db``. Expired entries are kept (until pruned to
+    ``max_entries``, least recently used first) so web_fetch can revalidate
+    them with ETag / Last-Modified instead of downloading again.
+    """
+
+    def __init__(self, workspace: Path, max_entries: int = 2000, memory_entries: int = 256):
+        self.db_path = ensure_dir(workspace / "cache") / "web.db"
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[tuple[str, str], CacheEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._db = sqlite3.connect(str(self.db_path))
+        self._init_db()
+        (self._rows,) = self._db.execute("SELECT COUNT(*) FROM web_cache").fetchone()
+
+    def _init_db(self) -> None:
+        """Initialize SQLite schema."""
+        with self._db:
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS web_cache (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (kind, key)
+                )
+                """
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_web_cache_last_used ON web_cache(last_used)"
+            )
+
+    def get(self, kind: str, key: str) -> CacheEntry | None:
+        """Look up an entry, fresh or not (check ``entry.fresh``)."""
+        entry = self._memory.get((kind, key))
+        if entry is None:
+            row = self._db.execute(
+                "SELECT value, expires_at, etag, last_modified FROM web_cache "
+                "WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            entry = CacheEntry(json.loads(row[0]), row[1], row[2], row[3])
+            with self._db:
+                self._db.execute(
+                    "UPDATE web_cache SET last_used = ? WHERE kind = ? AND key = ?",
+                    (time.time(), kind, key),
+                )
+        self._remember((kind, key), entry)
+        if entry.fresh:
+            self._hits += 1
+        else:
+            self._misses += 1
+        return entry
+
+    def put(
+        self,
+        kind: str,
+        key: str,
+        value: Any,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response for ``ttl`` seconds."""
+        now = time.time()
+        entry = CacheEntry(value, now + ttl, etag, last_modified)
+        self._remember((kind, key), entry)
+        exists = self._db.execute(
+            "SELECT 1 FROM web_cache WHERE kind = ? AND key = ?", (kind, key)
+        ).fetchone()
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO web_cache "
+                "(kind, key, value, expires_at, etag, last_modified, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, key, json.dumps(value), entry.expires_at, etag, last_modified, now),
+            )
+            if not exists:
+                self._rows += 1
+            if self._rows > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM web_cache WHERE rowid IN "
+                    "(SELECT rowid FROM web_cache ORDER BY last_used LIMIT ?)",
+                    (self._rows - self.max_entries,),
+                )
+                (self._rows,) = self._db.execute("SELECT COUNT(*) FROM web_cache").fetchone()
+
+    def refresh(self, kind: str, key: str, entry: CacheEntry, ttl: float) -> None:
+        """Extend a revalidated entry (HTTP 304) by ``ttl`` seconds."""
+        entry.expires_at = time.time() + ttl
+        with self._db:
+            self._db.execute(
+                "UPDATE web_cache SET expires_at = ?, last_used = ? WHERE kind = ? AND key = ?",
+                (entry.expires_at, time.time(), kind, key),
+            )
+
+    def _remember(self, key: tuple[str, str], entry: CacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Hits (fresh entries served), misses, hit rate and stored entries."""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "entries": self._rows,
+        }
+
+    def close(self) -> None:
+        self._db.close()
+
+
+_MAX_AGE_RE = re.compile(r"(?:s-maxage|max-age)\s*=\s*(\d+)", re.I)
+
+
+def http_ttl(headers: Any, default: float) -> float | None:
+    """
+    TTL for a response according to its caching headers, capped at ``default``.
+
+    Returns None when the response must not be stored (``no-store``).
+    """
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+    if match := _MAX_AGE_RE.search(cache_control):
+        return min(float(match[1]), default)
+    if expires := headers.get("expires"):
+        try:
+            return max(0.0, min(parsedate_to_datetime(expires).timestamp() - time.time(), default))
+        except (TypeError, ValueError):
+            return 0.0
+    return default
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return " ".join(query.lower().split())
@@ -4,6 +4,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+# Metadata key linking the updates of one streamed reply: {"id": str, "partial": bool}
+STREAM_KEY = "_stream"
+
 
 @dataclass
 class InboundMessage:
@@ -33,3 +36,48 @@ class OutboundMessage:
     reply_to: str | None = None
     media: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def stream_id(self) -> str | None:
+        """ID of the streamed reply this message belongs to (None for plain messages)."""
+        return (self.metadata.get(STREAM_KEY) or {}).get("id")
+
+    @property
+    def is_partial(self) -> bool:
+        """Whether this is an interim update of a streamed reply (final text follows)."""
+        return bool((self.metadata.get(STREAM_KEY) or {}).get("partial"))
+
+
+def merge_inbound(messages: list[InboundMessage]) -> InboundMessage:
+    """
+    Merge consecutive messages from one chat into a single agent turn.
+
+    Bodies are joined with newlines and labelled ``sender: body`` when more
+    than one sender is involved; media are concatenated and the metadata of
+    the latest message is kept, with ``buffered_count`` set.
+    """
+    if len(messages) == 1:
+        return messages[0]
+    first, last = messages[0], messages[-1]
+    labelled = len({m.sender_id for m in messages}) > 1
+    body = "\n".join(
+        f"{_sender_label(m)}: {m.content}" if labelled else m.content for m in messages
+    )
+    count = sum(m.metadata.get("buffered_count", 1) for m in messages)
+    metadata = {**last.metadata, "buffered_count": count}
+    if any(m.metadata.get("was_mentioned") for m in messages):
+        metadata["was_mentioned"] = True
+    return InboundMessage(
+        channel=first.channel,
+        sender_id=last.sender_id,
+        chat_id=first.chat_id,
+        content=body,
+        timestamp=first.timestamp,
+        media=[path for m in messages for path in m.media],
+        metadata=metadata,
+    )
+
+
+def _sender_label(msg: InboundMessage) -> str:
+    meta = msg.metadata
+    return meta.get("sender_name") or meta.get("username") or msg.sender_id.split("|")[0]
@@ -0,0 +1,332 @@
+"""Bounded, fair inbound queue with admission control, and burst coalescing."""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Awaitable, Callable, Literal
+
+from loguru import logger
+
+from banabot.bus.events import InboundMessage, merge_inbound
+from banabot.utils.rate_limit import TokenBucket
+
+if TYPE_CHECKING:
+    from banabot.config.schema import InboundQueueConfig
+
+Admission = Literal["queued", "coalesced", "rate_limited", "rejected"]
+
+# Local channels are trusted: no rate limiting (capacity limits still apply)
+_TRUSTED_CHANNELS = {"system", "cli"}
+
+
+class BusClosedError(Exception):
+    """Raised by consumers of a bus queue once it is closed and drained."""
+
+
+class InboundQueue:
+    """
+    Inbound messages grouped by session key and served weighted round-robin.
+
+    Every chat gets its own FIFO; ``get`` takes up to ``weight`` turns from a
+    chat before moving on to the next one, so a flooding chat cannot starve
+    the others. ``offer`` applies per-sender and per-chat token buckets and,
+    when a chat or the whole queue is full, the configured shed policy:
+
+    - ``drop_oldest``: evict the oldest queued turn of the chat (or of the
+      longest queue when the global limit is hit) to make room.
+    - ``reject``: refuse the new message (the bus replies to the chat).
+    - ``coalesce``: merge the new message into the chat's last queued turn.
+
+    Messages over their rate are refused (``rate_limited``) whatever the
+    policy, and the bus tells the chat. Each queued entry is a batch of
+    messages delivered as one turn; batches only grow beyond one message
+    under the coalesce policy.
+    """
+
+    max_buckets = 1000
+    # Seconds between rejection warnings for one chat (the rest go to debug)
+    warn_interval = 60.0
+
+    def __init__(self, config: "InboundQueueConfig | None" = None):
+        from banabot.config.schema import InboundQueueConfig
+
+        self.config = config or InboundQueueConfig()
+        self._queues: OrderedDict[str, deque[list[InboundMessage]]] = OrderedDict()
+        self._credit: dict[str, int] = {}
+        self._size = 0
+        self._not_empty = asyncio.Event()
+        self._closed = False
+        self._senders: dict[str, TokenBucket] = {}
+        self._chats: dict[str, TokenBucket] = {}
+        self._warned: dict[str, float] = {}
+        self.admitted = 0
+        self.rejected = 0
+        self.shed = 0
+        self.coalesced = 0
+
+    def offer(self, msg: InboundMessage) -> Admission:
+        """Admit a message without waiting, reporting what happened to it."""
+        if self._closed:
+            return self._reject(msg, "queue closed")
+        key = msg.session_key
+        queue = self._queues.get(key)
+
+        if not self._within_rate(msg):
+            # Over its rate a message never displaces others; it may still ride
+            # along with a turn the chat already has queued
+            if self.config.shed_policy == "coalesce" and queue:
+                return self._coalesce(queue, msg)
+            return self._reject(msg, "rate limited", "rate_limited")
+
+        chat_full = queue is not None and len(queue) >= self.config.max_per_chat
+        if chat_full or self._size >= self.config.max_size:
+            policy = self.config.shed_policy
+            if policy == "coalesce" and queue:
+                return self._coalesce(queue, msg)
+            if policy == "reject":
+                return self._reject(msg, "queue full")
+            if self._queues:
+                self._evict(key if chat_full else self._longest())
+                queue = self._queues.get(key)
+
+        if queue is None:
+            queue = self._queues[key] = deque()
+        queue.append([msg])
+        self._size += 1
+        self.admitted += 1
+        self._not_empty.set()
+        return "queued"
+
+    async def get(self) -> InboundMessage:
+        """
+        Take the next turn in weighted round-robin order (waits until one is
+        queued). Raises ``BusClosedError`` once the queue is closed and drained.
+        """
+        while not self._size:
+            if self._closed:
+                raise BusClosedError
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def get_nowait(self) -> InboundMessage:
+        """Take the next turn, raising ``asyncio.QueueEmpty`` if there is none."""
+        if not self._size:
+            raise asyncio.QueueEmpty
+        key, queue = next(iter(self._queues.items()))
+        credit = self._credit.get(key) or self._weight(key)
+        batch = queue.popleft()
+        self._size -= 1
+        if not queue:
+            del self._queues[key]
+            self._credit.pop(key, None)
+        elif credit > 1:
+            self._credit[key] = credit - 1
+        else:
+            self._credit.pop(key, None)
+            self._queues.move_to_end(key)
+        return merge_inbound(batch)
+
+    def close(self) -> None:
+        """Refuse new messages and wake waiting consumers once the backlog is drained."""
+        self._closed = True
+        self._not_empty.set()
+
+    def qsize(self) -> int:
+        """Number of queued turns."""
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._size
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Queue depth and admission counters."""
+        return {
+            "depth": self._size,
+            "chats": len(self._queues),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "shed": self.shed,
+            "coalesced": self.coalesced,
+        }
+
+    def _weight(self, key: str) -> int:
+        weights = self.config.weights
+        weight = weights.get(key) or weights.get(key.split(":", 1)[0]) or 1
+        return max(1, weight)
+
+    def _within_rate(self, msg: InboundMessage) -> bool:
+        if msg.channel in _TRUSTED_CHANNELS:
+            return True
+        config = self.config
+        if config.sender_rate > 0:
+            sender = f"{msg.channel}:{msg.sender_id}"
+            if not self._bucket(self._senders, sender, config.sender_rate, config.sender_burst):
+                return False
+        if config.chat_rate > 0:
+            chat = msg.session_key
+            if not self._bucket(self._chats, chat, config.chat_rate, config.chat_burst):
+                return False
+        return True
+
+    def _bucket(
+        self, buckets: dict[str, TokenBucket], key: str, per_minute: float, burst: int
+    ) -> bool:
+        bucket = buckets.get(key)
+        if bucket is None:
+            if len(buckets) >= self.max_buckets:
+                for idle_key in [k for k, b in buckets.items() if b.idle]:
+                    del buckets[idle_key]
+            bucket = buckets[key] = TokenBucket(per_minute / 60, burst)
+        return bucket.try_acquire()
+
+    def _coalesce(self, queue: deque[list[InboundMessage]], msg: InboundMessage) -> Admission:
+        batch = queue[-1]
+        batch.append(msg)
+        if len(batch) > self.config.max_batch:
+            batch.pop(0)
+            self.shed += 1
+        self.coalesced += 1
+        return "coalesced"
+
+    def _reject(
+        self, msg: InboundMessage, reason: str, result: Admission = "rejected"
+    ) -> Admission:
+        self.rejected += 1
+        key = msg.session_key
+        now = time.monotonic()
+        if now - self._warned.get(key, float("-inf")) < self.warn_interval:
+            logger.debug(f"Inbound message from {key} rejected: {reason}")
+            return result
+        if len(self._warned) >= self.max_buckets:
+            cutoff = now - self.warn_interval
+            self._warned = {k: t for k, t in self._warned.items() if t > cutoff}
+        self._warned[key] = now
+        logger.warning(
+            f"Inbound message from {key} rejected: {reason} "
+            f"(repeats within {self.warn_interval:.0f}s are logged at debug level)"
+        )
+        return result
+
+    def _longest(self) -> str:
+        return max(self._queues, key=lambda k: len(self._queues[k]))
+
+    def _evict(self, key: str) -> None:
+        queue = self._queues[key]
+        dropped = queue.popleft()
+        self._size -= 1
+        self.shed += len(dropped)
+        if not queue:
+            del self._queues[key]
+            self._credit.pop(key, None)
+        logger.warning(f"Inbound queue full, dropped the oldest message from {key}")
+
+
+class CoalesceWindow:
+    """
+    Merges bursts from one chat into a single agent turn.
+
+    Messages are held per session key until the chat has been quiet for
+    ``window`` seconds, then merged (``merge_inbound``) and handed to
+    ``deliver``. ``mode`` decides what happens to the first message of a
+    burst:
+
+    - ``trailing``: it is held too, so a whole burst costs one turn.
+    - ``leading``: it goes through at once (no added latency) and only the
+      messages that follow within the window are held and merged.
+    - ``groups``: trailing in group chats (``is_group`` metadata), leading
+      in private chats.
+
+    A held batch is flushed early when it reaches ``max_batch`` messages or
+    when a message mentions the bot, since its reply should not wait. Slash
+    commands flush what is held and then go through on their own.
+    """
+
+    max_tracked_chats = 1000
+
+    def __init__(
+        self,
+        window: float,
+        max_batch: int,
+        deliver: Callable[[InboundMessage], Awaitable[object]],
+        mode: str = "leading",
+    ):
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self.mode = mode
+        self._deliver = deliver
+        self._batches: dict[str, list[InboundMessage]] = {}
+        self._timers: dict[str, asyncio.Task] = {}
+        self._last_seen: dict[str, float] = {}
+
+    def accepts(self, msg: InboundMessage) -> bool:
+        """Whether a message is held at all (local and pre-buffered messages are not)."""
+        return (
+            self.window > 0
+            and msg.channel not in _TRUSTED_CHANNELS
+            and "buffered_count" not in msg.metadata
+        )
+
+    async def add(self, msg: InboundMessage) -> None:
+        """Deliver or hold a message, flushing its chat's batch if it should not wait."""
+        key = msg.session_key
+        now = time.monotonic()
+        last_seen = self._last_seen.pop(key, None)
+        self._remember(key, now)
+        quiet = last_seen is None or now - last_seen >= self.window
+        if quiet and key not in self._batches and not self._holds_first(msg):
+            await self._deliver(msg)
+            return
+        if msg.content.startswith("/"):
+            await self.flush(key)
+            await self._deliver(msg)
+            return
+        batch = self._batches.setdefault(key, [])
+        batch.append(msg)
+        if len(batch) >= self.max_batch or msg.metadata.get("was_mentioned"):
+            await self.flush(key)
+            return
+        timer = self._timers.get(key)
+        if timer:
+            timer.cancel()
+        self._timers[key] = asyncio.create_task(self._flush_after(key))
+
+    async def flush(self, key: str) -> None:
+        """Deliver the held messages of one chat now."""
+        timer = self._timers.pop(key, None)
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+        batch = self._batches.pop(key, None)
+        if batch:
+            await self._deliver(merge_inbound(batch))
+
+    def discard(self) -> None:
+        """Drop everything held and cancel the timers (the bus is closing)."""
+        if self._batches:
+            logger.info(f"Discarding {self.held} held inbound message(s)")
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._batches.clear()
+        self._last_seen.clear()
+
+    @property
+    def held(self) -> int:
+        """Number of messages waiting for their window to close."""
+        return sum(len(batch) for batch in self._batches.values())
+
+    def _holds_first(self, msg: InboundMessage) -> bool:
+        if self.mode == "groups":
+            return bool(msg.metadata.get("is_group"))
+        return self.mode == "trailing"
+
+    def _remember(self, key: str, now: float) -> None:
+        if len(self._last_seen) >= self.max_tracked_chats:
+            cutoff = now - self.window
+            self._last_seen = {k: t for k, t in self._last_seen.items() if t > cutoff}
+        self._last_seen[key] = now
+
+    async def _flush_after(self, key: str) -> None:
+        await asyncio.sleep(self.window)
+        await self.flush(key)
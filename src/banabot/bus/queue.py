@@ -1,11 +1,16 @@
 """Async message queue for decoupled channel-agent communication."""
 
 import asyncio
-from typing import Awaitable, Callable
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable
 
 from loguru import logger
 
 from banabot.bus.events import InboundMessage, OutboundMessage
+from banabot.bus.inbound import BusClosedError, CoalesceWindow, InboundQueue
+
+if TYPE_CHECKING:
+    from banabot.config.schema import InboundQueueConfig
 
 
 class MessageBus:
@@ -13,32 +18,108 @@ class MessageBus:
     Async message bus that decouples chat channels from the agent core.
 
     Channels push messages to the inbound queue, and the agent processes
-    them and pushes responses to the outbound queue.
+    them and pushes responses to the outbound queue. The inbound side is
+    bounded and fair across chats (see ``InboundQueue``), and bursts from one
+    chat are merged into a single turn first (see ``CoalesceWindow``).
+
+    Consumers block on the queues without polling; ``close`` ends them once
+    the pending messages are consumed (``BusClosedError``, or the end of the
+    ``inbound_messages``/``outbound_messages`` iterators).
     """
 
-    def __init__(self):
-        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
-        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
+    # Seconds between "too many messages" replies to the same chat
+    reject_reply_interval = 60.0
+
+    def __init__(self, inbound_config: "InboundQueueConfig | None" = None):
+        self.inbound = InboundQueue(inbound_config)
+        config = self.inbound.config
+        self.coalescer = CoalesceWindow(
+            config.coalesce_window, config.max_batch, self._admit, config.coalesce_mode
+        )
+        # None is the close sentinel (put back so every consumer sees it)
+        self.outbound: asyncio.Queue[OutboundMessage | None] = asyncio.Queue()
         self._outbound_subscribers: dict[
             str, list[Callable[[OutboundMessage], Awaitable[None]]]
         ] = {}
-        self._running = False
+        self._closed = False
+        self._rejection_replies: dict[str, float] = {}
+
+    async def publish_inbound(self, msg: InboundMessage) -> bool:
+        """
+        Publish a message from a channel to the agent.
 
-    async def publish_inbound(self, msg: InboundMessage) -> None:
-        """Publish a message from a channel to the agent."""
-        await self.inbound.put(msg)
+        Returns False if admission control refused it. The chat is told so
+        (at most once per interval) when it is over its rate, and when the
+        queue is full under the ``reject`` shed policy. Messages
+        held by the coalescing window are admitted when it closes.
+        """
+        if self._closed:
+            return False
+        if self.coalescer.accepts(msg):
+            await self.coalescer.add(msg)
+            return True
+        return await self._admit(msg)
+
+    async def _admit(self, msg: InboundMessage) -> bool:
+        result = self.inbound.offer(msg)
+        if result in ("queued", "coalesced"):
+            return True
+        if result == "rate_limited" or self.inbound.config.shed_policy == "reject":
+            await self._reply_rejected(msg)
+        return False
+
+    async def _reply_rejected(self, msg: InboundMessage) -> None:
+        now = time.monotonic()
+        key = msg.session_key
+        if now - self._rejection_replies.get(key, float("-inf")) < self.reject_reply_interval:
+            return
+        if len(self._rejection_replies) >= self.inbound.max_buckets:
+            cutoff = now - self.reject_reply_interval
+            self._rejection_replies = {
+                k: t for k, t in self._rejection_replies.items() if t > cutoff
+            }
+        self._rejection_replies[key] = now
+        await self.publish_outbound(
+            OutboundMessage(
+                channel=msg.channel,
+                chat_id=msg.chat_id,
+                content=self.inbound.config.reject_message,
+            )
+        )
 
     async def consume_inbound(self) -> InboundMessage:
         """Consume the next inbound message (blocks until available)."""
         return await self.inbound.get()
 
+    async def inbound_messages(self) -> AsyncIterator[InboundMessage]:
+        """Iterate over inbound messages until the bus is closed."""
+        while True:
+            try:
+                msg = await self.inbound.get()
+            except BusClosedError:
+                return
+            yield msg
+
     async def publish_outbound(self, msg: OutboundMessage) -> None:
         """Publish a response from the agent to channels."""
         await self.outbound.put(msg)
 
     async def consume_outbound(self) -> OutboundMessage:
         """Consume the next outbound message (blocks until available)."""
-        return await self.outbound.get()
+        msg = await self.outbound.get()
+        if msg is None:
+            self.outbound.put_nowait(None)
+            raise BusClosedError
+        return msg
+
+    async def outbound_messages(self) -> AsyncIterator[OutboundMessage]:
+        """Iterate over outbound messages until the bus is closed."""
+        while True:
+            try:
+                msg = await self.consume_outbound()
+            except BusClosedError:
+                return
+            yield msg
 
     def subscribe_outbound(
         self, channel: str, callback: Callable[[OutboundMessage], Awaitable[None]]
@@ -51,31 +132,47 @@ class MessageBus:
     async def dispatch_outbound(self) -> None:
         """
         Dispatch outbound messages to subscribed channels.
-        Run this as a background task.
+        Run this as a background task; it returns once the bus is closed.
         """
-        self._running = True
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(self.outbound.get(), timeout=1.0)
-                subscribers = self._outbound_subscribers.get(msg.channel, [])
-                for callback in subscribers:
-                    try:
-                        await callback(msg)
-                    except Exception as e:
-                        logger.error(f"Error dispatching to {msg.channel}: {e}")
-            except asyncio.TimeoutError:
-                continue
+        async for msg in self.outbound_messages():
+            for callback in self._outbound_subscribers.get(msg.channel, []):
+                try:
+                    await callback(msg)
+                except Exception as e:
+                    logger.error(f"Error dispatching to {msg.channel}: {e}")
+
+    def close(self) -> None:
+        """
+        Close the bus: new inbound messages are refused and consumers finish
+        once the messages already queued are consumed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.coalescer.discard()
+        self.inbound.close()
+        self.outbound.put_nowait(None)
 
     def stop(self) -> None:
-        """Stop the dispatcher loop."""
-        self._running = False
+        """Stop the dispatcher loop (closes the bus)."""
+        self.close()
 
     @property
     def inbound_size(self) -> int:
         """Number of pending inbound messages."""
         return self.inbound.qsize()
 
+    @property
+    def inbound_rejected(self) -> int:
+        """Number of inbound messages refused by admission control."""
+        return self.inbound.rejected
+
+    @property
+    def inbound_stats(self) -> dict[str, int]:
+        """Inbound queue depth, admission counters and messages held for coalescing."""
+        return {**self.inbound.stats, "held": self.coalescer.held}
+
     @property
     def outbound_size(self) -> int:
         """Number of pending outbound messages."""
-        return self.outbound.qsize()
+        return self.outbound.qsize() - int(self._closed)  # minus the close sentinel
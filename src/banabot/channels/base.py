@@ -1,12 +1,102 @@
 """Base channel interface for chat platforms."""
 
+import asyncio
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, TypeVar
 
+import httpx
 from loguru import logger
 
 from banabot.bus.events import InboundMessage, OutboundMessage
 from banabot.bus.queue import MessageBus
+from banabot.utils.rate_limit import TokenBucket
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Platform send limits in messages per second (0 = unlimited), with burst sizes."""
+
+    global_rate: float = 0.0
+    global_burst: int = 1
+    chat_rate: float = 0.0
+    chat_burst: int = 1
+    group_rate: float = 0.0  # Extra limit for group chats, on top of chat_rate
+    group_burst: int = 1
+
+
+class RateLimiter:
+    """Global, per-chat and per-group token buckets for one channel."""
+
+    max_chat_buckets = 1000
+
+    def __init__(self, limits: RateLimits):
+        self.limits = limits
+        self._global = TokenBucket(limits.global_rate, limits.global_burst)
+        self._chats: dict[str, TokenBucket] = {}
+        self._groups: dict[str, TokenBucket] = {}
+        self._paused_until = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Hold every send for ``seconds`` (the platform asked us to back off)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def reserve(self, chat_id: str, group: bool = False) -> float:
+        """Reserve a send slot, returning the seconds to wait for it."""
+        limits = self.limits
+        delays = [self._paused_until - time.monotonic()]
+        if limits.global_rate > 0:
+            delays.append(self._global.reserve())
+        if limits.chat_rate > 0:
+            delays.append(self._bucket(self._chats, chat_id, limits.chat_rate, limits.chat_burst))
+        if group and limits.group_rate > 0:
+            delays.append(
+                self._bucket(self._groups, chat_id, limits.group_rate, limits.group_burst)
+            )
+        return max(0.0, *delays)
+
+    async def acquire(self, chat_id: str, group: bool = False) -> None:
+        """Wait until a message may be sent to ``chat_id``."""
+        delay = self.reserve(chat_id, group)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _bucket(self, buckets: dict[str, TokenBucket], key: str, rate: float, burst: int) -> float:
+        bucket = buckets.get(key)
+        if bucket is None:
+            if len(buckets) >= self.max_chat_buckets:
+                for idle_key in [k for k, b in buckets.items() if b.idle]:
+                    del buckets[idle_key]
+            bucket = buckets[key] = TokenBucket(rate, burst)
+        return bucket.reserve()
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """The back-off a platform asked for (Telegram RetryAfter, HTTP 429), if any."""
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        headers = {k.lower(): v for k, v in (getattr(response, "headers", None) or {}).items()}
+        try:
+            return float(headers.get("retry-after", 1.0))
+        except (TypeError, ValueError):
+            return 1.0
+    return None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Exponential backoff with +/-50% jitter, so retries from many sends spread out."""
+    return min(cap, base * 2**attempt) * random.uniform(0.5, 1.5)
 
 
 class BaseChannel(ABC):
@@ -18,6 +108,15 @@ class BaseChannel(ABC):
     """
 
     name: str = "base"
+    # Channels that can edit sent messages show streamed replies as they are
+    # generated; the others only receive the final message.
+    supports_edits: bool = False
+    max_tracked_streams: int = 64
+    # Platform limits applied by _call_api, and the longest message worth
+    # building when the outbound queue coalesces a burst
+    rate_limits: RateLimits = RateLimits()
+    max_message_chars: int = 4000
+    send_retries: int = 3
 
     def __init__(self, config: Any, bus: MessageBus):
         """
@@ -30,6 +129,8 @@ class BaseChannel(ABC):
         self.config = config
         self.bus = bus
         self._running = False
+        self._streams: dict[str, Any] = {}  # stream id -> platform message reference
+        self._limiter = RateLimiter(self.rate_limits)
 
     @abstractmethod
     async def start(self) -> None:
@@ -58,6 +159,64 @@ class BaseChannel(ABC):
         """
         pass
 
+    async def _call_api(
+        self, chat_id: str, call: Callable[[], Awaitable[T]], idempotent: bool = True
+    ) -> T:
+        """
+        Run one platform API call within the channel's rate limits.
+
+        Failures the platform marks as rate limiting (``retry_after`` / HTTP
+        429) pause all sends of this channel for the requested time; those and
+        transient errors are retried up to ``send_retries`` times with jittered
+        exponential backoff. Other errors propagate immediately. Calls that are
+        not ``idempotent`` (posting a new message) are not retried after
+        errors that may hide a delivered request, such as read timeouts, since
+        a retry would duplicate the message.
+        """
+        chat_id = str(chat_id)
+        attempt = 0
+        while True:
+            await self._limiter.acquire(chat_id, self._is_group(chat_id))
+            try:
+                return await call()
+            except Exception as e:
+                retry_after = retry_after_seconds(e)
+                retryable = retry_after is not None or (
+                    self._is_transient(e) and (idempotent or not self._may_have_sent(e))
+                )
+                if attempt >= self.send_retries or not retryable:
+                    raise
+                if retry_after is not None:
+                    delay = retry_after + random.uniform(0, 0.5)
+                    self._limiter.pause(delay)
+                else:
+                    delay = backoff_delay(attempt)
+                logger.warning(f"{self.name} send failed ({e}), retry in {delay:.1f}s")
+                attempt += 1
+                if retry_after is None:
+                    await asyncio.sleep(delay)
+
+    def _is_group(self, chat_id: str) -> bool:
+        """Whether ``chat_id`` is a group chat (subject to ``group_rate``)."""
+        return False
+
+    def _may_have_sent(self, error: Exception) -> bool:
+        """Whether a failed call may still have reached the platform (timed out awaiting the reply)."""
+        return isinstance(error, (asyncio.TimeoutError, httpx.ReadTimeout, httpx.WriteTimeout))
+
+    def _is_transient(self, error: Exception) -> bool:
+        """Whether a failed call is worth retrying (network errors, 5xx)."""
+        if isinstance(error, (OSError, asyncio.TimeoutError, httpx.TransportError)):
+            return True
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        return isinstance(status, int) and status >= 500
+
+    def _remember_stream(self, stream_id: str, ref: Any) -> None:
+        """Track the platform message showing a streamed reply (oldest evicted first)."""
+        self._streams[stream_id] = ref
+        while len(self._streams) > self.max_tracked_streams:
+            del self._streams[next(iter(self._streams))]
+
     def is_allowed(self, sender_id: str) -> bool:
         """
         Check if a sender is allowed to use this bot.
@@ -10,7 +10,7 @@ from loguru import logger
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import DingTalkConfig
 
 try:
@@ -93,6 +93,7 @@ class DingTalkChannel(BaseChannel):
     """
 
     name = "dingtalk"
+    rate_limits = RateLimits(global_rate=20, global_burst=20, chat_rate=1, chat_burst=3)
 
     def __init__(self, config: DingTalkConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -213,12 +214,16 @@ class DingTalkChannel(BaseChannel):
             logger.warning("DingTalk HTTP client not initialized, cannot send")
             return
 
-        try:
+        async def post() -> httpx.Response:
             resp = await self._http.post(url, json=data, headers=headers)
-            if resp.status_code != 200:
-                logger.error(f"DingTalk send failed: {resp.text}")
-            else:
-                logger.debug(f"DingTalk message sent to {msg.chat_id}")
+            resp.raise_for_status()  # 429 carries Retry-After, honored by _call_api
+            return resp
+
+        try:
+            await self._call_api(msg.chat_id, post, idempotent=False)
+            logger.debug(f"DingTalk message sent to {msg.chat_id}")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"DingTalk send failed: {e.response.text}")
         except Exception as e:
             logger.error(f"Error sending DingTalk message: {e}")
 
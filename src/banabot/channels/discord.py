@@ -11,7 +11,7 @@ from loguru import logger
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import DiscordConfig
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
@@ -22,6 +22,10 @@ class DiscordChannel(BaseChannel):
     """Discord channel using Gateway websocket."""
 
     name = "discord"
+    supports_edits = True
+    # 5 messages per 5 seconds per channel, 50 requests/s per bot
+    rate_limits = RateLimits(global_rate=50, global_burst=50, chat_rate=1, chat_burst=5)
+    max_message_chars = 2000
 
     def __init__(self, config: DiscordConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -80,32 +84,42 @@ class DiscordChannel(BaseChannel):
         url = f"{DISCORD_API_BASE}/channels/{msg.chat_id}/messages"
         payload: dict[str, Any] = {"content": msg.content}
 
-        if msg.reply_to:
+        # Streamed replies are posted once and then edited in place
+        message_id = self._streams.get(msg.stream_id) if msg.stream_id else None
+        if not msg.is_partial:
+            self._streams.pop(msg.stream_id, None)
+
+        if msg.reply_to and not message_id:
             payload["message_reference"] = {"message_id": msg.reply_to}
             payload["allowed_mentions"] = {"replied_user": False}
 
-        headers = {"Authorization": f"Bot {self.config.token}"}
-
         try:
-            for attempt in range(3):
-                try:
-                    response = await self._http.post(url, headers=headers, json=payload)
-                    if response.status_code == 429:
-                        data = response.json()
-                        retry_after = float(data.get("retry_after", 1.0))
-                        logger.warning(f"Discord rate limited, retrying in {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
-                    response.raise_for_status()
-                    return
-                except Exception as e:
-                    if attempt == 2:
-                        logger.error(f"Error sending Discord message: {e}")
-                    else:
-                        await asyncio.sleep(1)
+            if message_id:
+                await self._request("PATCH", f"{url}/{message_id}", payload, msg.chat_id)
+                return
+            response = await self._request("POST", url, payload, msg.chat_id)
+            if response is not None and msg.is_partial:
+                self._remember_stream(msg.stream_id, response.json().get("id"))
         finally:
             await self._stop_typing(msg.chat_id)
 
+    async def _request(
+        self, method: str, url: str, payload: dict[str, Any], chat_id: str
+    ) -> httpx.Response | None:
+        """Call the REST API with rate limiting and retries; None if every attempt failed."""
+        headers = {"Authorization": f"Bot {self.config.token}"}
+
+        async def call() -> httpx.Response:
+            response = await self._http.request(method, url, headers=headers, json=payload)
+            response.raise_for_status()  # 429 carries Retry-After, honored by _call_api
+            return response
+
+        try:
+            return await self._call_api(chat_id, call, idempotent=method != "POST")
+        except Exception as e:
+            logger.error(f"Error sending Discord message: {e}")
+            return None
+
     async def _gateway_loop(self) -> None:
         """Main gateway loop: identify, heartbeat, dispatch events."""
         if not self._ws:
@@ -235,6 +249,7 @@ class DiscordChannel(BaseChannel):
             metadata={
                 "message_id": str(payload.get("id", "")),
                 "guild_id": payload.get("guild_id"),
+                "is_group": payload.get("guild_id") is not None,
                 "reply_to": reply_to,
             },
         )
@@ -18,7 +18,7 @@ from loguru import logger
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import EmailConfig
 
 
@@ -35,6 +35,8 @@ class EmailChannel(BaseChannel):
     """
 
     name = "email"
+    # SMTP providers throttle bulk senders; keep replies well below their limits
+    rate_limits = RateLimits(global_rate=0.5, global_burst=5, chat_rate=0.2, chat_burst=2)
     _IMAP_MONTHS = (
         "Jan",
         "Feb",
@@ -143,7 +145,9 @@ class EmailChannel(BaseChannel):
             email_msg["References"] = in_reply_to
 
         try:
-            await asyncio.to_thread(self._smtp_send, email_msg)
+            await self._call_api(
+                to_addr, lambda: asyncio.to_thread(self._smtp_send, email_msg), idempotent=False
+            )
         except Exception as e:
             logger.error(f"Error sending email to {to_addr}: {e}")
             raise
@@ -186,6 +190,14 @@ class EmailChannel(BaseChannel):
             smtp.login(self.config.smtp_username, self.config.smtp_password)
             smtp.send_message(msg)
 
+    def _is_transient(self, error: Exception) -> bool:
+        # SMTP errors subclass OSError; only 4xx replies and dropped connections are temporary
+        if isinstance(error, smtplib.SMTPResponseException):
+            return 400 <= error.smtp_code < 500
+        if isinstance(error, smtplib.SMTPException):
+            return isinstance(error, smtplib.SMTPServerDisconnected)
+        return super()._is_transient(error)
+
     def _fetch_new_messages(self) -> list[dict[str, Any]]:
         """Poll IMAP and return parsed unread messages."""
         return self._fetch_messages(
@@ -12,7 +12,7 @@ from loguru import logger
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import FeishuConfig
 
 try:
@@ -106,6 +106,7 @@ class FeishuChannel(BaseChannel):
     """
 
     name = "feishu"
+    rate_limits = RateLimits(global_rate=50, global_burst=50, chat_rate=5, chat_burst=5)
 
     def __init__(self, config: FeishuConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -409,6 +410,19 @@ class FeishuChannel(BaseChannel):
             logger.error(f"Error sending Feishu {msg_type} message: {e}")
             return False
 
+    async def _send_message(
+        self, receive_id_type: str, receive_id: str, msg_type: str, content: str
+    ) -> bool:
+        """Send one message within the channel's rate limits (failures are logged, not retried)."""
+        loop = asyncio.get_running_loop()
+        return await self._call_api(
+            receive_id,
+            lambda: loop.run_in_executor(
+                None, self._send_message_sync, receive_id_type, receive_id, msg_type, content
+            ),
+            idempotent=False,
+        )
+
     async def send(self, msg: OutboundMessage) -> None:
         """Send a message through Feishu, including media (images/files) if present."""
         if not self._client:
@@ -427,25 +441,15 @@ class FeishuChannel(BaseChannel):
                 if ext in self._IMAGE_EXTS:
                     key = await loop.run_in_executor(None, self._upload_image_sync, file_path)
                     if key:
-                        await loop.run_in_executor(
-                            None,
-                            self._send_message_sync,
-                            receive_id_type,
-                            msg.chat_id,
-                            "image",
-                            json.dumps({"image_key": key}),
+                        await self._send_message(
+                            receive_id_type, msg.chat_id, "image", json.dumps({"image_key": key})
                         )
                 else:
                     key = await loop.run_in_executor(None, self._upload_file_sync, file_path)
                     if key:
                         media_type = "audio" if ext in self._AUDIO_EXTS else "file"
-                        await loop.run_in_executor(
-                            None,
-                            self._send_message_sync,
-                            receive_id_type,
-                            msg.chat_id,
-                            media_type,
-                            json.dumps({"file_key": key}),
+                        await self._send_message(
+                            receive_id_type, msg.chat_id, media_type, json.dumps({"file_key": key})
                         )
 
             if msg.content and msg.content.strip():
@@ -453,9 +457,7 @@ class FeishuChannel(BaseChannel):
                     "config": {"wide_screen_mode": True},
                     "elements": self._build_card_elements(msg.content),
                 }
-                await loop.run_in_executor(
-                    None,
-                    self._send_message_sync,
+                await self._send_message(
                     receive_id_type,
                     msg.chat_id,
                     "interactive",
@@ -530,6 +532,7 @@ class FeishuChannel(BaseChannel):
                 metadata={
                     "message_id": message_id,
                     "chat_type": chat_type,
+                    "is_group": chat_type == "group",
                     "msg_type": msg_type,
                 },
             )
@@ -3,15 +3,39 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from dataclasses import dataclass, replace
 from typing import Any
 
 from loguru import logger
 
+from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
 from banabot.channels.base import BaseChannel
 from banabot.config.schema import Config
 
 
+@dataclass
+class SendStats:
+    """Delivery counters and send latency (seconds) for one channel."""
+
+    sent: int = 0
+    failed: int = 0
+    dropped: int = 0
+    coalesced: int = 0  # Messages merged into another or superseded by a newer stream update
+    avg_latency: float = 0.0  # Exponentially weighted
+    max_latency: float = 0.0
+
+    def record(self, latency: float, ok: bool, alpha: float = 0.2) -> None:
+        if ok:
+            self.sent += 1
+        else:
+            self.failed += 1
+        first = self.sent + self.failed == 1
+        self.avg_latency = latency if first else alpha * latency + (1 - alpha) * self.avg_latency
+        self.max_latency = max(self.max_latency, latency)
+
+
 class ChannelManager:
     """
     Manages chat channels and coordinates message routing.
@@ -20,13 +44,21 @@ class ChannelManager:
     - Initialize enabled channels (Telegram, WhatsApp, etc.)
     - Start/stop channels
     - Route outbound messages
+
+    Outbound messages are handed to bounded per-channel queues (per-chat with
+    ``gateway.outbound.perChat``), each drained by its own worker, so a slow
+    send on one channel never delays the others.
     """
 
     def __init__(self, config: Config, bus: MessageBus):
         self.config = config
         self.bus = bus
+        self.outbound_config = config.gateway.outbound
         self.channels: dict[str, BaseChannel] = {}
         self._dispatch_task: asyncio.Task | None = None
+        self._outboxes: dict[tuple[str, str], asyncio.Queue[OutboundMessage]] = {}
+        self._outbox_tasks: set[asyncio.Task] = set()
+        self._stats: dict[str, SendStats] = {}
 
         self._init_channels()
 
@@ -159,13 +191,16 @@ class ChannelManager:
         """Stop all channels and the dispatcher."""
         logger.info("Stopping all channels...")
 
-        # Stop dispatcher
+        # Stop dispatcher and send workers
         if self._dispatch_task:
             self._dispatch_task.cancel()
             try:
                 await self._dispatch_task
             except asyncio.CancelledError:
                 pass
+        for task in list(self._outbox_tasks):
+            task.cancel()
+        await asyncio.gather(*self._outbox_tasks, return_exceptions=True)
 
         # Stop all channels
         for name, channel in self.channels.items():
@@ -179,23 +214,121 @@ class ChannelManager:
         """Dispatch outbound messages to the appropriate channel."""
         logger.info("Outbound dispatcher started")
 
-        while True:
-            try:
-                msg = await asyncio.wait_for(self.bus.consume_outbound(), timeout=1.0)
-
-                channel = self.channels.get(msg.channel)
-                if channel:
-                    try:
-                        await channel.send(msg)
-                    except Exception as e:
-                        logger.error(f"Error sending to {msg.channel}: {e}")
+        async for msg in self.bus.outbound_messages():
+            channel = self.channels.get(msg.channel)
+            if channel:
+                if msg.is_partial and not channel.supports_edits:
+                    continue
+                await self._enqueue(channel, msg)
+            else:
+                logger.warning(f"Unknown channel: {msg.channel}")
+
+    async def _enqueue(self, channel: BaseChannel, msg: OutboundMessage) -> None:
+        """Queue a message for its channel (or chat) worker, applying the overflow policy."""
+        key = (channel.name, msg.chat_id if self.outbound_config.per_chat else "")
+        stats = self._stats.setdefault(channel.name, SendStats())
+        outbox = self._outboxes.get(key)
+        if outbox is None:
+            outbox = self._outboxes[key] = asyncio.Queue(max(1, self.outbound_config.queue_size))
+            task = asyncio.create_task(self._drain_outbox(key, channel, outbox, stats))
+            self._outbox_tasks.add(task)
+            task.add_done_callback(self._outbox_tasks.discard)
+
+        if outbox.full():
+            policy = self.outbound_config.overflow
+            if policy == "drop_newest":
+                stats.dropped += 1
+                logger.warning(f"Outbound queue for {channel.name} full, dropping new message")
+                return
+            if policy == "drop_oldest":
+                outbox.get_nowait()
+                stats.dropped += 1
+                logger.warning(f"Outbound queue for {channel.name} full, dropping oldest message")
+        # Waits for room only under the "block" policy
+        await outbox.put(msg)
+
+    async def _drain_outbox(
+        self,
+        key: tuple[str, str],
+        channel: BaseChannel,
+        outbox: asyncio.Queue[OutboundMessage],
+        stats: SendStats,
+    ) -> None:
+        """Send one queue's messages in order, then retire the worker."""
+        carry: OutboundMessage | None = None
+        try:
+            while True:
+                if carry is not None:
+                    msg, carry = carry, None
                 else:
-                    logger.warning(f"Unknown channel: {msg.channel}")
+                    try:
+                        msg = outbox.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                if self.outbound_config.coalesce:
+                    msg, carry = self._coalesce(msg, outbox, channel.max_message_chars, stats)
+                start = time.monotonic()
+                ok = True
+                try:
+                    await channel.send(msg)
+                except Exception as e:
+                    ok = False
+                    logger.error(f"Error sending to {msg.channel}: {e}")
+                stats.record(time.monotonic() - start, ok)
+        finally:
+            if self._outboxes.get(key) is outbox:
+                del self._outboxes[key]
+
+    @staticmethod
+    def _coalesce(
+        msg: OutboundMessage,
+        outbox: asyncio.Queue[OutboundMessage],
+        max_chars: int,
+        stats: SendStats,
+    ) -> tuple[OutboundMessage, OutboundMessage | None]:
+        """
+        Fold the backlog behind ``msg`` into as few sends as possible.
+
+        A streamed update is replaced by a newer update of the same reply, and
+        consecutive plain text messages to the same chat are joined while they
+        fit in one platform message. Returns the message to send and the first
+        queued message that could not be folded in.
+        """
+        while not outbox.empty():
+            nxt = outbox.get_nowait()
+            if msg.is_partial and nxt.stream_id == msg.stream_id:
+                msg = nxt
+            elif (
+                _is_plain(msg)
+                and _is_plain(nxt)
+                and nxt.chat_id == msg.chat_id
+                and nxt.metadata == msg.metadata
+                and len(msg.content) + len(nxt.content) + 2 <= max_chars
+            ):
+                msg = replace(msg, content=f"{msg.content}\n\n{nxt.content}")
+            else:
+                return msg, nxt
+            stats.coalesced += 1
+        return msg, None
 
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
+    @property
+    def outbound_stats(self) -> dict[str, dict[str, float]]:
+        """Per-channel queue depth, delivery counters and send latency."""
+        depth: dict[str, int] = {}
+        for (name, _), outbox in self._outboxes.items():
+            depth[name] = depth.get(name, 0) + outbox.qsize()
+        return {
+            name: {
+                "queue_depth": depth.get(name, 0),
+                "sent": stats.sent,
+                "failed": stats.failed,
+                "dropped": stats.dropped,
+                "coalesced": stats.coalesced,
+                "avg_latency": round(stats.avg_latency, 3),
+                "max_latency": round(stats.max_latency, 3),
+            }
+            for name, stats in self._stats.items()
+        }
 
     def get_channel(self, name: str) -> BaseChannel | None:
         """Get a channel by name."""
@@ -203,8 +336,9 @@ class ChannelManager:
 
     def get_status(self) -> dict[str, Any]:
         """Get status of all channels."""
+        stats = self.outbound_stats
         return {
-            name: {"enabled": True, "running": channel.is_running}
+            name: {"enabled": True, "running": channel.is_running, "outbound": stats.get(name, {})}
             for name, channel in self.channels.items()
         }
 
@@ -212,3 +346,8 @@ class ChannelManager:
     def enabled_channels(self) -> list[str]:
         """Get list of enabled channel names."""
         return list(self.channels.keys())
+
+
+def _is_plain(msg: OutboundMessage) -> bool:
+    """Text-only message that can be merged with its neighbours."""
+    return not (msg.stream_id or msg.media or msg.reply_to)
@@ -14,7 +14,7 @@ from loguru import logger
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import MochatConfig
 from banabot.utils.helpers import get_data_path
 
@@ -233,6 +233,7 @@ class MochatChannel(BaseChannel):
     """Mochat channel using socket.io with fallback polling workers."""
 
     name = "mochat"
+    rate_limits = RateLimits(global_rate=10, global_burst=10, chat_rate=1, chat_burst=3)
 
     def __init__(self, config: MochatConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -335,17 +336,25 @@ class MochatChannel(BaseChannel):
         )
         try:
             if is_panel:
-                await self._api_send(
-                    "/api/claw/groups/panels/send",
-                    "panelId",
+                await self._call_api(
                     target.id,
-                    content,
-                    msg.reply_to,
-                    self._read_group_id(msg.metadata),
+                    lambda: self._api_send(
+                        "/api/claw/groups/panels/send",
+                        "panelId",
+                        target.id,
+                        content,
+                        msg.reply_to,
+                        self._read_group_id(msg.metadata),
+                    ),
+                    idempotent=False,
                 )
             else:
-                await self._api_send(
-                    "/api/claw/sessions/send", "sessionId", target.id, content, msg.reply_to
+                await self._call_api(
+                    target.id,
+                    lambda: self._api_send(
+                        "/api/claw/sessions/send", "sessionId", target.id, content, msg.reply_to
+                    ),
+                    idempotent=False,
                 )
         except Exception as e:
             logger.error(f"Failed to send Mochat message: {e}")
@@ -972,6 +981,8 @@ class MochatChannel(BaseChannel):
             json=payload,
         )
         if not response.is_success:
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()  # Retryable: Retry-After honored by _call_api
             raise RuntimeError(f"Mochat HTTP {response.status_code}: {response.text[:200]}")
         try:
             parsed = response.json()
@@ -8,7 +8,7 @@ from loguru import logger
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import QQConfig
 
 try:
@@ -49,6 +49,7 @@ class QQChannel(BaseChannel):
     """QQ channel using botpy SDK with WebSocket connection."""
 
     name = "qq"
+    rate_limits = RateLimits(global_rate=20, global_burst=20, chat_rate=1, chat_burst=5)
 
     def __init__(self, config: QQConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -102,10 +103,14 @@ class QQChannel(BaseChannel):
             logger.warning("QQ client not initialized")
             return
         try:
-            await self._client.api.post_c2c_message(
-                openid=msg.chat_id,
-                msg_type=0,
-                content=msg.content,
+            await self._call_api(
+                msg.chat_id,
+                lambda: self._client.api.post_c2c_message(
+                    openid=msg.chat_id,
+                    msg_type=0,
+                    content=msg.content,
+                ),
+                idempotent=False,
             )
         except Exception as e:
             logger.error(f"Error sending QQ message: {e}")
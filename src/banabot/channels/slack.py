@@ -12,7 +12,7 @@ from slackify_markdown import slackify_markdown
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import SlackConfig
 
 
@@ -20,6 +20,9 @@ class SlackChannel(BaseChannel):
     """Slack channel using Socket Mode."""
 
     name = "slack"
+    supports_edits = True
+    # chat.postMessage allows about one message per second per channel
+    rate_limits = RateLimits(global_rate=5, global_burst=10, chat_rate=1, chat_burst=3)
 
     def __init__(self, config: SlackConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -82,11 +85,28 @@ class SlackChannel(BaseChannel):
             channel_type = slack_meta.get("channel_type")
             # Only reply in thread for channel/group messages; DMs don't use threads
             use_thread = thread_ts and channel_type != "im"
-            await self._web_client.chat_postMessage(
-                channel=msg.chat_id,
-                text=self._to_mrkdwn(msg.content),
-                thread_ts=thread_ts if use_thread else None,
+            text = self._to_mrkdwn(msg.content)
+            # Streamed replies are posted once and then edited in place
+            ts = self._streams.get(msg.stream_id) if msg.stream_id else None
+            if not msg.is_partial:
+                self._streams.pop(msg.stream_id, None)
+            if ts:
+                await self._call_api(
+                    msg.chat_id,
+                    lambda: self._web_client.chat_update(channel=msg.chat_id, ts=ts, text=text),
+                )
+                return
+            response = await self._call_api(
+                msg.chat_id,
+                lambda: self._web_client.chat_postMessage(
+                    channel=msg.chat_id,
+                    text=text,
+                    thread_ts=thread_ts if use_thread else None,
+                ),
+                idempotent=False,
             )
+            if msg.is_partial:
+                self._remember_stream(msg.stream_id, response.get("ts"))
         except Exception as e:
             logger.error(f"Error sending Slack message: {e}")
 
@@ -167,11 +187,13 @@ class SlackChannel(BaseChannel):
             chat_id=chat_id,
             content=text,
             metadata={
+                "was_mentioned": event_type == "app_mention",
+                "is_group": channel_type != "im",
                 "slack": {
                     "event": event,
                     "thread_ts": thread_ts,
                     "channel_type": channel_type,
-                }
+                },
             },
         )
 
@@ -7,12 +7,13 @@ import re
 
 from loguru import logger
 from telegram import BotCommand, Update
+from telegram.error import BadRequest, NetworkError, TimedOut
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 from telegram.request import HTTPXRequest
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import TelegramConfig
 
 
@@ -109,6 +110,16 @@ class TelegramChannel(BaseChannel):
     """
 
     name = "telegram"
+    supports_edits = True
+    # ~30 messages/s per bot, 1/s per chat (short bursts allowed), 20/min per group
+    rate_limits = RateLimits(
+        global_rate=30,
+        global_burst=30,
+        chat_rate=1,
+        chat_burst=3,
+        group_rate=20 / 60,
+        group_burst=5,
+    )
 
     # Commands registered with Telegram's command menu
     BOT_COMMANDS = [
@@ -128,6 +139,7 @@ class TelegramChannel(BaseChannel):
         self.groq_api_key = groq_api_key
         self._app: Application | None = None
         self._bot_id: int | None = None  # Bot's own ID to detect echo
+        self._bot_username: str | None = None  # To detect @mentions
         self._chat_ids: dict[str, int] = {}  # Map sender_id to chat_id for replies
         self._typing_tasks: dict[str, asyncio.Task] = {}  # chat_id -> typing loop task
 
@@ -180,6 +192,7 @@ class TelegramChannel(BaseChannel):
         # Get bot info and register command menu
         bot_info = await self._app.bot.get_me()
         self._bot_id = bot_info.id  # Store bot ID to detect own messages
+        self._bot_username = bot_info.username
         logger.info(f"Telegram bot @{bot_info.username} connected")
 
         try:
@@ -256,27 +269,116 @@ class TelegramChannel(BaseChannel):
                     if media_type in ("voice", "audio")
                     else "document"
                 )
-                with open(media_path, "rb") as f:
-                    await sender(chat_id=chat_id, **{param: f})
+
+                async def upload():
+                    with open(media_path, "rb") as f:  # Reopened for each retry
+                        return await sender(chat_id=chat_id, **{param: f})
+
+                await self._call_api(msg.chat_id, upload, idempotent=False)
             except Exception as e:
                 filename = media_path.rsplit("/", 1)[-1]
                 logger.error(f"Failed to send media {media_path}: {e}")
-                await self._app.bot.send_message(
-                    chat_id=chat_id, text=f"[Failed to send: {filename}]"
+                await self._call_api(
+                    msg.chat_id,
+                    lambda: self._app.bot.send_message(
+                        chat_id=chat_id, text=f"[Failed to send: {filename}]"
+                    ),
+                    idempotent=False,
                 )
 
         # Send text content
         if msg.content and msg.content != "[empty message]":
-            for chunk in _split_message(msg.content):
+            chunks = _split_message(msg.content)
+            if msg.stream_id:
+                chunks = await self._update_stream(chat_id, msg, chunks)
+            for chunk in chunks:
                 try:
-                    html = _markdown_to_telegram_html(chunk)
-                    await self._app.bot.send_message(chat_id=chat_id, text=html, parse_mode="HTML")
+                    await self._send_text(chat_id, chunk)
                 except Exception as e:
-                    logger.warning(f"HTML parse failed, falling back to plain text: {e}")
-                    try:
-                        await self._app.bot.send_message(chat_id=chat_id, text=chunk)
-                    except Exception as e2:
-                        logger.error(f"Error sending Telegram message: {e2}")
+                    logger.error(f"Error sending Telegram message: {e}")
+
+    async def _send_text(self, chat_id: int, text: str):
+        """Send one message as HTML, falling back to plain text."""
+        try:
+            html = _markdown_to_telegram_html(text)
+            return await self._call_api(
+                chat_id,
+                lambda: self._app.bot.send_message(chat_id=chat_id, text=html, parse_mode="HTML"),
+                idempotent=False,
+            )
+        except BadRequest as e:
+            logger.warning(f"HTML parse failed, falling back to plain text: {e}")
+            return await self._call_api(
+                chat_id,
+                lambda: self._app.bot.send_message(chat_id=chat_id, text=text),
+                idempotent=False,
+            )
+
+    async def _edit_text(self, chat_id: int, message_id: int, text: str) -> None:
+        """Replace a message's text as HTML, falling back to plain text."""
+        try:
+            html = _markdown_to_telegram_html(text)
+            await self._call_api(
+                chat_id,
+                lambda: self._app.bot.edit_message_text(
+                    chat_id=chat_id, message_id=message_id, text=html, parse_mode="HTML"
+                ),
+            )
+            return
+        except BadRequest as e:
+            if "not modified" in str(e).lower():  # Same text as the previous update
+                return
+            logger.debug(f"HTML edit failed, falling back to plain text: {e}")
+        try:
+            await self._call_api(
+                chat_id,
+                lambda: self._app.bot.edit_message_text(
+                    chat_id=chat_id, message_id=message_id, text=text
+                ),
+            )
+        except BadRequest as e:
+            if "not modified" not in str(e).lower():
+                raise
+
+    async def _update_stream(
+        self, chat_id: int, msg: OutboundMessage, chunks: list[str]
+    ) -> list[str]:
+        """
+        Show a streamed reply in one message that is edited as the text grows.
+
+        Only the first chunk is streamed; returns the chunks still to be sent
+        as new messages (the overflow of the final text).
+        """
+        message_id = self._streams.get(msg.stream_id)
+        if message_id is None and not msg.is_partial:
+            return chunks  # Nothing was shown yet: send the final text normally
+        try:
+            if message_id is None:
+                sent = await self._send_text(chat_id, chunks[0])
+                self._remember_stream(msg.stream_id, sent.message_id)
+            else:
+                await self._edit_text(chat_id, message_id, chunks[0])
+        except Exception as e:
+            logger.warning(f"Telegram stream update failed: {e}")
+            if not msg.is_partial:
+                self._streams.pop(msg.stream_id, None)
+                return chunks
+        if msg.is_partial:
+            return []
+        self._streams.pop(msg.stream_id, None)
+        return chunks[1:]
+
+    def _is_group(self, chat_id: str) -> bool:
+        return chat_id.startswith("-")  # Group and supergroup IDs are negative
+
+    def _may_have_sent(self, error: Exception) -> bool:
+        return isinstance(error, TimedOut) or super()._may_have_sent(error)
+
+    def _is_transient(self, error: Exception) -> bool:
+        # BadRequest subclasses NetworkError but retrying it cannot succeed
+        if isinstance(error, NetworkError) and not isinstance(error, BadRequest):
+            return True
+        return super()._is_transient(error)
 
     async def _on_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /start command."""
@@ -408,9 +510,18 @@ class TelegramChannel(BaseChannel):
                 "username": user.username,
                 "first_name": user.first_name,
                 "is_group": message.chat.type != "private",
+                "was_mentioned": self._was_mentioned(message),
             },
         )
 
+    def _was_mentioned(self, message) -> bool:
+        """Whether a message @mentions the bot or replies to one of its messages."""
+        reply = message.reply_to_message
+        if reply and reply.from_user and reply.from_user.id == self._bot_id:
+            return True
+        text = message.text or message.caption or ""
+        return bool(self._bot_username) and f"@{self._bot_username}" in text
+
     def _start_typing(self, chat_id: str) -> None:
         """Start sending 'typing...' indicator for a chat."""
         # Cancel any existing typing task for this chat
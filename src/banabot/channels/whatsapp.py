@@ -7,7 +7,7 @@ from loguru import logger
 
 from banabot.bus.events import OutboundMessage
 from banabot.bus.queue import MessageBus
-from banabot.channels.base import BaseChannel
+from banabot.channels.base import BaseChannel, RateLimits
 from banabot.config.schema import WhatsAppConfig
 
 
@@ -20,6 +20,8 @@ class WhatsAppChannel(BaseChannel):
     """
 
     name = "whatsapp"
+    # Conservative pacing: WhatsApp restricts accounts that send in bursts
+    rate_limits = RateLimits(global_rate=5, global_burst=10, chat_rate=1, chat_burst=3)
 
     def __init__(self, config: WhatsAppConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -84,7 +86,9 @@ class WhatsAppChannel(BaseChannel):
 
         try:
             payload = {"type": "send", "to": msg.chat_id, "text": msg.content}
-            await self._ws.send(json.dumps(payload))
+            await self._call_api(
+                msg.chat_id, lambda: self._ws.send(json.dumps(payload)), idempotent=False
+            )
         except Exception as e:
             logger.error(f"Error sending WhatsApp message: {e}")
 
@@ -577,6 +577,43 @@ def _make_provider(config: Config):
     )
 
 
+def _make_session_store(config: Config, backend: str | None = None):
+    """Create the session store selected in config (or by an explicit backend name)."""
+    from banabot.session.store import JsonlSessionStore
+
+    backend = backend or config.sessions.backend
+    sessions_dir = config.workspace_path / "sessions"
+    if backend == "sqlite":
+        from banabot.session.sqlite_store import SqliteSessionStore
+
+        return SqliteSessionStore(
+            sessions_dir / "sessions.db",
+            tail_messages=config.sessions.tail_messages,
+            commit_every=config.sessions.sqlite_commit_every,
+        )
+    if backend != "jsonl":
+        console.print(f"[red]Unknown session backend: {backend}[/red]")
+        raise typer.Exit(1)
+    return JsonlSessionStore(
+        sessions_dir,
+        compact_every=config.sessions.compact_every,
+        tail_messages=config.sessions.tail_messages,
+    )
+
+
+def _make_session_manager(config: Config):
+    """Create a SessionManager backed by the configured session store."""
+    from banabot.session.manager import SessionManager
+
+    return SessionManager(
+        config.workspace_path,
+        max_cached=config.sessions.cache_max_sessions,
+        max_cached_bytes=config.sessions.cache_max_bytes,
+        max_idle_seconds=config.sessions.cache_idle_seconds,
+        store=_make_session_store(config),
+    )
+
+
 # ============================================================================
 # Gateway / Server
 # ============================================================================
@@ -589,13 +626,13 @@ def gateway(
 ):
     """Start the banabot gateway."""
     from banabot.agent.loop import AgentLoop
+    from banabot.agent.tools.http_pool import HttpPool
     from banabot.bus.queue import MessageBus
     from banabot.channels.manager import ChannelManager
     from banabot.config.loader import get_data_dir, load_config
     from banabot.cron.service import CronService
     from banabot.cron.types import CronJob
     from banabot.heartbeat.service import HeartbeatService
-    from banabot.session.manager import SessionManager
 
     if verbose:
         import logging
@@ -605,9 +642,9 @@ def gateway(
     console.print(f"{__logo__} Starting banabot gateway on port {port}...")
 
     config = load_config()
-    bus = MessageBus()
+    bus = MessageBus(config.gateway.inbound)
     provider = _make_provider(config)
-    session_manager = SessionManager(config.workspace_path)
+    session_manager = _make_session_manager(config)
 
     # Clear docs directory on startup (session files)
     docs_dir = config.workspace_path / "docs"
@@ -639,6 +676,15 @@ def gateway(
         mcp_servers=config.tools.mcp_servers,
         timezone=config.timezone,
         semantic_memory_config=config.agents.defaults.semantic_memory,
+        max_concurrent_sessions=config.agents.defaults.max_concurrent_sessions,
+        prompt_cache=config.agents.defaults.prompt_cache,
+        max_parallel_tools=config.agents.defaults.max_parallel_tools,
+        max_tools_per_turn=config.agents.defaults.max_tools_per_turn,
+        stream=config.agents.defaults.stream,
+        stream_interval=config.agents.defaults.stream_interval,
+        http_pool=HttpPool(config.tools.http),
+        web_cache_config=config.tools.web.cache,
+        web_fetch_config=config.tools.web.fetch,
     )
 
     # Set cron callback (needs agent)
@@ -705,7 +751,15 @@ def gateway(
             heartbeat.stop()
             cron.stop()
             agent.stop()
+            bus.close()
             await channels.stop_all()
+            await agent.http_pool.aclose()
+            if agent.web_cache:
+                agent.web_cache.close()
+            if agent.semantic_memory:
+                agent.semantic_memory.close()
+            session_manager.flush()
+            session_manager.store.close()
 
     asyncio.run(run())
 
@@ -730,13 +784,14 @@ def agent(
     from loguru import logger
 
     from banabot.agent.loop import AgentLoop
+    from banabot.agent.tools.http_pool import HttpPool
     from banabot.bus.queue import MessageBus
     from banabot.config.loader import get_data_dir, load_config
     from banabot.cron.service import CronService
 
     config = load_config()
 
-    bus = MessageBus()
+    bus = MessageBus(config.gateway.inbound)
     provider = _make_provider(config)
 
     # Create cron service for tool usage (no callback needed for CLI unless running)
@@ -762,6 +817,14 @@ def agent(
         cron_service=cron,
         restrict_to_workspace=config.tools.restrict_to_workspace,
         mcp_servers=config.tools.mcp_servers,
+        prompt_cache=config.agents.defaults.prompt_cache,
+        max_parallel_tools=config.agents.defaults.max_parallel_tools,
+        max_tools_per_turn=config.agents.defaults.max_tools_per_turn,
+        stream=config.agents.defaults.stream,
+        stream_interval=config.agents.defaults.stream_interval,
+        http_pool=HttpPool(config.tools.http),
+        web_cache_config=config.tools.web.cache,
+        web_fetch_config=config.tools.web.fetch,
     )
 
     # Show spinner when logs are off (no output to miss); skip when logs are on
@@ -785,6 +848,7 @@ def agent(
                 )
             _print_agent_response(response, render_markdown=markdown)
             await agent_loop.close_mcp()
+            await agent_loop.http_pool.aclose()
 
         asyncio.run(run_once())
     else:
@@ -830,6 +894,7 @@ def agent(
                         break
             finally:
                 await agent_loop.close_mcp()
+                await agent_loop.http_pool.aclose()
 
         asyncio.run(run_interactive())
 
@@ -1148,6 +1213,74 @@ def cron_run(
         console.print(f"[red]Failed to run job {job_id}[/red]")
 
 
+# ============================================================================
+# Session Commands
+# ============================================================================
+
+
+sessions_app = typer.Typer(help="Manage conversation sessions")
+app.add_typer(sessions_app, name="sessions")
+
+
+@sessions_app.command("list")
+def sessions_list(
+    limit: int = typer.Option(20, "--limit", "-n", help="Number of sessions to show"),
+):
+    """List the most recently updated sessions."""
+    from banabot.config.loader import load_config
+
+    config = load_config()
+    store = _make_session_store(config)
+    try:
+        sessions = store.list_sessions(limit=limit)
+    finally:
+        store.close()
+
+    if not sessions:
+        console.print("No sessions.")
+        return
+
+    table = Table(title=f"Sessions ({store.name})")
+    table.add_column("Key", style="cyan")
+    table.add_column("Messages")
+    table.add_column("Updated")
+    for info in sessions:
+        count = info.get("message_count")
+        table.add_row(
+            info["key"],
+            "" if count is None else str(count),
+            (info.get("updated_at") or "")[:16],
+        )
+    console.print(table)
+
+
+@sessions_app.command("migrate")
+def sessions_migrate(
+    source: str = typer.Option("jsonl", "--from", help="Source backend (jsonl or sqlite)"),
+    target: str = typer.Option("sqlite", "--to", help="Target backend (jsonl or sqlite)"),
+):
+    """Copy all sessions between backends (e.g. JSONL files into SQLite, or back)."""
+    from banabot.config.loader import load_config
+    from banabot.session.store import copy_sessions
+
+    if source == target:
+        console.print("[red]Error: --from and --to must differ[/red]")
+        raise typer.Exit(1)
+
+    config = load_config()
+    src = _make_session_store(config, source)
+    dst = _make_session_store(config, target)
+    try:
+        copied = copy_sessions(src, dst)
+    finally:
+        src.close()
+        dst.close()
+
+    console.print(f"[green]✓[/green] Copied {copied} sessions from {source} to {target}")
+    if config.sessions.backend != target:
+        console.print(f'Set "sessions": {{"backend": "{target}"}} in config to use them')
+
+
 # ============================================================================
 # Status Commands
 # ============================================================================
@@ -1195,6 +1328,13 @@ def status():
                     f"{spec.label}: {'[green]✓[/green]' if has_key else '[dim]not set[/dim]'}"
                 )
 
+    if workspace.exists():
+        store = _make_session_store(config)
+        try:
+            console.print(f"Sessions: {store.count()} ({store.name})")
+        finally:
+            store.close()
+
 
 @app.command()
 def memory():
@@ -208,10 +208,15 @@ class SemanticMemoryConfig(Base):
     query_expansion: bool = Field(default=False, validation_alias="queryExpansion")
     mmr_enabled: bool = Field(default=False, validation_alias="mmrEnabled")
     mmr_lambda: float = Field(default=0.7, validation_alias="mmrLambda")
+    mmr_candidates: int = Field(default=20, validation_alias="mmrCandidates")
     temporal_decay_enabled: bool = Field(default=False, validation_alias="temporalDecayEnabled")
     temporal_decay_half_life_days: int = Field(
         default=30, validation_alias="temporalDecayHalfLifeDays"
     )
+    embedding_cache_size: int = Field(default=1024, validation_alias="embeddingCacheSize")
+    embedding_cache_max_entries: int = Field(
+        default=50_000, validation_alias="embeddingCacheMaxEntries"
+    )
 
 
 class AgentDefaults(Base):
@@ -223,6 +228,22 @@ class AgentDefaults(Base):
     temperature: float = 0.7
     max_tool_iterations: int = Field(default=20, validation_alias="maxToolIterations")
     memory_window: int = Field(default=25, validation_alias="memoryWindow")
+    max_concurrent_sessions: int = Field(
+        default=4, validation_alias="maxConcurrentSessions"
+    )  # Sessions processed in parallel (messages within one session stay ordered)
+    prompt_cache: bool = Field(
+        default=True, validation_alias="promptCache"
+    )  # Static system prompt + per-turn context in the user message (provider prompt caching)
+    max_parallel_tools: int = Field(
+        default=4, validation_alias="maxParallelTools"
+    )  # Read-only tool calls from one LLM turn run concurrently up to this limit
+    max_tools_per_turn: int = Field(
+        default=0, validation_alias="maxToolsPerTurn"
+    )  # MCP tools offered per turn, ranked against the message (0 = all); built-ins are always offered
+    stream: bool = True  # Stream replies as edit-in-place updates (Telegram, Slack, Discord)
+    stream_interval: float = Field(
+        default=1.0, validation_alias="streamInterval"
+    )  # Minimum seconds between streamed message edits
     semantic_memory: SemanticMemoryConfig = Field(
         default_factory=SemanticMemoryConfig, validation_alias="semanticMemory"
     )
@@ -265,11 +286,76 @@ class ProvidersConfig(Base):
     github_copilot: ProviderConfig = Field(default_factory=ProviderConfig)  # Github Copilot (OAuth)
 
 
+class SessionsConfig(Base):
+    """Conversation session storage configuration."""
+
+    backend: str = "jsonl"  # "jsonl" (one file per session) or "sqlite" (sessions/sessions.db)
+    sqlite_commit_every: int = 1  # Saves grouped into one SQLite commit
+    compact_every: int = 100  # Incremental saves before a session file is rewritten
+    cache_max_sessions: int = 256  # Sessions kept in memory
+    cache_max_bytes: int = 64 * 1024 * 1024  # Approximate memory budget for cached sessions
+    cache_idle_seconds: int = 3600  # Evict sessions untouched for this long
+    tail_messages: int = 100  # Messages parsed on load; older history is paged in on demand
+
+
+class OutboundQueueConfig(Base):
+    """Outbound delivery queues (one send worker per channel, or per chat)."""
+
+    queue_size: int = Field(
+        default=100, validation_alias="queueSize"
+    )  # Pending messages per queue before the overflow policy applies
+    per_chat: bool = Field(
+        default=False, validation_alias="perChat"
+    )  # One queue and worker per chat, so a slow chat does not delay the others
+    overflow: str = "drop_oldest"  # drop_oldest | drop_newest | block (stalls the dispatcher)
+    coalesce: bool = True  # Merge a backlog of short replies to one chat into one message
+
+
+class InboundQueueConfig(Base):
+    """Inbound queue between channels and the agent (admission control and fairness)."""
+
+    max_size: int = Field(
+        default=1000, validation_alias="maxSize"
+    )  # Queued agent turns across all chats before the shed policy applies
+    max_per_chat: int = Field(
+        default=50, validation_alias="maxPerChat"
+    )  # Queued agent turns per chat before the shed policy applies
+    sender_rate: float = Field(
+        default=20, validation_alias="senderRate"
+    )  # Messages per minute admitted from one sender (0 = unlimited)
+    sender_burst: int = Field(default=5, validation_alias="senderBurst")
+    chat_rate: float = Field(
+        default=60, validation_alias="chatRate"
+    )  # Messages per minute admitted from one chat (0 = unlimited)
+    chat_burst: int = Field(default=10, validation_alias="chatBurst")
+    shed_policy: str = Field(
+        default="drop_oldest", validation_alias="shedPolicy"
+    )  # drop_oldest | reject (replies with reject_message) | coalesce (merge into one turn)
+    coalesce_window: float = Field(
+        default=1.0, validation_alias="coalesceWindow"
+    )  # Messages following another within this many seconds are merged into one turn (0 = off)
+    coalesce_mode: str = Field(
+        default="groups", validation_alias="coalesceMode"
+    )  # leading (first message goes at once) | trailing (held too) | groups (trailing in groups)
+    max_batch: int = Field(
+        default=20, validation_alias="maxBatch"
+    )  # Messages merged into one turn (the window flushes early when reached)
+    weights: dict[str, int] = Field(
+        default_factory=dict
+    )  # Fair-share weight by session key ("telegram:123") or channel name (default 1)
+    reject_message: str = Field(
+        default="I'm receiving too many messages right now, please try again in a moment.",
+        validation_alias="rejectMessage",
+    )
+
+
 class GatewayConfig(Base):
     """Gateway/server configuration."""
 
     host: str = "0.0.0.0"
     port: int = 18790
+    inbound: InboundQueueConfig = Field(default_factory=InboundQueueConfig)
+    outbound: OutboundQueueConfig = Field(default_factory=OutboundQueueConfig)
 
 
 class SearchProviderConfig(Base):
@@ -324,13 +410,53 @@ class WebSearchConfig(Base):
 
     default_provider: str = "duckduckgo"
     max_results: int = 5
+    strategy: str = "hedge"  # sequential | hedge | race
+    hedge_delay: float = Field(
+        default=2.0, validation_alias="hedgeDelay"
+    )  # Seconds before the next provider is started alongside a slow one
+    adaptive_order: bool = Field(
+        default=True, validation_alias="adaptiveOrder"
+    )  # Reorder providers by observed latency / error rate
     providers: SearchProvidersConfig = Field(default_factory=SearchProvidersConfig)
 
 
+class WebCacheConfig(Base):
+    """Response cache for web_search / web_fetch (<workspace>/cache/web.db)."""
+
+    enabled: bool = True
+    search_ttl: int = Field(default=3600, validation_alias="searchTtl")  # Seconds
+    fetch_ttl: int = Field(default=900, validation_alias="fetchTtl")  # Seconds, capped by max-age
+    max_entries: int = Field(default=2000, validation_alias="maxEntries")
+    memory_entries: int = Field(default=256, validation_alias="memoryEntries")
+
+
+class WebFetchConfig(Base):
+    """web_fetch limits."""
+
+    max_chars: int = Field(default=50000, validation_alias="maxChars")  # Default text budget
+    max_bytes: int = Field(
+        default=2_000_000, validation_alias="maxBytes"
+    )  # Download stops after this many bytes
+
+
 class WebToolsConfig(Base):
     """Web tools configuration."""
 
     search: WebSearchConfig = Field(default_factory=WebSearchConfig)
+    fetch: WebFetchConfig = Field(default_factory=WebFetchConfig)
+    cache: WebCacheConfig = Field(default_factory=WebCacheConfig)
+
+
+class HttpPoolConfig(Base):
+    """Shared HTTP connection pool used by web, search and weather tools."""
+
+    http2: bool = True
+    max_connections: int = Field(default=50, validation_alias="maxConnections")
+    max_keepalive_connections: int = Field(default=20, validation_alias="maxKeepaliveConnections")
+    max_connections_per_host: int = Field(default=8, validation_alias="maxConnectionsPerHost")
+    keepalive_expiry: float = Field(default=30.0, validation_alias="keepaliveExpiry")  # Seconds
+    connect_timeout: float = Field(default=10.0, validation_alias="connectTimeout")  # Seconds
+    timeout: float = 30.0  # Seconds; per-request timeouts override this
 
 
 class ExecToolConfig(Base):
@@ -353,6 +479,7 @@ class ToolsConfig(Base):
 
     web: WebToolsConfig = Field(default_factory=WebToolsConfig)
     exec: ExecToolConfig = Field(default_factory=ExecToolConfig)
+    http: HttpPoolConfig = Field(default_factory=HttpPoolConfig)
     restrict_to_workspace: bool = False  # If true, restrict all tool access to workspace directory
     mcp_servers: dict[str, MCPServerConfig] = Field(default_factory=dict)
 
@@ -366,6 +493,7 @@ class Config(BaseSettings):
     channels: ChannelsConfig = Field(default_factory=ChannelsConfig)
     providers: ProvidersConfig = Field(default_factory=ProvidersConfig)
     gateway: GatewayConfig = Field(default_factory=GatewayConfig)
+    sessions: SessionsConfig = Field(default_factory=SessionsConfig)
     tools: ToolsConfig = Field(default_factory=ToolsConfig)
 
     @property
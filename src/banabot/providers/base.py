@@ -1,9 +1,12 @@
 """Base LLM provider interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
+import json_repair
+
 
 @dataclass
 class ToolCallRequest:
@@ -30,6 +33,46 @@ class LLMResponse:
         return len(self.tool_calls) > 0
 
 
+@dataclass
+class StreamChunk:
+    """
+    One step of a streamed completion.
+
+    Intermediate chunks carry a text ``delta``; the last chunk carries the
+    assembled ``response`` (full content, tool calls, usage).
+    """
+
+    delta: str = ""
+    response: LLMResponse | None = None
+
+
+def parse_usage(usage: Any) -> dict[str, int]:
+    """
+    Normalize an OpenAI-style usage object.
+
+    Besides prompt/completion/total tokens, records ``cached_tokens`` (prompt
+    tokens read from the provider's prompt cache) and ``cache_creation_tokens``
+    (tokens written to it, Anthropic only) when the provider reports them.
+    """
+    if not usage:
+        return {}
+    result = {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) or getattr(
+        usage, "cache_read_input_tokens", None
+    )
+    if cached:
+        result["cached_tokens"] = cached
+    created = getattr(usage, "cache_creation_input_tokens", None)
+    if created:
+        result["cache_creation_tokens"] = created
+    return result
+
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -66,7 +109,90 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Send a chat completion request and yield the answer as it is generated.
+
+        Providers without native streaming fall back to ``chat`` and yield the
+        whole content as a single delta. The last chunk always carries the
+        complete ``LLMResponse``.
+        """
+        response = await self.chat(
+            messages=messages,
+            tools=tools,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        if response.content and response.finish_reason != "error":
+            yield StreamChunk(delta=response.content)
+        yield StreamChunk(response=response)
+
     @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model for this provider."""
         pass
+
+
+class StreamAssembler:
+    """Accumulates OpenAI-style streaming chunks into an ``LLMResponse``."""
+
+    def __init__(self):
+        self._content: list[str] = []
+        self._reasoning: list[str] = []
+        self._tool_calls: dict[int, dict[str, str]] = {}
+        self.finish_reason = "stop"
+        self.usage: dict[str, int] = {}
+
+    def add(self, chunk: Any) -> str:
+        """Fold one chunk in and return its text delta."""
+        if usage := getattr(chunk, "usage", None):
+            self.usage = parse_usage(usage)
+        if not chunk.choices:
+            return ""
+        choice = chunk.choices[0]
+        if choice.finish_reason:
+            self.finish_reason = choice.finish_reason
+        delta = choice.delta
+        if delta is None:
+            return ""
+        if reasoning := getattr(delta, "reasoning_content", None):
+            self._reasoning.append(reasoning)
+        for tc in getattr(delta, "tool_calls", None) or []:
+            # Tool calls arrive in fragments keyed by index; id and name come first.
+            buf = self._tool_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+            if tc.id:
+                buf["id"] = tc.id
+            if tc.function and tc.function.name:
+                buf["name"] = tc.function.name
+            if tc.function and tc.function.arguments:
+                buf["arguments"] += tc.function.arguments
+        text = delta.content or ""
+        if text:
+            self._content.append(text)
+        return text
+
+    def response(self) -> LLMResponse:
+        """The complete response assembled so far."""
+        tool_calls = [
+            ToolCallRequest(
+                id=buf["id"],
+                name=buf["name"],
+                arguments=json_repair.loads(buf["arguments"]) if buf["arguments"] else {},
+            )
+            for _, buf in sorted(self._tool_calls.items())
+        ]
+        return LLMResponse(
+            content="".join(self._content) or None,
+            tool_calls=tool_calls,
+            finish_reason=self.finish_reason,
+            usage=self.usage,
+            reasoning_content="".join(self._reasoning) or None,
+        )
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 import json_repair
 from openai import AsyncOpenAI
 
-from banabot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from banabot.providers.base import (
+    LLMProvider,
+    LLMResponse,
+    StreamAssembler,
+    StreamChunk,
+    ToolCallRequest,
+    parse_usage,
+)
 
 
 class CustomProvider(LLMProvider):
@@ -29,6 +37,42 @@ class CustomProvider(LLMProvider):
         max_tokens: int = 4096,
         temperature: float = 0.7,
     ) -> LLMResponse:
+        kwargs = self._build_kwargs(messages, tools, model, max_tokens, temperature)
+        try:
+            return self._parse(await self._client.chat.completions.create(**kwargs))
+        except Exception as e:
+            return LLMResponse(content=f"Error: {e}", finish_reason="error")
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[StreamChunk]:
+        kwargs = self._build_kwargs(messages, tools, model, max_tokens, temperature)
+        assembler = StreamAssembler()
+        try:
+            stream = await self._client.chat.completions.create(
+                **kwargs, stream=True, stream_options={"include_usage": True}
+            )
+            async for chunk in stream:
+                if delta := assembler.add(chunk):
+                    yield StreamChunk(delta=delta)
+        except Exception as e:
+            yield StreamChunk(response=LLMResponse(content=f"Error: {e}", finish_reason="error"))
+            return
+        yield StreamChunk(response=assembler.response())
+
+    def _build_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
         kwargs: dict[str, Any] = {
             "model": model or self.default_model,
             "messages": messages,
@@ -37,10 +81,7 @@ class CustomProvider(LLMProvider):
         }
         if tools:
             kwargs.update(tools=tools, tool_choice="auto")
-        try:
-            return self._parse(await self._client.chat.completions.create(**kwargs))
-        except Exception as e:
-            return LLMResponse(content=f"Error: {e}", finish_reason="error")
+        return kwargs
 
     def _parse(self, response: Any) -> LLMResponse:
         choice = response.choices[0]
@@ -55,18 +96,11 @@ class CustomProvider(LLMProvider):
             )
             for tc in (msg.tool_calls or [])
         ]
-        u = response.usage
         return LLMResponse(
             content=msg.content,
             tool_calls=tool_calls,
             finish_reason=choice.finish_reason or "stop",
-            usage={
-                "prompt_tokens": u.prompt_tokens,
-                "completion_tokens": u.completion_tokens,
-                "total_tokens": u.total_tokens,
-            }
-            if u
-            else {},
+            usage=parse_usage(response.usage),
             reasoning_content=getattr(msg, "reasoning_content", None),
         )
 
@@ -1,13 +1,21 @@
 """LiteLLM provider implementation for multi-provider support."""
 
 import os
+from collections.abc import AsyncIterator
 from typing import Any
 
 import json_repair
 import litellm
 from litellm import acompletion
 
-from banabot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from banabot.providers.base import (
+    LLMProvider,
+    LLMResponse,
+    StreamAssembler,
+    StreamChunk,
+    ToolCallRequest,
+    parse_usage,
+)
 from banabot.providers.registry import find_by_model, find_gateway
 
 
@@ -134,12 +142,62 @@ class LiteLLMProvider(LLMProvider):
         Returns:
             LLMResponse with content and/or tool calls.
         """
+        kwargs = self._build_kwargs(messages, tools, model, max_tokens, temperature)
+        try:
+            response = await acompletion(**kwargs)
+            return self._parse_response(response)
+        except Exception as e:
+            # Return error as content for graceful handling
+            return LLMResponse(
+                content=f"Error calling LLM: {str(e)}",
+                finish_reason="error",
+            )
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a chat completion via LiteLLM, yielding text deltas then the full response."""
+        kwargs = self._build_kwargs(messages, tools, model, max_tokens, temperature)
+        kwargs["stream"] = True
+        kwargs["stream_options"] = {"include_usage": True}
+
+        assembler = StreamAssembler()
+        try:
+            async for chunk in await acompletion(**kwargs):
+                if delta := assembler.add(chunk):
+                    yield StreamChunk(delta=delta)
+        except Exception as e:
+            yield StreamChunk(
+                response=LLMResponse(content=f"Error calling LLM: {str(e)}", finish_reason="error")
+            )
+            return
+        yield StreamChunk(response=assembler.response())
+
+    def _build_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
+        """Build ``acompletion`` arguments shared by ``chat`` and ``chat_stream``."""
         model = self._resolve_model(model or self.default_model)
 
         # Clamp max_tokens to at least 1 — negative or zero values cause
         # LiteLLM to reject the request with "max_tokens must be at least 1".
         max_tokens = max(1, max_tokens)
 
+        spec = find_by_model(model)
+        is_local = bool(self._gateway and self._gateway.is_local)
+        if spec and spec.supports_prompt_caching and not is_local:
+            messages = self._apply_cache_control(messages)
+
         kwargs: dict[str, Any] = {
             "model": model,
             "messages": messages,
@@ -166,15 +224,34 @@ class LiteLLMProvider(LLMProvider):
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
 
-        try:
-            response = await acompletion(**kwargs)
-            return self._parse_response(response)
-        except Exception as e:
-            # Return error as content for graceful handling
-            return LLMResponse(
-                content=f"Error calling LLM: {str(e)}",
-                finish_reason="error",
-            )
+        return kwargs
+
+    @staticmethod
+    def _apply_cache_control(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Mark prompt-cache breakpoints for providers that need them explicitly.
+
+        Breakpoints go on the system prompt (caching tools + system) and on the
+        last user message (caching the conversation so far for the following
+        tool iterations and turns). The caller's messages are not modified.
+        """
+        marked = list(messages)
+        targets = [i for i, m in enumerate(marked) if m.get("role") == "system"][:1]
+        users = [i for i, m in enumerate(marked) if m.get("role") == "user"]
+        if users:
+            targets.append(users[-1])
+
+        for i in targets:
+            content = marked[i].get("content")
+            if isinstance(content, str) and content:
+                blocks = [{"type": "text", "text": content}]
+            elif isinstance(content, list) and content and isinstance(content[-1], dict):
+                blocks = [dict(block) for block in content]
+            else:
+                continue
+            blocks[-1]["cache_control"] = {"type": "ephemeral"}
+            marked[i] = {**marked[i], "content": blocks}
+        return marked
 
     def _parse_response(self, response: Any) -> LLMResponse:
         """Parse LiteLLM response into our standard format."""
@@ -197,13 +274,7 @@ class LiteLLMProvider(LLMProvider):
                     )
                 )
 
-        usage = {}
-        if hasattr(response, "usage") and response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
+        usage = parse_usage(getattr(response, "usage", None))
 
         reasoning_content = getattr(message, "reasoning_content", None)
 
@@ -5,13 +5,14 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+from collections.abc import AsyncIterator
 from typing import Any, AsyncGenerator
 
 import httpx
 from loguru import logger
 from oauth_cli_kit import get_token as get_codex_token
 
-from banabot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from banabot.providers.base import LLMProvider, LLMResponse, StreamChunk, ToolCallRequest
 
 DEFAULT_CODEX_URL = "https://chatgpt.com/backend-api/codex/responses"
 DEFAULT_ORIGINATOR = "banabot"
@@ -32,6 +33,20 @@ class OpenAICodexProvider(LLMProvider):
         max_tokens: int = 4096,
         temperature: float = 0.7,
     ) -> LLMResponse:
+        response = LLMResponse(content=None)
+        async for chunk in self.chat_stream(messages, tools, model, max_tokens, temperature):
+            if chunk.response is not None:
+                response = chunk.response
+        return response
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[StreamChunk]:
         model = model or self.default_model
         system_prompt, input_items = _convert_messages(messages)
 
@@ -46,7 +61,7 @@ class OpenAICodexProvider(LLMProvider):
             "input": input_items,
             "text": {"verbosity": "medium"},
             "include": ["reasoning.encrypted_content"],
-            "prompt_cache_key": _prompt_cache_key(messages),
+            "prompt_cache_key": _prompt_cache_key(system_prompt, tools),
             "tool_choice": "auto",
             "parallel_tool_calls": True,
         }
@@ -55,30 +70,27 @@ class OpenAICodexProvider(LLMProvider):
             body["tools"] = _convert_tools(tools)
 
         url = DEFAULT_CODEX_URL
+        streamed = False
 
         try:
             try:
-                content, tool_calls, finish_reason = await _request_codex(
-                    url, headers, body, verify=True
-                )
+                async for chunk in _request_codex(url, headers, body, verify=True):
+                    streamed = streamed or bool(chunk.delta)
+                    yield chunk
             except Exception as e:
-                if "CERTIFICATE_VERIFY_FAILED" not in str(e):
+                if streamed or "CERTIFICATE_VERIFY_FAILED" not in str(e):
                     raise
                 logger.warning(
                     "SSL certificate verification failed for Codex API; retrying with verify=False"
                 )
-                content, tool_calls, finish_reason = await _request_codex(
-                    url, headers, body, verify=False
-                )
-            return LLMResponse(
-                content=content,
-                tool_calls=tool_calls,
-                finish_reason=finish_reason,
-            )
+                async for chunk in _request_codex(url, headers, body, verify=False):
+                    yield chunk
         except Exception as e:
-            return LLMResponse(
-                content=f"Error calling Codex: {str(e)}",
-                finish_reason="error",
+            yield StreamChunk(
+                response=LLMResponse(
+                    content=f"Error calling Codex: {str(e)}",
+                    finish_reason="error",
+                )
             )
 
     def get_default_model(self) -> str:
@@ -108,7 +120,7 @@ async def _request_codex(
     headers: dict[str, str],
     body: dict[str, Any],
     verify: bool,
-) -> tuple[str, list[ToolCallRequest], str]:
+) -> AsyncGenerator[StreamChunk, None]:
     async with httpx.AsyncClient(timeout=60.0, verify=verify) as client:
         async with client.stream("POST", url, headers=headers, json=body) as response:
             if response.status_code != 200:
@@ -116,7 +128,8 @@ async def _request_codex(
                 raise RuntimeError(
                     _friendly_error(response.status_code, text.decode("utf-8", "ignore"))
                 )
-            return await _consume_sse(response)
+            async for chunk in _consume_sse(response):
+                yield chunk
 
 
 def _convert_tools(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -227,8 +240,10 @@ def _split_tool_call_id(tool_call_id: Any) -> tuple[str, str | None]:
     return "call_0", None
 
 
-def _prompt_cache_key(messages: list[dict[str, Any]]) -> str:
-    raw = json.dumps(messages, ensure_ascii=True, sort_keys=True)
+def _prompt_cache_key(system_prompt: str, tools: list[dict[str, Any]] | None) -> str:
+    # Key on the stable prefix (instructions + tools) so requests sharing it are
+    # routed to the same cache; hashing the whole conversation never repeats.
+    raw = json.dumps([system_prompt, tools or []], ensure_ascii=True, sort_keys=True)
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
@@ -252,11 +267,13 @@ async def _iter_sse(response: httpx.Response) -> AsyncGenerator[dict[str, Any],
         buffer.append(line)
 
 
-async def _consume_sse(response: httpx.Response) -> tuple[str, list[ToolCallRequest], str]:
+async def _consume_sse(response: httpx.Response) -> AsyncGenerator[StreamChunk, None]:
+    """Yield text deltas as they arrive, then the assembled response."""
     content = ""
     tool_calls: list[ToolCallRequest] = []
     tool_call_buffers: dict[str, dict[str, Any]] = {}
     finish_reason = "stop"
+    usage: dict[str, int] = {}
 
     async for event in _iter_sse(response):
         event_type = event.get("type")
@@ -272,7 +289,9 @@ async def _consume_sse(response: httpx.Response) -> tuple[str, list[ToolCallRequ
                     "arguments": item.get("arguments") or "",
                 }
         elif event_type == "response.output_text.delta":
-            content += event.get("delta") or ""
+            if delta := event.get("delta"):
+                content += delta
+                yield StreamChunk(delta=delta)
         elif event_type == "response.function_call_arguments.delta":
             call_id = event.get("call_id")
             if call_id and call_id in tool_call_buffers:
@@ -303,10 +322,33 @@ async def _consume_sse(response: httpx.Response) -> tuple[str, list[ToolCallRequ
         elif event_type == "response.completed":
             status = (event.get("response") or {}).get("status")
             finish_reason = _map_finish_reason(status)
+            usage = _convert_usage((event.get("response") or {}).get("usage"))
         elif event_type in {"error", "response.failed"}:
             raise RuntimeError("Codex response failed")
 
-    return content, tool_calls, finish_reason
+    yield StreamChunk(
+        response=LLMResponse(
+            content=content,
+            tool_calls=tool_calls,
+            finish_reason=finish_reason,
+            usage=usage,
+        )
+    )
+
+
+def _convert_usage(usage: dict[str, Any] | None) -> dict[str, int]:
+    """Map Responses API usage to the chat-completions style keys used elsewhere."""
+    if not usage:
+        return {}
+    result = {
+        "prompt_tokens": usage.get("input_tokens") or 0,
+        "completion_tokens": usage.get("output_tokens") or 0,
+        "total_tokens": usage.get("total_tokens") or 0,
+    }
+    cached = (usage.get("input_tokens_details") or {}).get("cached_tokens")
+    if cached:
+        result["cached_tokens"] = cached
+    return result
 
 
 _FINISH_REASON_MAP = {
@@ -1,5 +1,6 @@
 """Session management module."""
 
-from banabot.session.manager import Session, SessionManager
+from banabot.session.manager import PagedMessages, Session, SessionManager
+from banabot.session.store import JsonlSessionStore, SessionStore
 
-__all__ = ["SessionManager", "Session"]
+__all__ = ["SessionManager", "Session", "PagedMessages", "SessionStore", "JsonlSessionStore"]
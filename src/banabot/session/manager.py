@@ -1,14 +1,112 @@
 """Session management for conversation history."""
 
-import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableSequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, overload
 
 from loguru import logger
 
-from banabot.utils.helpers import ensure_dir, safe_filename
+from banabot.utils.helpers import ensure_dir
+
+if TYPE_CHECKING:
+    from banabot.session.store import SessionStore
+
+
+class PagedMessages(MutableSequence[dict[str, Any]]):
+    """
+    Session message list whose oldest entries stay on disk until accessed.
+
+    Only the tail is materialized on load; indexing or slicing below the loaded
+    range pages older messages in through ``load_older``, which returns the next
+    older chunk in chronological order. Indices always refer to the full history.
+    """
+
+    def __init__(
+        self,
+        tail: list[dict[str, Any]],
+        total: int,
+        load_older: Callable[[], list[dict[str, Any]]],
+    ):
+        self._tail = tail
+        self._base = total - len(tail)
+        self._load_older = load_older
+
+    @property
+    def loaded(self) -> int:
+        """Number of messages currently held in memory."""
+        return len(self._tail)
+
+    def _page_in(self, index: int) -> None:
+        while self._base > max(index, 0):
+            chunk = self._load_older()
+            if not chunk:
+                raise RuntimeError("Session file is shorter than its recorded message count")
+            chunk = chunk[-self._base :]
+            self._tail[:0] = chunk
+            self._base -= len(chunk)
+
+    def _index(self, index: int) -> int:
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("message index out of range")
+        self._page_in(index)
+        return index - self._base
+
+    def __len__(self) -> int:
+        return self._base + len(self._tail)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            if not indices:
+                return []
+            self._page_in(min(indices))
+            return [self._tail[i - self._base] for i in indices]
+        return self._tail[self._index(index)]
+
+    def __setitem__(self, index, value) -> None:
+        self._page_in(0)
+        self._tail[index] = value
+
+    def __delitem__(self, index) -> None:
+        self._page_in(0)
+        del self._tail[index]
+
+    def insert(self, index: int, value: dict[str, Any]) -> None:
+        self._page_in(0)
+        self._tail.insert(index, value)
+
+    def append(self, value: dict[str, Any]) -> None:
+        self._tail.append(value)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        self._page_in(0)
+        return iter(self._tail)
+
+    def copy(self) -> list[dict[str, Any]]:
+        """Materialize the full history as a plain list."""
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, PagedMessages)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PagedMessages(total={len(self)}, loaded={self.loaded})"
 
 
 @dataclass
@@ -24,12 +122,26 @@ class Session:
     """
 
     key: str  # channel:chat_id
-    messages: list[dict[str, Any]] = field(default_factory=list)
+    messages: list[dict[str, Any]] | PagedMessages = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
     last_consolidated: int = 0  # Number of messages already consolidated to files
 
+    # Persistence bookkeeping, managed by SessionManager. _flushed is the number of
+    # messages already on disk (None = file must be rewritten); _appends counts
+    # incremental writes since the last full rewrite; _nbytes approximates the
+    # serialized size for cache accounting.
+    _flushed: int | None = field(default=None, init=False, repr=False, compare=False)
+    _flushed_last: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _flushed_state: tuple[int, datetime] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _appends: int = field(default=0, init=False, repr=False, compare=False)
+    _nbytes: int = field(default=0, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
@@ -56,30 +168,51 @@ class Session:
         self.messages = []
         self.last_consolidated = 0
         self.updated_at = datetime.now()
+        self._flushed = None
 
 
 class SessionManager:
     """
     Manages conversation sessions.
 
-    Sessions are stored as JSONL files in the sessions directory.
+    Persistence is delegated to a ``SessionStore`` (JSONL files in the sessions
+    directory by default, see ``banabot.session.store``; SQLite in
+    ``banabot.session.sqlite_store``).
+
+    Loaded sessions are kept in an LRU cache bounded by count, approximate size
+    and idle time. Evicted sessions are flushed first if they have unsaved
+    changes and are reloaded transparently by ``get_or_create``. Sessions
+    with work in flight are pinned (``in_use``) and never evicted, so that
+    work keeps updating the cached object instead of an orphaned copy.
     """
 
-    def __init__(self, workspace: Path):
+    def __init__(
+        self,
+        workspace: Path,
+        compact_every: int = 100,
+        max_cached: int = 256,
+        max_cached_bytes: int = 64 * 1024 * 1024,
+        max_idle_seconds: float = 3600,
+        tail_messages: int = 100,
+        store: "SessionStore | None" = None,
+    ):
+        from banabot.session.store import JsonlSessionStore
+
         self.workspace = workspace
+        self.max_cached = max_cached
+        self.max_cached_bytes = max_cached_bytes
+        self.max_idle_seconds = max_idle_seconds
         self.sessions_dir = ensure_dir(self.workspace / "sessions")
-        self.legacy_sessions_dir = Path.home() / ".banabot" / "sessions"
-        self._cache: dict[str, Session] = {}
-
-    def _get_session_path(self, key: str) -> Path:
-        """Get the file path for a session."""
-        safe_key = safe_filename(key.replace(":", "_"))
-        return self.sessions_dir / f"{safe_key}.jsonl"
-
-    def _get_legacy_session_path(self, key: str) -> Path:
-        """Legacy global session path (~/.banabot/sessions/)."""
-        safe_key = safe_filename(key.replace(":", "_"))
-        return self.legacy_sessions_dir / f"{safe_key}.jsonl"
+        self.store = store or JsonlSessionStore(
+            self.sessions_dir, compact_every=compact_every, tail_messages=tail_messages
+        )
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        self._last_access: dict[str, float] = {}
+        self._pinned: dict[str, int] = {}
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def get_or_create(self, key: str) -> Session:
         """
@@ -92,113 +225,143 @@ class SessionManager:
             The session.
         """
         if key in self._cache:
-            return self._cache[key]
+            self._hits += 1
+            session = self._cache[key]
+            self._touch(session)
+            return session
 
-        session = self._load(key)
+        self._misses += 1
+        session = self.store.load(key)
         if session is None:
             session = Session(key=key)
 
-        self._cache[key] = session
+        self._touch(session)
         return session
 
-    def _load(self, key: str) -> Session | None:
-        """Load a session from disk."""
-        path = self._get_session_path(key)
-        if not path.exists():
-            legacy_path = self._get_legacy_session_path(key)
-            if legacy_path.exists():
-                import shutil
-
-                shutil.move(str(legacy_path), str(path))
-                logger.info(f"Migrated session {key} from legacy path")
-
-        if not path.exists():
-            return None
-
+    def _touch(self, session: Session) -> None:
+        """Insert or refresh a session in the LRU, then enforce the cache bounds."""
+        key = session.key
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._cached_bytes -= old._nbytes
+        self._cache[key] = session
+        self._cached_bytes += session._nbytes
+        self._last_access[key] = time.monotonic()
+        self._evict(keep=key)
+
+    def _evict(self, keep: str | None = None) -> None:
+        """Drop idle and least recently used sessions beyond the configured bounds."""
+        cutoff = time.monotonic() - self.max_idle_seconds
+        for key in list(self._cache):
+            over = len(self._cache) > self.max_cached or self._cached_bytes > self.max_cached_bytes
+            if not over and self._last_access.get(key, 0) > cutoff:
+                break
+            if key == keep or key in self._pinned:
+                continue
+            session = self._cache[key]
+            if self.is_dirty(session):
+                try:
+                    self.save(session, _touch=False)
+                except Exception as e:
+                    logger.warning(f"Failed to flush session {key} before eviction: {e}")
+            self._drop(key)
+            self._evictions += 1
+
+    def pin(self, key: str) -> None:
+        """Keep a session cached until a matching ``unpin`` (pins are counted)."""
+        self._pinned[key] = self._pinned.get(key, 0) + 1
+
+    def unpin(self, key: str) -> None:
+        """Release one pin; the session becomes evictable once none are left."""
+        count = self._pinned.get(key, 0) - 1
+        if count > 0:
+            self._pinned[key] = count
+        else:
+            self._pinned.pop(key, None)
+
+    @contextmanager
+    def in_use(self, key: str) -> Iterator[None]:
+        """Pin a session for the duration of a block."""
+        self.pin(key)
+        try:
+            yield
+        finally:
+            self.unpin(key)
+
+    def _drop(self, key: str) -> None:
+        session = self._cache.pop(key, None)
+        self._last_access.pop(key, None)
+        if session is not None:
+            self._cached_bytes -= session._nbytes
+
+    def is_dirty(self, session: Session) -> bool:
+        """Whether a session has changes not yet written to the store."""
+        from banabot.session.store import can_append
+
+        if session._flushed is None:
+            # Never saved (or cleared): only worth writing if there is something to record
+            return bool(session.messages) or self.store.exists(session.key)
+        return (
+            not can_append(session)
+            or session._flushed != len(session.messages)
+            or session._flushed_state != (session.last_consolidated, session.updated_at)
+        )
+
+    def flush(self) -> None:
+        """Write every cached session with unsaved changes (e.g. at shutdown)."""
+        for session in list(self._cache.values()):
+            if self.is_dirty(session):
+                try:
+                    self.save(session, _touch=False)
+                except Exception as e:
+                    logger.warning(f"Failed to flush session {session.key}: {e}")
+        self.store.flush()
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Session cache counters: hits, misses, evictions, size and approximate bytes."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._cache),
+            "bytes": self._cached_bytes,
+        }
+
+    def save(self, session: Session, _touch: bool = True) -> None:
+        """Save a session, writing only what changed since the last save."""
+        before = session._nbytes
         try:
-            messages = []
-            metadata = {}
-            created_at = None
-            last_consolidated = 0
-
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    data = json.loads(line)
-
-                    if data.get("_type") == "metadata":
-                        metadata = data.get("metadata", {})
-                        created_at = (
-                            datetime.fromisoformat(data["created_at"])
-                            if data.get("created_at")
-                            else None
-                        )
-                        last_consolidated = data.get("last_consolidated", 0)
-                    else:
-                        messages.append(data)
-
-            return Session(
-                key=key,
-                messages=messages,
-                created_at=created_at or datetime.now(),
-                metadata=metadata,
-                last_consolidated=last_consolidated,
-            )
-        except Exception as e:
-            logger.warning(f"Failed to load session {key}: {e}")
-            return None
-
-    def save(self, session: Session) -> None:
-        """Save a session to disk."""
-        path = self._get_session_path(session.key)
-
-        with open(path, "w") as f:
-            metadata_line = {
-                "_type": "metadata",
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata,
-                "last_consolidated": session.last_consolidated,
-            }
-            f.write(json.dumps(metadata_line) + "\n")
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
-
-        self._cache[session.key] = session
+            self.store.save(session)
+        except Exception:
+            session._flushed = None  # Unknown stored state: rewrite next time
+            raise
+        self._account(session, before)
+
+        if _touch:
+            self._touch(session)
+
+    def compact(self, session: Session) -> None:
+        """Rewrite a session's storage, dropping superseded records."""
+        before = session._nbytes
+        self.store.compact(session)
+        self._account(session, before)
+        self._touch(session)
+
+    def _account(self, session: Session, before: int) -> None:
+        """Apply a change in a cached session's size estimate to the cache total."""
+        if self._cache.get(session.key) is session:
+            self._cached_bytes += session._nbytes - before
 
     def invalidate(self, key: str) -> None:
         """Remove a session from the in-memory cache."""
-        self._cache.pop(key, None)
+        self._drop(key)
 
-    def list_sessions(self) -> list[dict[str, Any]]:
+    def list_sessions(self, limit: int | None = None) -> list[dict[str, Any]]:
         """
-        List all sessions.
+        List sessions, most recently updated first.
 
         Returns:
             List of session info dicts.
         """
-        sessions = []
-
-        for path in self.sessions_dir.glob("*.jsonl"):
-            try:
-                # Read just the metadata line
-                with open(path) as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        data = json.loads(first_line)
-                        if data.get("_type") == "metadata":
-                            sessions.append(
-                                {
-                                    "key": path.stem.replace("_", ":"),
-                                    "created_at": data.get("created_at"),
-                                    "updated_at": data.get("updated_at"),
-                                    "path": str(path),
-                                }
-                            )
-            except Exception:
-                continue
-
-        return sorted(sessions, key=lambda x: x.get("updated_at", ""), reverse=True)
+        return self.store.list_sessions(limit=limit)
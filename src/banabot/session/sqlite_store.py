@@ -0,0 +1,173 @@
+"""SQLite session storage backend."""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from banabot.session.manager import PagedMessages, Session
+from banabot.session.store import SessionStore, can_append, mark_flushed, tail_size
+
+
+class SqliteSessionStore(SessionStore):
+    """
+    All sessions in one SQLite database (WAL mode).
+
+    Session metadata lives in ``sessions`` with an index on ``updated_at`` so
+    listings are an index scan; messages are rows keyed by ``(session_key, seq)``.
+    A save inserts only the new rows in a single transaction, and commits are
+    grouped every ``commit_every`` saves (``flush`` commits the remainder).
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: Path,
+        tail_messages: int = 100,
+        commit_every: int = 1,
+        page_size: int = 500,
+    ):
+        self.db_path = db_path
+        self.tail_messages = tail_messages
+        self.commit_every = max(1, commit_every)
+        self.page_size = page_size
+        self._pending = 0
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(db_path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize SQLite schema."""
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                key TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                metadata TEXT NOT NULL DEFAULT '{}',
+                last_consolidated INTEGER NOT NULL DEFAULT 0,
+                message_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at);
+            CREATE TABLE IF NOT EXISTS messages (
+                session_key TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (session_key, seq)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._db.commit()
+
+    def exists(self, key: str) -> bool:
+        row = self._db.execute("SELECT 1 FROM sessions WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def _fetch(self, key: str, start: int, stop: int) -> list[str]:
+        rows = self._db.execute(
+            "SELECT data FROM messages WHERE session_key = ? AND seq >= ? AND seq < ? ORDER BY seq",
+            (key, start, stop),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def load(self, key: str) -> Session | None:
+        row = self._db.execute(
+            "SELECT created_at, updated_at, metadata, last_consolidated, message_count "
+            "FROM sessions WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        created_at, updated_at, metadata, last_consolidated, count = row
+
+        base = count - tail_size(count, last_consolidated, self.tail_messages)
+        raw = self._fetch(key, base, count)
+        tail = [json.loads(data) for data in raw]
+        loaded_from = base
+
+        def _load_older() -> list[dict[str, Any]]:
+            nonlocal loaded_from
+            start = max(0, loaded_from - self.page_size)
+            older = [json.loads(data) for data in self._fetch(key, start, loaded_from)]
+            loaded_from = start
+            return older
+
+        session = Session(
+            key=key,
+            messages=tail if base == 0 else PagedMessages(tail, count, _load_older),
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            metadata=json.loads(metadata),
+            last_consolidated=last_consolidated,
+        )
+        session._nbytes = sum(len(data) for data in raw)
+        mark_flushed(session)
+        return session
+
+    def save(self, session: Session) -> None:
+        key = session.key
+        append = can_append(session)
+        start = (session._flushed or 0) if append else 0
+        # Serialize first: a paged session may still need to read older rows
+        rows = [(key, start + i, json.dumps(msg)) for i, msg in enumerate(session.messages[start:])]
+        if not append:
+            self._db.execute("DELETE FROM messages WHERE session_key = ?", (key,))
+            session._nbytes = 0
+        self._db.executemany(
+            "INSERT OR REPLACE INTO messages (session_key, seq, data) VALUES (?, ?, ?)", rows
+        )
+        self._db.execute(
+            "INSERT INTO sessions "
+            "(key, created_at, updated_at, metadata, last_consolidated, message_count) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET updated_at = excluded.updated_at, "
+            "metadata = excluded.metadata, last_consolidated = excluded.last_consolidated, "
+            "message_count = excluded.message_count",
+            (
+                key,
+                session.created_at.isoformat(),
+                session.updated_at.isoformat(),
+                json.dumps(session.metadata),
+                session.last_consolidated,
+                len(session.messages),
+            ),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+        mark_flushed(session)
+        session._nbytes += sum(len(row[2]) for row in rows)
+
+    def list_sessions(self, limit: int | None = None) -> list[dict[str, Any]]:
+        rows = self._db.execute(
+            "SELECT key, created_at, updated_at, message_count FROM sessions "
+            "ORDER BY updated_at DESC LIMIT ?",
+            (-1 if limit is None else limit,),
+        ).fetchall()
+        return [
+            {
+                "key": key,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "message_count": count,
+                "path": str(self.db_path),
+            }
+            for key, created_at, updated_at, count in rows
+        ]
+
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def flush(self) -> None:
+        self._db.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
@@ -0,0 +1,413 @@
+"""Pluggable storage backends for conversation sessions."""
+
+import json
+import os
+import shutil
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from banabot.session.manager import PagedMessages, Session
+from banabot.utils.helpers import ensure_dir, safe_filename
+
+
+def mark_flushed(session: Session) -> None:
+    """Record that the session's current state is what the store holds."""
+    session._flushed = len(session.messages)
+    session._flushed_last = session.messages[-1] if session.messages else None
+    session._flushed_state = (session.last_consolidated, session.updated_at)
+
+
+def can_append(session: Session) -> bool:
+    """True if the stored messages are a prefix of the session's messages."""
+    n = session._flushed
+    if n is None or n > len(session.messages):
+        return False
+    return n == 0 or session.messages[n - 1] is session._flushed_last
+
+
+def _parse_time(value: str | None) -> datetime:
+    return datetime.fromisoformat(value) if value else datetime.now()
+
+
+def tail_size(count: int, last_consolidated: int, tail_messages: int) -> int:
+    """How many trailing messages to materialize on load."""
+    return min(count, max(tail_messages, count - last_consolidated, 1))
+
+
+class SessionStore(ABC):
+    """
+    Abstract storage backend used by SessionManager.
+
+    Stores persist incrementally using the bookkeeping fields on Session
+    (see ``mark_flushed``/``can_append``) and keep ``Session._nbytes`` as an
+    approximate in-memory size for cache accounting.
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    def load(self, key: str) -> Session | None:
+        """Load a session, or return None if it does not exist."""
+        pass
+
+    @abstractmethod
+    def save(self, session: Session) -> None:
+        """Persist a session, writing only what changed when possible."""
+        pass
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Whether the store holds a session with this key."""
+        pass
+
+    @abstractmethod
+    def list_sessions(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List sessions, most recently updated first."""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored sessions."""
+        pass
+
+    def compact(self, session: Session) -> None:
+        """Rewrite a session's storage in its most compact form."""
+        self.save(session)
+
+    def flush(self) -> None:
+        """Make buffered writes durable."""
+        pass
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+        pass
+
+
+class _ReverseJsonlReader:
+    """Reads the JSON records of a JSONL file from the end towards the start."""
+
+    def __init__(self, path: Path, block_size: int = 64 * 1024):
+        self.path = path
+        self.block_size = block_size
+        self.pos = path.stat().st_size
+        self.bytes_read = 0
+        self._partial = b""
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the start of the file has been reached."""
+        return self.pos <= 0 and not self._partial
+
+    def read_block(self) -> list[dict[str, Any]] | None:
+        """Return the next older block of records, newest first (None at file start)."""
+        if self.exhausted:
+            return None
+        step = min(self.block_size, self.pos)
+        self.pos -= step
+        with open(self.path, "rb") as f:
+            f.seek(self.pos)
+            data = f.read(step) + self._partial
+        self.bytes_read += step
+        lines = data.split(b"\n")
+        # The first piece may be the tail of a line that starts in an older block
+        self._partial = lines.pop(0) if self.pos > 0 else b""
+        return [json.loads(line) for line in reversed(lines) if line.strip()]
+
+
+class JsonlSessionStore(SessionStore):
+    """
+    One JSONL file per session.
+
+    The first line is a metadata record; saves append only the new messages
+    followed by a fresh metadata trailer (the last metadata record wins on
+    load). After ``compact_every`` incremental saves the file is rewritten via a
+    temp file and an atomic rename.
+
+    Loading reads the file backwards from the trailer and materializes only the
+    last ``tail_messages`` messages plus the unconsolidated window; older history
+    is paged in on demand (see ``PagedMessages``).
+    """
+
+    name = "jsonl"
+
+    def __init__(
+        self,
+        sessions_dir: Path,
+        compact_every: int = 100,
+        tail_messages: int = 100,
+        legacy_dir: Path | None = None,
+    ):
+        self.sessions_dir = ensure_dir(sessions_dir)
+        self.compact_every = compact_every
+        self.tail_messages = tail_messages
+        self.legacy_dir = legacy_dir or Path.home() / ".banabot" / "sessions"
+
+    def path_for(self, key: str) -> Path:
+        """Get the file path for a session."""
+        safe_key = safe_filename(key.replace(":", "_"))
+        return self.sessions_dir / f"{safe_key}.jsonl"
+
+    def _legacy_path_for(self, key: str) -> Path:
+        """Legacy global session path (~/.banabot/sessions/)."""
+        safe_key = safe_filename(key.replace(":", "_"))
+        return self.legacy_dir / f"{safe_key}.jsonl"
+
+    def exists(self, key: str) -> bool:
+        return self.path_for(key).exists()
+
+    def load(self, key: str) -> Session | None:
+        path = self.path_for(key)
+        if not path.exists():
+            legacy_path = self._legacy_path_for(key)
+            if legacy_path.exists():
+                shutil.move(str(legacy_path), str(path))
+                logger.info(f"Migrated session {key} from legacy path")
+
+        if not path.exists():
+            return None
+
+        try:
+            session = self._load_tail(key, path)
+        except Exception as e:
+            logger.debug(f"Tail load of session {key} failed, reading full file: {e}")
+            session = None
+        return session or self._load_full(key, path)
+
+    def _load_tail(self, key: str, path: Path) -> Session | None:
+        """
+        Load only the recent end of a session file.
+
+        Returns None if the file has no trailer with a message count (legacy or
+        torn file), in which case the caller falls back to a full parse.
+        """
+        reader = _ReverseJsonlReader(path)
+        trailer: dict[str, Any] | None = None
+        newest_first: list[dict[str, Any]] = []
+        want = 0
+        while (block := reader.read_block()) is not None:
+            for record in block:
+                if trailer is None:
+                    if record.get("_type") != "metadata" or "message_count" not in record:
+                        return None
+                    trailer = record
+                    want = tail_size(
+                        trailer["message_count"],
+                        trailer.get("last_consolidated", 0),
+                        self.tail_messages,
+                    )
+                elif record.get("_type") != "metadata":
+                    newest_first.append(record)
+            if trailer is not None and len(newest_first) >= want:
+                break
+        if trailer is None:
+            return None
+
+        count = trailer["message_count"]
+        tail = newest_first[::-1]
+        if len(tail) > count or (reader.exhausted and len(tail) != count):
+            return None
+
+        def _load_older() -> list[dict[str, Any]]:
+            while (block := reader.read_block()) is not None:
+                older = [r for r in block if r.get("_type") != "metadata"]
+                if older:
+                    return older[::-1]
+            return []
+
+        messages: list[dict[str, Any]] | PagedMessages = (
+            tail if len(tail) == count else PagedMessages(tail, count, _load_older)
+        )
+        session = Session(
+            key=key,
+            messages=messages,
+            created_at=_parse_time(trailer.get("created_at")),
+            updated_at=_parse_time(trailer.get("updated_at")),
+            metadata=trailer.get("metadata", {}),
+            last_consolidated=trailer.get("last_consolidated", 0),
+        )
+        session._nbytes = reader.bytes_read
+        mark_flushed(session)
+        return session
+
+    def _load_full(self, key: str, path: Path) -> Session | None:
+        """Parse every line of a session file."""
+        try:
+            messages = []
+            metadata = {}
+            created_at = None
+            updated_at = None
+            last_consolidated = 0
+            corrupt = False
+            nbytes = 0
+
+            with open(path) as f:
+                for line in f:
+                    nbytes += len(line)
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Typically a torn write at the tail after a crash
+                        corrupt = True
+                        continue
+
+                    if data.get("_type") == "metadata":
+                        metadata = data.get("metadata", {})
+                        created_at = (
+                            datetime.fromisoformat(data["created_at"])
+                            if data.get("created_at")
+                            else None
+                        )
+                        updated_at = data.get("updated_at")
+                        last_consolidated = data.get("last_consolidated", 0)
+                    else:
+                        messages.append(data)
+
+            if corrupt:
+                logger.warning(f"Skipped malformed lines in session {key}, will rewrite on save")
+
+            session = Session(
+                key=key,
+                messages=messages,
+                created_at=created_at or datetime.now(),
+                updated_at=_parse_time(updated_at),
+                metadata=metadata,
+                last_consolidated=last_consolidated,
+            )
+            session._nbytes = nbytes
+            if not corrupt:
+                mark_flushed(session)
+            return session
+        except Exception as e:
+            logger.warning(f"Failed to load session {key}: {e}")
+            return None
+
+    @staticmethod
+    def _metadata_record(session: Session) -> dict[str, Any]:
+        return {
+            "_type": "metadata",
+            "key": session.key,
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata,
+            "last_consolidated": session.last_consolidated,
+            "message_count": len(session.messages),
+        }
+
+    def save(self, session: Session) -> None:
+        path = self.path_for(session.key)
+        if path.exists() and session._appends < self.compact_every and can_append(session):
+            self._append(path, session)
+        else:
+            self._rewrite(path, session)
+
+    def compact(self, session: Session) -> None:
+        self._rewrite(self.path_for(session.key), session)
+
+    def _append(self, path: Path, session: Session) -> None:
+        lines = [json.dumps(msg) for msg in session.messages[session._flushed :]]
+        lines.append(json.dumps(self._metadata_record(session)))
+        data = "\n".join(lines) + "\n"
+        with open(path, "a") as f:
+            f.write(data)
+        mark_flushed(session)
+        session._appends += 1
+        session._nbytes += len(data)
+
+    def _rewrite(self, path: Path, session: Session) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        nbytes = 0
+        with open(tmp, "w") as f:
+            # Header for list_sessions/older readers, trailer for tail loading
+            meta = self._metadata_record(session)
+            for record in (meta, *session.messages, meta):
+                line = json.dumps(record) + "\n"
+                nbytes += len(line)
+                f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        mark_flushed(session)
+        session._appends = 0
+        session._nbytes = nbytes
+
+    def list_sessions(self, limit: int | None = None) -> list[dict[str, Any]]:
+        sessions = []
+
+        for path in self.sessions_dir.glob("*.jsonl"):
+            try:
+                # Latest metadata is the trailer if present, else the header line
+                data = _read_metadata(path)
+                if data:
+                    sessions.append(
+                        {
+                            "key": data.get("key") or path.stem.replace("_", ":"),
+                            "created_at": data.get("created_at"),
+                            "updated_at": data.get("updated_at"),
+                            "message_count": data.get("message_count"),
+                            "path": str(path),
+                        }
+                    )
+            except Exception:
+                continue
+
+        sessions.sort(key=lambda x: x.get("updated_at") or "", reverse=True)
+        return sessions[:limit] if limit is not None else sessions
+
+    def count(self) -> int:
+        return sum(1 for _ in self.sessions_dir.glob("*.jsonl"))
+
+
+def _read_metadata(path: Path) -> dict[str, Any] | None:
+    """Read the most recent metadata record of a session file without scanning it."""
+    with open(path, "rb") as f:
+        first = f.readline().strip()
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        block = b""
+        pos = end
+        # Walk backwards until the last complete line is in the buffer
+        while pos > 0 and block.rstrip(b"\n").count(b"\n") < 1:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step) + block
+    last = block.rstrip(b"\n").rsplit(b"\n", 1)[-1].strip()
+
+    for raw in (last, first):
+        if not raw:
+            continue
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if data.get("_type") == "metadata":
+            return data
+    return None
+
+
+def copy_sessions(source: SessionStore, target: SessionStore) -> int:
+    """
+    Copy every session from one store into another (e.g. JSONL -> SQLite).
+
+    Returns:
+        Number of sessions copied.
+    """
+    copied = 0
+    for info in source.list_sessions():
+        session = source.load(info["key"])
+        if session is None:
+            continue
+        session.messages = list(session.messages)
+        session._flushed = None  # Force a full write in the target
+        target.save(session)
+        copied += 1
+    target.flush()
+    return copied
@@ -0,0 +1,42 @@
+"""Token bucket rate limiting."""
+
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    ``reserve`` always succeeds and returns the wait (callers queue up in
+    order); ``try_acquire`` is the non-blocking form used for admission.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take one token, returning how many seconds to wait before using it."""
+        self._refill()
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def try_acquire(self) -> bool:
+        """Take one token if one is available right now."""
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    @property
+    def idle(self) -> bool:
+        """Whether the bucket has refilled completely (safe to forget)."""
+        return self.tokens + (time.monotonic() - self.updated) * self.rate >= self.burst
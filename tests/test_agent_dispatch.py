@@ -0,0 +1,172 @@
+"""Tests for per-session concurrent dispatch in AgentLoop."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from banabot.agent.loop import AgentLoop
+from banabot.agent.tools.message import MessageTool
+from banabot.bus.events import InboundMessage, OutboundMessage
+from banabot.bus.queue import MessageBus
+
+
+def _make_loop(tmp_path, max_concurrent_sessions: int = 4) -> AgentLoop:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    return AgentLoop(
+        bus=MessageBus(),
+        provider=provider,
+        workspace=tmp_path,
+        max_concurrent_sessions=max_concurrent_sessions,
+    )
+
+
+def _msg(chat_id: str, content: str) -> InboundMessage:
+    return InboundMessage(channel="telegram", sender_id="u", chat_id=chat_id, content=content)
+
+
+async def _wait_idle(loop: AgentLoop) -> None:
+    while loop.active_sessions:
+        await asyncio.sleep(0)
+
+
+class TestSessionLanes:
+    """Messages are ordered per session and parallel across sessions."""
+
+    @pytest.mark.asyncio
+    async def test_same_session_is_processed_in_order(self, tmp_path) -> None:
+        loop = _make_loop(tmp_path)
+        seen: list[str] = []
+        running = 0
+        max_running = 0
+
+        async def fake_process(msg, session_key=None, on_progress=None):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            seen.append(msg.content)
+            running -= 1
+            return None
+
+        loop._process_message = fake_process
+        for i in range(5):
+            loop._dispatch(_msg("1", f"m{i}"))
+        await _wait_idle(loop)
+
+        assert seen == [f"m{i}" for i in range(5)]
+        assert max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_different_sessions_run_in_parallel(self, tmp_path) -> None:
+        loop = _make_loop(tmp_path)
+        started = asyncio.Event()
+        release = asyncio.Event()
+        seen: list[str] = []
+
+        async def fake_process(msg, session_key=None, on_progress=None):
+            if msg.chat_id == "slow":
+                started.set()
+                await release.wait()
+            seen.append(msg.chat_id)
+            return None
+
+        loop._process_message = fake_process
+        loop._dispatch(_msg("slow", "hi"))
+        await started.wait()
+        loop._dispatch(_msg("fast", "hi"))
+        while "fast" not in seen:
+            await asyncio.sleep(0)
+        release.set()
+        await _wait_idle(loop)
+
+        assert seen == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, tmp_path) -> None:
+        loop = _make_loop(tmp_path, max_concurrent_sessions=2)
+        running = 0
+        max_running = 0
+
+        async def fake_process(msg, session_key=None, on_progress=None):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return None
+
+        loop._process_message = fake_process
+        for i in range(6):
+            loop._dispatch(_msg(str(i), "hi"))
+        await _wait_idle(loop)
+
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_intake_stops_while_lanes_are_full(self, tmp_path) -> None:
+        loop = _make_loop(tmp_path, max_concurrent_sessions=1)
+        gate = asyncio.Event()
+
+        async def fake_process(msg, session_key=None, on_progress=None):
+            await gate.wait()
+            return None
+
+        loop._process_message = fake_process
+        loop._dispatch(_msg("1", "a"))
+        assert loop._has_room.is_set()
+        loop._dispatch(_msg("2", "b"))
+        assert not loop._has_room.is_set()
+
+        gate.set()
+        await _wait_idle(loop)
+        assert loop._has_room.is_set()
+        assert loop._pending == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_and_lane_continues(self, tmp_path) -> None:
+        loop = _make_loop(tmp_path)
+
+        async def fake_process(msg, session_key=None, on_progress=None):
+            if msg.content == "boom":
+                raise RuntimeError("kaput")
+            return OutboundMessage(channel=msg.channel, chat_id=msg.chat_id, content="ok")
+
+        loop._process_message = fake_process
+        loop._dispatch(_msg("1", "boom"))
+        loop._dispatch(_msg("1", "fine"))
+        await _wait_idle(loop)
+
+        first = await loop.bus.consume_outbound()
+        second = await loop.bus.consume_outbound()
+        assert "kaput" in first.content
+        assert second.content == "ok"
+
+    def test_system_messages_share_origin_lane(self) -> None:
+        system = InboundMessage(
+            channel="system", sender_id="subagent", chat_id="telegram:42", content="done"
+        )
+        assert AgentLoop._lane_key(system) == _msg("42", "x").session_key
+
+
+class TestToolContextIsolation:
+    """Tool routing context is scoped to the task that set it."""
+
+    @pytest.mark.asyncio
+    async def test_message_tool_context_per_task(self) -> None:
+        sent: list[OutboundMessage] = []
+
+        async def send(msg: OutboundMessage) -> None:
+            sent.append(msg)
+
+        tool = MessageTool(send_callback=send)
+
+        async def turn(chat_id: str) -> None:
+            tool.set_context("telegram", chat_id)
+            await asyncio.sleep(0.01)
+            await tool.execute(content=f"to {chat_id}")
+
+        await asyncio.gather(asyncio.create_task(turn("a")), asyncio.create_task(turn("b")))
+
+        assert {(m.chat_id, m.content) for m in sent} == {("a", "to a"), ("b", "to b")}
@@ -0,0 +1,186 @@
+"""Tests for per-channel outbound queues in ChannelManager."""
+
+import asyncio
+from types import SimpleNamespace
+
+from banabot.bus.events import OutboundMessage
+from banabot.bus.queue import MessageBus
+from banabot.channels.base import BaseChannel
+from banabot.channels.manager import ChannelManager
+from banabot.config.schema import Config
+
+
+class FakeChannel(BaseChannel):
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        super().__init__(SimpleNamespace(), MessageBus())
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.gate: asyncio.Event | None = None
+        self.sent: list[str] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, msg: OutboundMessage) -> None:
+        if self.gate:
+            await self.gate.wait()
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        self.sent.append(msg.content)
+
+
+def _manager(**outbound) -> ChannelManager:
+    config = Config()
+    outbound.setdefault("coalesce", False)
+    for key, value in outbound.items():
+        setattr(config.gateway.outbound, key, value)
+    return ChannelManager(config, MessageBus())
+
+
+def _out(channel: str, content: str, chat_id: str = "c") -> OutboundMessage:
+    return OutboundMessage(channel=channel, chat_id=chat_id, content=content)
+
+
+async def _idle(manager: ChannelManager) -> None:
+    while manager._outboxes:
+        await asyncio.sleep(0.001)
+
+
+async def test_slow_channel_does_not_delay_others() -> None:
+    manager = _manager()
+    email = manager.channels["email"] = FakeChannel("email")
+    slack = manager.channels["slack"] = FakeChannel("slack")
+    email.gate = asyncio.Event()
+
+    await manager._enqueue(email, _out("email", "e1"))
+    await manager._enqueue(slack, _out("slack", "s1"))
+    await manager._enqueue(slack, _out("slack", "s2"))
+    while len(slack.sent) < 2:
+        await asyncio.sleep(0.001)
+
+    assert slack.sent == ["s1", "s2"]
+    assert email.sent == []
+    assert manager.outbound_stats["email"]["queue_depth"] == 0  # in flight, not queued
+    email.gate.set()
+    await _idle(manager)
+    assert email.sent == ["e1"]
+
+
+async def test_drop_oldest_bounds_the_queue() -> None:
+    manager = _manager(queue_size=2)
+    slack = manager.channels["slack"] = FakeChannel("slack")
+    slack.gate = asyncio.Event()
+
+    for i in range(5):
+        await manager._enqueue(slack, _out("slack", f"m{i}"))
+        await asyncio.sleep(0)  # let the worker pick up the first message
+
+    assert manager.outbound_stats["slack"]["queue_depth"] == 2
+    slack.gate.set()
+    await _idle(manager)
+    assert slack.sent == ["m0", "m3", "m4"]
+    assert manager.outbound_stats["slack"]["dropped"] == 2
+
+
+async def test_drop_newest_keeps_queued_messages() -> None:
+    manager = _manager(queue_size=1, overflow="drop_newest")
+    slack = manager.channels["slack"] = FakeChannel("slack")
+    slack.gate = asyncio.Event()
+
+    for i in range(4):
+        await manager._enqueue(slack, _out("slack", f"m{i}"))
+        await asyncio.sleep(0)
+
+    slack.gate.set()
+    await _idle(manager)
+    assert slack.sent == ["m0", "m1"]
+
+
+async def test_per_chat_queues_keep_order_within_a_chat() -> None:
+    manager = _manager(per_chat=True)
+    tg = manager.channels["telegram"] = FakeChannel("telegram", delay=0.005)
+
+    for i in range(3):
+        await manager._enqueue(tg, _out("telegram", f"a{i}", chat_id="a"))
+        await manager._enqueue(tg, _out("telegram", f"b{i}", chat_id="b"))
+    assert len(manager._outboxes) == 2
+    await _idle(manager)
+
+    assert [m for m in tg.sent if m.startswith("a")] == ["a0", "a1", "a2"]
+    assert [m for m in tg.sent if m.startswith("b")] == ["b0", "b1", "b2"]
+
+
+async def test_stats_record_latency_and_failures() -> None:
+    manager = _manager()
+    ok = manager.channels["slack"] = FakeChannel("slack", delay=0.01)
+    bad = manager.channels["email"] = FakeChannel("email", fail=True)
+
+    await manager._enqueue(ok, _out("slack", "hi"))
+    await manager._enqueue(bad, _out("email", "hi"))
+    await _idle(manager)
+
+    stats = manager.get_status()
+    assert stats["slack"]["outbound"]["sent"] == 1
+    assert stats["slack"]["outbound"]["avg_latency"] >= 0.01
+    assert stats["email"]["outbound"]["failed"] == 1
+
+
+async def test_backlog_is_coalesced_into_one_send() -> None:
+    manager = _manager(coalesce=True)
+    slack = manager.channels["slack"] = FakeChannel("slack")
+    slack.gate = asyncio.Event()
+
+    await manager._enqueue(slack, _out("slack", "first"))
+    await asyncio.sleep(0)
+    for text in ("a", "b", "c"):
+        await manager._enqueue(slack, _out("slack", text))
+    await manager._enqueue(slack, _out("slack", "other chat", chat_id="d"))
+    slack.gate.set()
+    await _idle(manager)
+
+    assert slack.sent == ["first", "a\n\nb\n\nc", "other chat"]
+    assert manager.outbound_stats["slack"]["coalesced"] == 2
+
+
+async def test_stale_stream_updates_are_superseded() -> None:
+    manager = _manager(coalesce=True)
+    slack = manager.channels["slack"] = FakeChannel("slack")
+    slack.gate = asyncio.Event()
+
+    def update(text: str, partial: bool) -> OutboundMessage:
+        return OutboundMessage(
+            channel="slack",
+            chat_id="c",
+            content=text,
+            metadata={"_stream": {"id": "s", "partial": partial}},
+        )
+
+    await manager._enqueue(slack, update("one", True))
+    await asyncio.sleep(0)
+    for msg in (update("one two", True), update("one two three", True), update("done", False)):
+        await manager._enqueue(slack, msg)
+    slack.gate.set()
+    await _idle(manager)
+
+    assert slack.sent == ["one", "done"]
+
+
+async def test_long_messages_are_not_merged() -> None:
+    manager = _manager(coalesce=True)
+    discord = manager.channels["discord"] = FakeChannel("discord")
+    discord.max_message_chars = 10
+    discord.gate = asyncio.Event()
+
+    await manager._enqueue(discord, _out("discord", "x"))
+    await asyncio.sleep(0)
+    for text in ("123456", "789012"):
+        await manager._enqueue(discord, _out("discord", text))
+    discord.gate.set()
+    await _idle(manager)
+
+    assert discord.sent == ["x", "123456", "789012"]
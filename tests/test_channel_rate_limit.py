@@ -0,0 +1,151 @@
+"""Tests for channel send rate limiting and retries."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from telegram.error import BadRequest, RetryAfter, TimedOut
+
+from banabot.bus.events import OutboundMessage
+from banabot.bus.queue import MessageBus
+from banabot.channels import base
+from banabot.channels.base import (
+    BaseChannel,
+    RateLimiter,
+    RateLimits,
+    TokenBucket,
+    retry_after_seconds,
+)
+from banabot.channels.telegram import TelegramChannel
+
+
+class LimitedChannel(BaseChannel):
+    name = "limited"
+    rate_limits = RateLimits(chat_rate=2, chat_burst=2)
+
+    def __init__(self):
+        super().__init__(SimpleNamespace(), MessageBus())
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, msg: OutboundMessage) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(base, "random", SimpleNamespace(uniform=lambda a, b: 0.0))
+    monkeypatch.setattr(base, "backoff_delay", lambda attempt: 0.0)
+
+
+def _failing(*errors):
+    """An API call that raises ``errors`` in turn, then returns "ok"."""
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return call, calls
+
+
+class TestTokenBuckets:
+    def test_burst_then_paced(self) -> None:
+        bucket = TokenBucket(rate=2, burst=2)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays[:2] == [0.0, 0.0]
+        assert delays[2] == pytest.approx(0.5, abs=0.01)
+        assert delays[3] == pytest.approx(1.0, abs=0.01)
+
+    def test_group_limit_applies_on_top_of_chat_limit(self) -> None:
+        limiter = RateLimiter(RateLimits(chat_rate=10, chat_burst=10, group_rate=1, group_burst=1))
+
+        assert limiter.reserve("-1", group=True) == 0.0
+        assert limiter.reserve("-1", group=True) == pytest.approx(1.0, abs=0.01)
+        assert limiter.reserve("2") == 0.0
+
+    def test_pause_holds_every_chat(self) -> None:
+        limiter = RateLimiter(RateLimits())
+        limiter.pause(3)
+
+        assert limiter.reserve("a") == pytest.approx(3, abs=0.01)
+        assert limiter.reserve("b") == pytest.approx(3, abs=0.01)
+
+
+class TestRetryAfter:
+    def test_telegram_retry_after(self) -> None:
+        assert retry_after_seconds(RetryAfter(timedelta(seconds=7))) == 7.0
+
+    def test_http_429_header(self) -> None:
+        request = httpx.Request("POST", "https://discord.com/api")
+        response = httpx.Response(429, headers={"Retry-After": "2"}, request=request)
+        error = httpx.HTTPStatusError("429", request=request, response=response)
+
+        assert retry_after_seconds(error) == 2.0
+
+    def test_other_errors(self) -> None:
+        assert retry_after_seconds(ValueError("bad")) is None
+
+
+class TestCallApi:
+    async def test_retries_after_rate_limit(self) -> None:
+        channel = LimitedChannel()
+        call, calls = _failing(RetryAfter(timedelta(seconds=0.05)))
+
+        assert await channel._call_api("1", call) == "ok"
+        assert len(calls) == 2
+
+    async def test_transient_errors_are_retried_until_exhausted(self) -> None:
+        channel = LimitedChannel()
+        call, calls = _failing(*[ConnectionResetError()] * 10)
+
+        with pytest.raises(ConnectionResetError):
+            await channel._call_api("1", call)
+        assert len(calls) == channel.send_retries + 1
+
+    async def test_permanent_errors_are_not_retried(self) -> None:
+        channel = LimitedChannel()
+        call, calls = _failing(BadRequest("chat not found"))
+
+        with pytest.raises(BadRequest):
+            await channel._call_api("1", call)
+        assert len(calls) == 1
+
+    async def test_timeouts_only_retry_idempotent_calls(self) -> None:
+        channel = LimitedChannel()
+        edit, edits = _failing(httpx.ReadTimeout("slow"))
+        post, posts = _failing(httpx.ReadTimeout("slow"))
+
+        assert await channel._call_api("1", edit) == "ok"
+        with pytest.raises(httpx.ReadTimeout):
+            await channel._call_api("1", post, idempotent=False)
+        assert (len(edits), len(posts)) == (2, 1)
+
+    async def test_telegram_timed_out_send_is_not_repeated(self) -> None:
+        channel = TelegramChannel(SimpleNamespace(), MessageBus())
+        call, calls = _failing(TimedOut())
+
+        with pytest.raises(TimedOut):
+            await channel._call_api("1", call, idempotent=False)
+        assert len(calls) == 1
+
+    async def test_sends_to_one_chat_are_paced(self) -> None:
+        channel = LimitedChannel()
+        call, _ = _failing()
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(3):
+            await channel._call_api("1", call)
+
+        assert loop.time() - start >= 0.45
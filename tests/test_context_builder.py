@@ -0,0 +1,109 @@
+"""Tests for ContextBuilder prompt assembly."""
+
+import json
+import os
+
+import pytest
+
+from banabot.agent.context import ContextBuilder
+
+
+def _bump(path) -> None:
+    """Move a file's mtime forward so a same-size rewrite is still detected."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestPromptFragmentCache:
+    """File-backed prompt fragments are rebuilt only when their files change."""
+
+    def test_unchanged_files_are_not_reread(self, tmp_path) -> None:
+        (tmp_path / "SOUL.md").write_text("be kind")
+        cb = ContextBuilder(tmp_path)
+        first = cb.build_system_prompt()
+        rebuilds = cb.cache_stats["rebuilds"]
+
+        second = cb.build_system_prompt()
+
+        assert second == first
+        assert cb.cache_stats["rebuilds"] == rebuilds
+        assert cb.cache_stats["hits"] > 0
+
+    def test_changed_bootstrap_file_is_picked_up(self, tmp_path) -> None:
+        soul = tmp_path / "SOUL.md"
+        soul.write_text("be kind")
+        cb = ContextBuilder(tmp_path)
+        assert "be kind" in cb.build_system_prompt()
+
+        soul.write_text("be bold")
+        _bump(soul)
+
+        prompt = cb.build_system_prompt()
+        assert "be bold" in prompt
+        assert "be kind" not in prompt
+
+    def test_profile_is_parsed_once_per_change(self, tmp_path) -> None:
+        profile = tmp_path / "profile.json"
+        profile.write_text(json.dumps({"needs_onboarding": False, "bot_name": "Banana"}))
+        cb = ContextBuilder(tmp_path)
+        cb.build_system_prompt()
+        rebuilds = cb.cache_stats["rebuilds"]
+
+        assert cb.needs_onboarding() is False
+        assert cb._get_user_context() == "## Known\n- Bot name: Banana"
+        assert cb.cache_stats["rebuilds"] == rebuilds
+
+        profile.write_text(json.dumps({"needs_onboarding": False, "bot_name": "Mango"}))
+        _bump(profile)
+        assert "You are Mango." in cb.build_system_prompt()
+
+    def test_memory_file_created_later_is_included(self, tmp_path) -> None:
+        cb = ContextBuilder(tmp_path)
+        assert "Long-term Memory" not in cb.build_system_prompt()
+
+        cb.memory.write_long_term("user likes tea")
+
+        assert "user likes tea" in cb.build_system_prompt()
+
+
+class TestPromptCacheLayout:
+    """The system prompt is a stable prefix; per-turn context trails."""
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_identical_across_turns(self, tmp_path, monkeypatch) -> None:
+        cb = ContextBuilder(tmp_path)
+        monkeypatch.setattr(cb, "_current_time", lambda: "## Current Time\n2026-01-01 09:00")
+        first = await cb.build_messages([], "hi", channel="telegram", chat_id="1")
+        monkeypatch.setattr(cb, "_current_time", lambda: "## Current Time\n2026-01-01 09:01")
+        second = await cb.build_messages([], "hello", channel="slack", chat_id="2")
+
+        assert first[0] == second[0]
+        assert "Current Time" not in first[0]["content"]
+        assert "Chat ID" not in first[0]["content"]
+        user = second[-1]["content"]
+        assert "2026-01-01 09:01" in user
+        assert "Channel: slack" in user
+        assert user.endswith("\n\nhello")
+
+    @pytest.mark.asyncio
+    async def test_legacy_layout_keeps_context_in_system_prompt(self, tmp_path) -> None:
+        cb = ContextBuilder(tmp_path, prompt_cache=False)
+
+        messages = await cb.build_messages([], "hi", channel="telegram", chat_id="1")
+
+        assert "## Current Time" in messages[0]["content"]
+        assert "Chat ID: 1" in messages[0]["content"]
+        assert messages[-1]["content"] == "hi"
+
+    @pytest.mark.asyncio
+    async def test_context_is_prepended_to_media_messages(self, tmp_path) -> None:
+        image = tmp_path / "cat.png"
+        image.write_bytes(b"\x89PNG")
+        cb = ContextBuilder(tmp_path)
+
+        messages = await cb.build_messages([], "look", media=[str(image)])
+
+        parts = messages[-1]["content"]
+        assert parts[0]["type"] == "image_url"
+        assert parts[-1]["text"].startswith("<context>")
+        assert parts[-1]["text"].endswith("look")
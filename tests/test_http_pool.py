@@ -0,0 +1,108 @@
+"""Tests for the shared HTTP connection pool."""
+
+import asyncio
+import json
+
+import httpx
+
+from banabot.agent.tools.http_pool import HttpPool, _PerHostLimitTransport
+from banabot.agent.tools.web import WebFetchTool
+
+
+class MockPool(HttpPool):
+    """Pool whose client answers from a handler instead of the network."""
+
+    def __init__(self, handler, **kwargs):
+        super().__init__(**kwargs)
+        self.handler = handler
+        self.clients_created = 0
+
+    def _create_client(self) -> httpx.AsyncClient:
+        self.clients_created += 1
+        transport = _PerHostLimitTransport(
+            httpx.MockTransport(self.handler), self.config.max_connections_per_host
+        )
+        return httpx.AsyncClient(transport=transport)
+
+
+class OpenBody(httpx.AsyncByteStream):
+    """An unread response body, as a real transport would return."""
+
+    async def __aiter__(self):
+        yield b"body"
+
+
+async def test_client_is_reused_until_closed() -> None:
+    pool = MockPool(lambda request: httpx.Response(200, text="ok"))
+
+    first = pool.client
+    await first.get("https://example.com/a")
+    await pool.client.get("https://example.com/b")
+
+    assert pool.client is first
+    assert pool.clients_created == 1
+    await pool.aclose()
+    assert first.is_closed
+    assert pool.client is not first
+
+
+async def test_per_host_limit() -> None:
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    from banabot.config.schema import HttpPoolConfig
+
+    pool = MockPool(handler, config=HttpPoolConfig(max_connections_per_host=2))
+    urls = [f"https://a.example/{i}" for i in range(6)] + [
+        f"https://b.example/{i}" for i in range(2)
+    ]
+
+    responses = await asyncio.gather(*(pool.client.get(u) for u in urls))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert peak["a.example"] == 2
+    await pool.aclose()
+
+
+async def test_streamed_response_holds_slot_until_closed() -> None:
+    from banabot.config.schema import HttpPoolConfig
+
+    pool = MockPool(
+        lambda request: httpx.Response(200, stream=OpenBody()),
+        config=HttpPoolConfig(max_connections_per_host=1),
+    )
+    client = pool.client
+
+    async with client.stream("GET", "https://a.example/1") as response:
+        second = asyncio.create_task(client.get("https://a.example/2"))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        await response.aread()
+
+    assert (await second).text == "body"
+    await pool.aclose()
+
+
+async def test_web_fetch_uses_injected_pool() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, json={"ok": True}, headers={"content-type": "application/json"})
+
+    pool = MockPool(handler)
+    tool = WebFetchTool(http=pool)
+
+    result = json.loads(await tool.execute("https://api.example/data"))
+
+    assert seen == ["https://api.example/data"]
+    assert result["extractor"] == "json"
+    await pool.aclose()
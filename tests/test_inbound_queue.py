@@ -0,0 +1,201 @@
+"""Tests for admission control and fair scheduling of inbound messages."""
+
+import asyncio
+
+from banabot.bus.events import InboundMessage
+from banabot.bus.inbound import InboundQueue
+from banabot.bus.queue import MessageBus
+from banabot.config.schema import InboundQueueConfig
+
+
+def _config(**overrides) -> InboundQueueConfig:
+    overrides.setdefault("sender_rate", 0)
+    overrides.setdefault("chat_rate", 0)
+    overrides.setdefault("coalesce_window", 0)
+    return InboundQueueConfig(**overrides)
+
+
+def _msg(chat_id: str, content: str, sender_id: str = "u", channel: str = "telegram"):
+    return InboundMessage(channel=channel, sender_id=sender_id, chat_id=chat_id, content=content)
+
+
+def _drain(queue: InboundQueue) -> list[str]:
+    out = []
+    while not queue.empty():
+        out.append(queue.get_nowait().content)
+    return out
+
+
+def test_chats_are_served_round_robin() -> None:
+    queue = InboundQueue(_config())
+    for i in range(4):
+        queue.offer(_msg("noisy", f"n{i}"))
+    queue.offer(_msg("quiet", "q0"))
+
+    assert _drain(queue) == ["n0", "q0", "n1", "n2", "n3"]
+
+
+def test_weights_give_a_chat_more_turns_per_round() -> None:
+    queue = InboundQueue(_config(weights={"telegram:vip": 2}))
+    for i in range(3):
+        queue.offer(_msg("vip", f"v{i}"))
+        queue.offer(_msg("other", f"o{i}"))
+
+    assert _drain(queue) == ["v0", "v1", "o0", "v2", "o1", "o2"]
+
+
+def test_sender_rate_limit_rejects_a_flood() -> None:
+    queue = InboundQueue(_config(sender_rate=60, sender_burst=2))
+    results = [queue.offer(_msg("g", f"m{i}", sender_id="spammer")) for i in range(4)]
+    results.append(queue.offer(_msg("g", "hello", sender_id="someone")))
+
+    assert results == ["queued", "queued", "rate_limited", "rate_limited", "queued"]
+    assert queue.stats["rejected"] == 2
+
+
+def test_system_messages_bypass_rate_limits() -> None:
+    queue = InboundQueue(_config(sender_rate=60, sender_burst=1))
+    results = [queue.offer(_msg("cli:direct", f"s{i}", channel="system")) for i in range(3)]
+
+    assert results == ["queued"] * 3
+
+
+def test_drop_oldest_sheds_from_the_full_chat() -> None:
+    queue = InboundQueue(_config(max_per_chat=2))
+    for i in range(4):
+        queue.offer(_msg("a", f"a{i}"))
+    queue.offer(_msg("b", "b0"))
+
+    assert _drain(queue) == ["a2", "b0", "a3"]
+    assert queue.stats["shed"] == 2
+
+
+def test_global_limit_sheds_from_the_longest_queue() -> None:
+    queue = InboundQueue(_config(max_size=3))
+    for i in range(3):
+        queue.offer(_msg("a", f"a{i}"))
+    queue.offer(_msg("b", "b0"))
+
+    assert queue.qsize() == 3
+    assert _drain(queue) == ["a1", "b0", "a2"]
+
+
+def test_coalesce_merges_overflow_into_the_last_turn() -> None:
+    queue = InboundQueue(_config(max_per_chat=1, shed_policy="coalesce"))
+    queue.offer(_msg("g", "hi", sender_id="ana"))
+    assert queue.offer(_msg("g", "anyone?", sender_id="bo")) == "coalesced"
+
+    merged = queue.get_nowait()
+    assert merged.content == "ana: hi\nbo: anyone?"
+    assert merged.metadata["buffered_count"] == 2
+    assert queue.empty()
+
+
+async def test_reject_policy_replies_once() -> None:
+    bus = MessageBus(_config(max_per_chat=1, shed_policy="reject"))
+
+    assert await bus.publish_inbound(_msg("c", "one"))
+    assert not await bus.publish_inbound(_msg("c", "two"))
+    assert not await bus.publish_inbound(_msg("c", "three"))
+
+    assert bus.inbound_rejected == 2
+    assert bus.outbound_size == 1
+    reply = bus.outbound.get_nowait()
+    assert reply.chat_id == "c"
+    assert reply.content == bus.inbound.config.reject_message
+
+
+async def test_rate_limited_chat_is_told_under_any_policy() -> None:
+    bus = MessageBus(_config(chat_rate=60, chat_burst=1))
+
+    assert await bus.publish_inbound(_msg("c", "one"))
+    assert not await bus.publish_inbound(_msg("c", "two"))
+    assert not await bus.publish_inbound(_msg("c", "three"))
+
+    assert bus.inbound.config.shed_policy == "drop_oldest"
+    assert bus.outbound_size == 1
+    assert bus.outbound.get_nowait().content == bus.inbound.config.reject_message
+
+
+async def test_consume_waits_for_a_message() -> None:
+    bus = MessageBus(_config())
+    task = asyncio.create_task(bus.consume_inbound())
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    await bus.publish_inbound(_msg("c", "late"))
+    assert (await task).content == "late"
+    assert bus.inbound_stats["depth"] == 0
+
+
+async def test_window_merges_a_burst_into_one_turn() -> None:
+    bus = MessageBus(_config(coalesce_window=0.05))
+    for text in ("hi", "quick question", "about the cron job"):
+        await bus.publish_inbound(_msg("c", text))
+    await bus.publish_inbound(_msg("other", "hello"))
+    assert [bus.inbound.get_nowait().content for _ in range(2)] == ["hi", "hello"]
+    assert bus.inbound_stats["held"] == 2
+
+    merged = await asyncio.wait_for(bus.consume_inbound(), timeout=1)
+
+    assert merged.content == "quick question\nabout the cron job"
+    assert merged.metadata["buffered_count"] == 2
+
+
+async def test_trailing_mode_turns_a_burst_into_exactly_one_turn() -> None:
+    bus = MessageBus(_config(coalesce_window=0.05, coalesce_mode="trailing"))
+    for text in ("hi", "quick question", "about the cron job"):
+        await bus.publish_inbound(_msg("c", text))
+    assert bus.inbound_size == 0
+    assert bus.inbound_stats["held"] == 3
+
+    merged = await asyncio.wait_for(bus.consume_inbound(), timeout=1)
+
+    assert merged.content == "hi\nquick question\nabout the cron job"
+    assert bus.inbound_size == 0
+    assert bus.inbound_stats["held"] == 0
+
+
+async def test_groups_mode_holds_group_chats_only() -> None:
+    bus = MessageBus(_config(coalesce_window=10, coalesce_mode="groups"))
+    group = _msg("g", "hi all")
+    group.metadata["is_group"] = True
+    await bus.publish_inbound(group)
+    await bus.publish_inbound(_msg("dm", "hello"))
+
+    assert bus.inbound.get_nowait().content == "hello"
+    assert bus.inbound_stats["held"] == 1
+
+
+async def test_first_message_after_a_quiet_period_is_not_delayed() -> None:
+    bus = MessageBus(_config(coalesce_window=0.01))
+    await bus.publish_inbound(_msg("c", "one"))
+    await asyncio.sleep(0.02)
+    await bus.publish_inbound(_msg("c", "two"))
+
+    assert bus.inbound_size == 2
+    assert bus.inbound_stats["held"] == 0
+
+
+async def test_window_flushes_early_on_mention_and_max_batch() -> None:
+    bus = MessageBus(_config(coalesce_window=10, max_batch=3))
+    for text in ("first", "context"):
+        await bus.publish_inbound(_msg("g", text))
+    mention = _msg("g", "@bot what do you think?")
+    mention.metadata["was_mentioned"] = True
+    await bus.publish_inbound(mention)
+    for i in range(4):
+        await bus.publish_inbound(_msg("h", f"m{i}"))
+
+    turns = [bus.inbound.get_nowait().content for _ in range(4)]
+    assert turns == ["first", "m0", "context\n@bot what do you think?", "m1\nm2\nm3"]
+    assert bus.inbound_stats["held"] == 0
+
+
+async def test_commands_are_not_merged() -> None:
+    bus = MessageBus(_config(coalesce_window=10))
+    await bus.publish_inbound(_msg("c", "hello"))
+    await bus.publish_inbound(_msg("c", "/new"))
+
+    assert bus.inbound.get_nowait().content == "hello"
+    assert bus.inbound.get_nowait().content == "/new"
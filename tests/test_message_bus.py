@@ -0,0 +1,68 @@
+"""Tests for closing the message bus and its blocking consumers."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from banabot.agent.loop import AgentLoop
+from banabot.bus.events import InboundMessage, OutboundMessage
+from banabot.bus.queue import BusClosedError, MessageBus
+from banabot.config.schema import InboundQueueConfig
+
+
+def _bus() -> MessageBus:
+    return MessageBus(InboundQueueConfig(coalesce_window=0))
+
+
+def _in(content: str) -> InboundMessage:
+    return InboundMessage(channel="telegram", sender_id="u", chat_id="c", content=content)
+
+
+async def test_close_drains_then_ends_inbound_iteration() -> None:
+    bus = _bus()
+    await bus.publish_inbound(_in("one"))
+    bus.close()
+
+    assert not await bus.publish_inbound(_in("late"))
+    assert [m.content async for m in bus.inbound_messages()] == ["one"]
+    with pytest.raises(BusClosedError):
+        await bus.consume_inbound()
+
+
+async def test_close_wakes_every_outbound_consumer() -> None:
+    bus = _bus()
+    consumers = [asyncio.create_task(bus.consume_outbound()) for _ in range(2)]
+    await asyncio.sleep(0)
+    bus.close()
+
+    results = await asyncio.gather(*consumers, return_exceptions=True)
+    assert all(isinstance(r, BusClosedError) for r in results)
+    assert bus.outbound_size == 0
+
+
+async def test_dispatch_outbound_delivers_backlog_and_returns() -> None:
+    bus = _bus()
+    seen: list[str] = []
+
+    async def record(msg: OutboundMessage) -> None:
+        seen.append(msg.content)
+
+    bus.subscribe_outbound("slack", record)
+    await bus.publish_outbound(OutboundMessage(channel="slack", chat_id="c", content="bye"))
+    bus.close()
+
+    await asyncio.wait_for(bus.dispatch_outbound(), timeout=1)
+    assert seen == ["bye"]
+
+
+async def test_agent_run_returns_promptly_on_stop(tmp_path) -> None:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    loop = AgentLoop(bus=_bus(), provider=provider, workspace=tmp_path)
+    task = asyncio.create_task(loop.run())
+    await asyncio.sleep(0.01)
+
+    loop.stop()
+    await asyncio.wait_for(task, timeout=0.1)
+    assert not task.cancelled()
@@ -0,0 +1,76 @@
+"""Tests for provider prompt-cache support and cached-token accounting."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from banabot.agent.loop import AgentLoop
+from banabot.bus.queue import MessageBus
+from banabot.providers.base import parse_usage
+from banabot.providers.litellm_provider import LiteLLMProvider
+from banabot.providers.openai_codex_provider import _convert_usage, _prompt_cache_key
+
+
+def test_cache_breakpoints_on_system_and_last_user_message() -> None:
+    messages = [
+        {"role": "system", "content": "static"},
+        {"role": "user", "content": "old"},
+        {"role": "assistant", "content": "reply"},
+        {"role": "user", "content": "new"},
+    ]
+
+    marked = LiteLLMProvider._apply_cache_control(messages)
+
+    assert marked[0]["content"] == [
+        {"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert marked[1]["content"] == "old"
+    assert marked[3]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert messages[0]["content"] == "static"
+
+
+def test_parse_usage_reads_cached_tokens() -> None:
+    openai_style = SimpleNamespace(
+        prompt_tokens=1000,
+        completion_tokens=10,
+        total_tokens=1010,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=900),
+    )
+    anthropic_style = SimpleNamespace(
+        prompt_tokens=1000,
+        completion_tokens=10,
+        total_tokens=1010,
+        prompt_tokens_details=None,
+        cache_read_input_tokens=800,
+        cache_creation_input_tokens=200,
+    )
+
+    assert parse_usage(openai_style)["cached_tokens"] == 900
+    usage = parse_usage(anthropic_style)
+    assert usage["cached_tokens"] == 800
+    assert usage["cache_creation_tokens"] == 200
+    assert parse_usage(None) == {}
+
+
+def test_codex_usage_and_stable_cache_key() -> None:
+    usage = _convert_usage(
+        {"input_tokens": 50, "output_tokens": 5, "input_tokens_details": {"cached_tokens": 40}}
+    )
+
+    assert usage["prompt_tokens"] == 50
+    assert usage["cached_tokens"] == 40
+    assert _prompt_cache_key("system", None) == _prompt_cache_key("system", [])
+    assert _prompt_cache_key("system", None) != _prompt_cache_key("other", None)
+
+
+def test_agent_loop_tracks_cache_hit_rate(tmp_path) -> None:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    loop = AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path)
+
+    loop._record_usage({"prompt_tokens": 100, "completion_tokens": 5})
+    loop._record_usage({"prompt_tokens": 100, "cached_tokens": 100, "completion_tokens": 5})
+
+    stats = loop.usage_stats
+    assert stats["requests"] == 2
+    assert stats["cached_tokens"] == 100
+    assert stats["cache_hit_rate"] == 0.5
@@ -0,0 +1,117 @@
+"""Tests for hedged / raced multi-provider web search."""
+
+import asyncio
+import time
+
+import pytest
+
+from banabot.agent.tools import search_registry
+from banabot.agent.tools.search_registry import ProviderHealth, rank_providers
+from banabot.agent.tools.web import WebSearchTool
+from banabot.config.schema import WebSearchConfig
+
+
+class FakeBackend:
+    def __init__(self, name: str, delay: float, result: str | None = None):
+        self.name = name
+        self.delay = delay
+        self.result = result or f"Results from {name}"
+        self.cancelled = False
+
+    async def search(self, query: str, count: int) -> str:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def fresh_health(monkeypatch):
+    monkeypatch.setattr(search_registry, "_HEALTH", {})
+
+
+def _tool(monkeypatch, backends: dict[str, FakeBackend], **config) -> WebSearchTool:
+    cfg = WebSearchConfig(**config)
+    cfg.providers.brave.api_key = "key"
+    tool = WebSearchTool(config=cfg)
+    monkeypatch.setattr(tool, "_get_backend", lambda name: backends[name])
+    return tool
+
+
+async def test_hedge_starts_next_provider_after_delay(monkeypatch) -> None:
+    backends = {"duckduckgo": FakeBackend("ddg", 1.0), "brave": FakeBackend("brave", 0.01)}
+    tool = _tool(monkeypatch, backends, strategy="hedge", hedge_delay=0.05)
+
+    start = time.monotonic()
+    result = await tool.execute("q")
+    await asyncio.sleep(0)
+
+    assert result == "Results from brave"
+    assert time.monotonic() - start < 0.5
+    assert backends["duckduckgo"].cancelled
+
+
+async def test_hedge_does_not_start_backup_for_fast_default(monkeypatch) -> None:
+    backends = {"duckduckgo": FakeBackend("ddg", 0.0), "brave": FakeBackend("brave", 0.0)}
+    calls: list[str] = []
+    monkeypatch.setattr(
+        WebSearchTool,
+        "_get_backend",
+        lambda self, name: calls.append(name) or backends[name],
+    )
+    cfg = WebSearchConfig(strategy="hedge", hedge_delay=0.5)
+    cfg.providers.brave.api_key = "key"
+
+    assert await WebSearchTool(config=cfg).execute("q") == "Results from ddg"
+    assert calls == ["duckduckgo"]
+
+
+async def test_failure_falls_back_without_waiting(monkeypatch) -> None:
+    backends = {
+        "duckduckgo": FakeBackend("ddg", 0.0, result="Error searching DuckDuckGo: boom"),
+        "brave": FakeBackend("brave", 0.0),
+    }
+    tool = _tool(monkeypatch, backends, strategy="hedge", hedge_delay=5.0)
+
+    start = time.monotonic()
+    assert await tool.execute("q") == "Results from brave"
+    assert time.monotonic() - start < 1.0
+
+
+async def test_race_starts_all_providers(monkeypatch) -> None:
+    backends = {"duckduckgo": FakeBackend("ddg", 0.2), "brave": FakeBackend("brave", 0.01)}
+    tool = _tool(monkeypatch, backends, strategy="race", adaptive_order=False)
+
+    assert await tool.execute("q") == "Results from brave"
+
+
+async def test_all_failures_are_reported(monkeypatch) -> None:
+    backends = {
+        "duckduckgo": FakeBackend("ddg", 0.0, result="Error: a"),
+        "brave": FakeBackend("brave", 0.0, result="Error: b"),
+    }
+    tool = _tool(monkeypatch, backends, strategy="sequential")
+
+    result = await tool.execute("q")
+
+    assert result.startswith("Search failed for all providers:")
+    assert "duckduckgo: Error: a" in result and "brave: Error: b" in result
+
+
+def test_health_ewma_and_ranking() -> None:
+    health = ProviderHealth()
+    health.record(1.0, error=False)
+    health.record(3.0, error=True)
+    assert health.latency == pytest.approx(1.6)
+    assert health.error_rate == pytest.approx(0.3)
+
+    search_registry.provider_health("duckduckgo").record(10.0, error=False)
+    search_registry.provider_health("tavily").record(0.2, error=False)
+
+    assert rank_providers(["duckduckgo", "brave", "tavily"], prior=2.0) == [
+        "tavily",
+        "brave",
+        "duckduckgo",
+    ]
@@ -82,3 +82,347 @@ class TestSemanticMemoryStore:
         store = SemanticMemoryStore(workspace, config)
 
         assert store.config.enabled is False
+
+
+class FakeEmbedding:
+    """Deterministic stand-in for fastembed.TextEmbedding that counts calls."""
+
+    calls: list[list[str]] = []
+
+    def __init__(self, model_name: str, **kwargs):
+        self.model_name = model_name
+
+    def embed(self, texts):
+        import hashlib
+
+        import numpy as np
+
+        texts = list(texts)
+        FakeEmbedding.calls.append(texts)
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "little")
+            yield np.random.default_rng(seed).standard_normal(384).astype(np.float32)
+
+
+class TestBatchedSave:
+    """save_many embeds, inserts and persists the index once per batch."""
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        fastembed = pytest.importorskip("fastembed", reason="fastembed not installed")
+        pytest.importorskip("usearch", reason="usearch not installed")
+        monkeypatch.setattr(fastembed, "TextEmbedding", FakeEmbedding)
+        FakeEmbedding.calls = []
+
+        from banabot.agent.semantic_memory import SemanticMemoryStore
+        from banabot.config.schema import SemanticMemoryConfig
+
+        store = SemanticMemoryStore(tmp_path, SemanticMemoryConfig(enabled=True))
+        assert store.is_available
+        return store
+
+    def test_one_embed_call_and_one_index_write(self, store, monkeypatch):
+        writes = []
+        original = store._index.save
+        monkeypatch.setattr(store._index, "save", lambda path: writes.append(original(path)))
+
+        ids = store.save_many(
+            [
+                {"content": "summary", "type": "summary"},
+                {"content": "fact one", "type": "fact", "expires_days": 180},
+                {"content": "fact two", "type": "fact"},
+                {"content": "episode", "type": "episodic"},
+            ]
+        )
+
+        assert len(set(ids)) == 4
+        assert FakeEmbedding.calls == [["summary", "fact one", "fact two", "episode"]]
+        assert len(writes) == 1
+        assert len(store._index) == 4
+        assert store.stats()["fact"] == 2
+
+    def test_dedupes_against_store_and_within_batch(self, store):
+        first = store.save("known", type="fact")
+        FakeEmbedding.calls = []
+
+        ids = store.save_many([{"content": "known"}, {"content": "new"}, {"content": "new"}])
+
+        assert ids[0] == first
+        assert ids[1] == ids[2]
+        assert FakeEmbedding.calls == [["new"]]
+        assert len(store._index) == 2
+
+    def test_saved_memories_are_recalled(self, store):
+        store.save_many([{"content": "user went to Oaxaca"}, {"content": "likes coffee"}])
+
+        results = store.recall("user went to Oaxaca", k=1, min_score=0.9)
+
+        assert [r["content"] for r in results] == ["user went to Oaxaca"]
+
+
+class TestPurgeWithoutReembedding:
+    """Expiry and index rebuilds use stored vectors instead of the model."""
+
+    @pytest.fixture
+    def make_store(self, tmp_path, monkeypatch):
+        fastembed = pytest.importorskip("fastembed", reason="fastembed not installed")
+        pytest.importorskip("usearch", reason="usearch not installed")
+        monkeypatch.setattr(fastembed, "TextEmbedding", FakeEmbedding)
+        FakeEmbedding.calls = []
+
+        from banabot.agent.semantic_memory import SemanticMemoryStore
+        from banabot.config.schema import SemanticMemoryConfig
+
+        def make():
+            store = SemanticMemoryStore(tmp_path, SemanticMemoryConfig(enabled=True))
+            assert store.is_available
+            return store
+
+        return make
+
+    def test_purge_removes_only_expired_keys(self, make_store):
+        store = make_store()
+        keep, gone = store.save_many([{"content": "keep"}, {"content": "gone"}])
+        store._db.execute(
+            "UPDATE memory_meta SET expires_at = '2000-01-01T00:00:00' WHERE id = ?", (gone,)
+        )
+        FakeEmbedding.calls = []
+
+        assert store.purge_expired() == 1
+
+        assert FakeEmbedding.calls == []
+        assert len(store._index) == 1
+        assert keep in store._index
+        assert gone not in store._index
+
+    def test_new_memories_are_not_expired_immediately(self, make_store):
+        store = make_store()
+        store.save("fresh", expires_days=30)
+
+        assert store.purge_expired() == 0
+
+    def test_lost_index_is_rebuilt_from_stored_vectors(self, make_store):
+        store = make_store()
+        store.save_many([{"content": "a"}, {"content": "b"}])
+        store.index_path.unlink()
+        FakeEmbedding.calls = []
+
+        reopened = make_store()
+
+        assert FakeEmbedding.calls == []
+        assert len(reopened._index) == 2
+        assert reopened.recall("a", k=1, min_score=0.9)[0]["content"] == "a"
+
+    def test_legacy_database_gains_vectors_once(self, make_store, tmp_path):
+        import sqlite3
+
+        (tmp_path / "memory").mkdir()
+        db = sqlite3.connect(str(tmp_path / "memory" / "memory.db"))
+        db.execute(
+            "CREATE TABLE memory_meta (id INTEGER PRIMARY KEY AUTOINCREMENT, content TEXT NOT NULL, "
+            "type TEXT NOT NULL DEFAULT 'episodic', created_at TEXT NOT NULL DEFAULT (datetime('now')), "
+            "expires_at TEXT, source_path TEXT, line_start INTEGER, line_end INTEGER)"
+        )
+        db.execute("INSERT INTO memory_meta (content) VALUES ('old memory')")
+        db.commit()
+        db.close()
+
+        store = make_store()
+        assert FakeEmbedding.calls == [["old memory"]]
+        assert len(store._index) == 1
+
+        FakeEmbedding.calls = []
+        store.index_path.unlink()
+        make_store()
+        assert FakeEmbedding.calls == []
+
+
+class TestEmbeddingCache:
+    """Repeated texts are embedded once, across saves, recalls and restarts."""
+
+    @pytest.fixture
+    def make_store(self, tmp_path, monkeypatch):
+        fastembed = pytest.importorskip("fastembed", reason="fastembed not installed")
+        pytest.importorskip("usearch", reason="usearch not installed")
+        monkeypatch.setattr(fastembed, "TextEmbedding", FakeEmbedding)
+        FakeEmbedding.calls = []
+
+        from banabot.agent.semantic_memory import SemanticMemoryStore
+        from banabot.config.schema import SemanticMemoryConfig
+
+        def make(**kwargs):
+            config = SemanticMemoryConfig(enabled=True, **kwargs)
+            store = SemanticMemoryStore(tmp_path, config)
+            assert store.is_available
+            return store
+
+        return make
+
+    def test_repeated_recall_hits_memory_tier(self, make_store):
+        store = make_store()
+        store.save("user went to Oaxaca")
+        FakeEmbedding.calls = []
+
+        for _ in range(3):
+            store.recall("hola", k=1, min_score=0.0)
+
+        assert FakeEmbedding.calls == [["hola"]]
+        stats = store.cache_stats
+        assert stats["memory_hits"] == 2
+        assert stats["misses"] == 2  # The save and the first recall
+        assert stats["hit_rate"] == 0.5
+
+    def test_disk_tier_survives_restart(self, make_store):
+        make_store().recall("good morning", k=1, min_score=0.0)
+        FakeEmbedding.calls = []
+
+        store = make_store()
+        store.recall("good morning", k=1, min_score=0.0)
+        store.save("good morning")
+
+        assert FakeEmbedding.calls == []
+        assert store.cache_stats["disk_hits"] == 1
+        assert store.cache_stats["memory_hits"] == 1
+
+    def test_disk_tier_is_bounded(self, make_store):
+        store = make_store(embedding_cache_size=2, embedding_cache_max_entries=3)
+        store.save_many([{"content": f"m{i}"} for i in range(5)])
+
+        assert store.cache_stats["memory_entries"] == 2
+        assert store.cache_stats["disk_entries"] == 3
+
+
+class SlowStore:
+    """Store stand-in whose model load and recall block the calling thread."""
+
+    def __init__(self):
+        from banabot.config.schema import SemanticMemoryConfig
+
+        self.config = SemanticMemoryConfig(enabled=True)
+        self._model = None
+        self.threads: list[str] = []
+
+    @property
+    def is_available(self) -> bool:
+        import threading
+        import time
+
+        time.sleep(0.2)
+        self._model = object()
+        self.threads.append(threading.current_thread().name)
+        return True
+
+    def recall(self, query, **kwargs):
+        import threading
+
+        self.threads.append(threading.current_thread().name)
+        return [{"type": "fact", "content": f"about {query}", "score": 0.9}]
+
+
+class TestAsyncSemanticMemory:
+    """Model loading and recalls run off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_does_not_block_event_loop(self):
+        import asyncio
+
+        from banabot.agent.semantic_memory import AsyncSemanticMemory
+
+        memory = AsyncSemanticMemory(SlowStore())
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not memory.is_ready:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        warm_up = memory.warm_up()
+        await asyncio.gather(warm_up, ticker())
+
+        assert warm_up.result() is True
+        assert ticks > 5
+        assert memory.warm_up() is warm_up
+        assert memory.store.threads[0].startswith("semantic-memory")
+        memory.close()
+
+    @pytest.mark.asyncio
+    async def test_build_messages_recalls_through_facade(self, tmp_path):
+        from banabot.agent.context import ContextBuilder
+        from banabot.agent.semantic_memory import AsyncSemanticMemory
+
+        memory = AsyncSemanticMemory(SlowStore())
+        context = ContextBuilder(tmp_path, semantic_memory=memory)
+
+        messages = await context.build_messages(history=[], current_message="Oaxaca")
+
+        assert "about Oaxaca" in messages[-1]["content"]
+        assert all(name.startswith("semantic-memory") for name in memory.store.threads)
+        memory.close()
+
+
+class TestMMR:
+    """MMR diversifies using stored embeddings, with word overlap as a fallback."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from banabot.agent.semantic_memory import SemanticMemoryStore
+        from banabot.config.schema import SemanticMemoryConfig
+
+        return SemanticMemoryStore(tmp_path, SemanticMemoryConfig(enabled=True, mmr_lambda=0.5))
+
+    @staticmethod
+    def _results() -> list[dict]:
+        return [
+            {"content": "trip to Oaxaca", "score": 0.9},
+            {"content": "visited Oaxaca city", "score": 0.89},
+            {"content": "likes coffee", "score": 0.8},
+        ]
+
+    def test_near_duplicate_vectors_are_demoted(self, store):
+        import numpy as np
+
+        vectors = {
+            "trip to Oaxaca": np.array([1.0, 0.0, 0.0], dtype=np.float32),
+            "visited Oaxaca city": np.array([0.99, 0.1, 0.0], dtype=np.float32),
+            "likes coffee": np.array([0.0, 0.0, 1.0], dtype=np.float32),
+        }
+
+        selected = store._apply_mmr(self._results(), k=2, vectors=vectors)
+
+        assert [r["content"] for r in selected] == ["trip to Oaxaca", "likes coffee"]
+
+    def test_vectors_override_word_overlap(self, store):
+        import numpy as np
+
+        # No shared words, but the first two memories say the same thing
+        vectors = {
+            "trip to Oaxaca": np.array([1.0, 0.0], dtype=np.float32),
+            "visited Oaxaca city": np.array([0.0, 1.0], dtype=np.float32),
+            "likes coffee": np.array([1.0, 0.0], dtype=np.float32),
+        }
+
+        selected = store._apply_mmr(self._results(), k=2, vectors=vectors)
+
+        assert [r["content"] for r in selected] == ["trip to Oaxaca", "visited Oaxaca city"]
+
+    def test_missing_vectors_fall_back_to_jaccard(self, store):
+        selected = store._apply_mmr(self._results(), k=2, vectors={})
+
+        assert [r["content"] for r in selected] == ["trip to Oaxaca", "likes coffee"]
+
+    def test_recall_reranks_wider_pool_down_to_k(self, tmp_path, monkeypatch):
+        fastembed = pytest.importorskip("fastembed", reason="fastembed not installed")
+        pytest.importorskip("usearch", reason="usearch not installed")
+        monkeypatch.setattr(fastembed, "TextEmbedding", FakeEmbedding)
+
+        from banabot.agent.semantic_memory import SemanticMemoryStore
+        from banabot.config.schema import SemanticMemoryConfig
+
+        store = SemanticMemoryStore(tmp_path, SemanticMemoryConfig(enabled=True, mmr_candidates=8))
+        store.save_many([{"content": f"memory {i}"} for i in range(10)])
+
+        results = store.recall("memory", k=3, min_score=-1.0, use_mmr=True)
+
+        assert len(results) == 3
+        assert len({r["content"] for r in results}) == 3
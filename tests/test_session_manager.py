@@ -0,0 +1,327 @@
+"""Tests for SessionManager persistence."""
+
+import json
+
+from banabot.session.manager import PagedMessages, Session, SessionManager
+from banabot.session.sqlite_store import SqliteSessionStore
+from banabot.session.store import JsonlSessionStore, copy_sessions
+
+
+def _lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+class TestAppendOnlySave:
+    """Saves append new messages instead of rewriting the file."""
+
+    def test_second_save_appends_only_new_messages(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        session = Session(key="telegram:1")
+        session.add_message("user", "a")
+        manager.save(session)
+        path = manager.store.path_for(session.key)
+        size_before = path.stat().st_size
+        head_before = path.read_bytes()
+
+        session.add_message("assistant", "b")
+        manager.save(session)
+
+        assert path.read_bytes().startswith(head_before)
+        assert path.stat().st_size > size_before
+        records = _lines(path)
+        assert [r.get("content") for r in records if r.get("_type") != "metadata"] == ["a", "b"]
+        assert records[-1]["_type"] == "metadata"
+
+    def test_trailer_metadata_wins_on_load(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        session = Session(key="telegram:1")
+        for i in range(4):
+            session.add_message("user", f"m{i}")
+        manager.save(session)
+        session.last_consolidated = 3
+        session.metadata["lang"] = "es"
+        session.add_message("user", "m4")
+        manager.save(session)
+
+        reloaded = SessionManager(tmp_path).get_or_create("telegram:1")
+        assert reloaded.last_consolidated == 3
+        assert reloaded.metadata == {"lang": "es"}
+        assert [m["content"] for m in reloaded.messages] == [f"m{i}" for i in range(5)]
+
+    def test_clear_forces_rewrite(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        session = Session(key="telegram:1")
+        session.add_message("user", "old")
+        manager.save(session)
+
+        session.clear()
+        session.add_message("user", "new")
+        manager.save(session)
+
+        reloaded = SessionManager(tmp_path).get_or_create("telegram:1")
+        assert [m["content"] for m in reloaded.messages] == ["new"]
+
+    def test_compaction_after_threshold(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path, compact_every=3)
+        session = Session(key="telegram:1")
+        for i in range(6):
+            session.add_message("user", f"m{i}")
+            manager.save(session)
+
+        records = _lines(manager.store.path_for(session.key))
+        assert sum(1 for r in records if r.get("_type") == "metadata") <= 4
+        reloaded = SessionManager(tmp_path).get_or_create("telegram:1")
+        assert len(reloaded.messages) == 6
+
+    def test_torn_tail_is_skipped_and_repaired(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        session = Session(key="telegram:1")
+        session.add_message("user", "a")
+        manager.save(session)
+        path = manager.store.path_for(session.key)
+        with open(path, "a") as f:
+            f.write('{"role": "user", "cont')
+
+        reloaded = SessionManager(tmp_path).get_or_create("telegram:1")
+        assert [m["content"] for m in reloaded.messages] == ["a"]
+
+        reloaded.add_message("user", "b")
+        SessionManager(tmp_path).save(reloaded)
+        assert all(line.strip() for line in path.read_text().splitlines())
+        again = SessionManager(tmp_path).get_or_create("telegram:1")
+        assert [m["content"] for m in again.messages] == ["a", "b"]
+
+    def test_list_sessions_reads_latest_metadata(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        session = Session(key="telegram:1")
+        session.add_message("user", "a")
+        manager.save(session)
+        session.add_message("user", "b")
+        manager.save(session)
+
+        (info,) = manager.list_sessions()
+        assert info["updated_at"] == session.updated_at.isoformat()
+
+
+class TestSessionCache:
+    """The session cache is bounded and flushes before evicting."""
+
+    def test_hits_and_misses(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        manager.get_or_create("telegram:1")
+        manager.get_or_create("telegram:1")
+
+        stats = manager.cache_stats
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+    def test_lru_eviction_flushes_dirty_sessions(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path, max_cached=2)
+        first = manager.get_or_create("telegram:1")
+        first.add_message("user", "unsaved")
+        manager.get_or_create("telegram:2")
+        manager.get_or_create("telegram:3")
+
+        assert manager.cache_stats["evictions"] == 1
+        assert "telegram:1" not in manager._cache
+        reloaded = manager.get_or_create("telegram:1")
+        assert reloaded is not first
+        assert [m["content"] for m in reloaded.messages] == ["unsaved"]
+
+    def test_recently_used_session_survives(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path, max_cached=2)
+        manager.get_or_create("telegram:1")
+        manager.get_or_create("telegram:2")
+        manager.get_or_create("telegram:1")
+        manager.get_or_create("telegram:3")
+
+        assert set(manager._cache) == {"telegram:1", "telegram:3"}
+
+    def test_sessions_in_use_are_not_evicted(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path, max_cached=1)
+        busy = manager.get_or_create("telegram:1")
+        with manager.in_use("telegram:1"):
+            manager.get_or_create("telegram:2")
+            assert manager.get_or_create("telegram:1") is busy
+
+        manager.get_or_create("telegram:3")
+        assert list(manager._cache) == ["telegram:3"]
+
+    def test_byte_budget(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path, max_cached_bytes=1000)
+        for i in range(3):
+            session = manager.get_or_create(f"telegram:{i}")
+            session.add_message("user", "x" * 600)
+            manager.save(session)
+
+        assert manager.cache_stats["size"] == 1
+        assert list(manager._cache) == ["telegram:2"]
+
+    def test_idle_eviction(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path, max_idle_seconds=0)
+        manager.get_or_create("telegram:1")
+        manager.get_or_create("telegram:2")
+
+        assert list(manager._cache) == ["telegram:2"]
+
+    def test_new_empty_sessions_are_not_written(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path, max_cached=1)
+        manager.get_or_create("telegram:1")
+        manager.get_or_create("telegram:2")
+
+        assert not manager.store.path_for("telegram:1").exists()
+
+    def test_flush_writes_dirty_sessions(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        session = manager.get_or_create("telegram:1")
+        session.add_message("user", "hi")
+        assert manager.is_dirty(session)
+
+        manager.flush()
+
+        assert not manager.is_dirty(session)
+        assert len(SessionManager(tmp_path).get_or_create("telegram:1").messages) == 1
+
+
+class TestTailLoading:
+    """Only the recent end of a session is parsed on load."""
+
+    def _big_session(self, tmp_path, count: int = 300) -> SessionManager:
+        manager = SessionManager(tmp_path)
+        session = Session(key="telegram:1")
+        for i in range(count):
+            session.add_message("user", f"m{i} " + "x" * 2000)
+        session.last_consolidated = count - 10
+        manager.save(session)
+        return manager
+
+    def test_only_tail_is_materialized(self, tmp_path) -> None:
+        self._big_session(tmp_path)
+
+        session = SessionManager(tmp_path, tail_messages=20).get_or_create("telegram:1")
+
+        assert isinstance(session.messages, PagedMessages)
+        assert len(session.messages) == 300
+        assert session.messages.loaded < 300
+        assert session.last_consolidated == 290
+        history = session.get_history(max_messages=20)
+        assert history[0]["content"].startswith("m280 ")
+        assert history[-1]["content"].startswith("m299 ")
+
+    def test_older_messages_page_in_on_demand(self, tmp_path) -> None:
+        self._big_session(tmp_path)
+        session = SessionManager(tmp_path, tail_messages=20).get_or_create("telegram:1")
+
+        assert session.messages[5]["content"].startswith("m5 ")
+        assert [m["content"].split()[0] for m in session.messages[:3]] == ["m0", "m1", "m2"]
+        assert session.messages.loaded == 300
+
+    def test_append_and_reload_after_tail_load(self, tmp_path) -> None:
+        self._big_session(tmp_path)
+        manager = SessionManager(tmp_path, tail_messages=20)
+        session = manager.get_or_create("telegram:1")
+        session.add_message("user", "new")
+        manager.save(session)
+        manager.compact(session)
+
+        reloaded = SessionManager(tmp_path).get_or_create("telegram:1")
+        assert len(reloaded.messages) == 301
+        assert reloaded.messages[0]["content"].startswith("m0 ")
+        assert reloaded.messages[-1]["content"] == "new"
+
+    def test_legacy_file_without_trailer_loads_fully(self, tmp_path) -> None:
+        manager = SessionManager(tmp_path)
+        path = manager.store.path_for("telegram:1")
+        path.write_text(
+            json.dumps({"_type": "metadata", "created_at": None, "last_consolidated": 1})
+            + "\n"
+            + "\n".join(json.dumps({"role": "user", "content": f"m{i}"}) for i in range(3))
+            + "\n"
+        )
+
+        session = manager.get_or_create("telegram:1")
+        assert [m["content"] for m in session.messages] == ["m0", "m1", "m2"]
+        assert session.last_consolidated == 1
+
+
+class TestSqliteStore:
+    """SQLite backend round-trips sessions and supports migration."""
+
+    def _manager(self, tmp_path, **kwargs) -> SessionManager:
+        store = SqliteSessionStore(tmp_path / "sessions.db", **kwargs)
+        return SessionManager(tmp_path, store=store)
+
+    def test_roundtrip_and_incremental_save(self, tmp_path) -> None:
+        manager = self._manager(tmp_path)
+        session = manager.get_or_create("telegram:1")
+        session.add_message("user", "a")
+        manager.save(session)
+        session.add_message("assistant", "b")
+        session.last_consolidated = 1
+        manager.save(session)
+        manager.store.close()
+
+        reloaded = self._manager(tmp_path).get_or_create("telegram:1")
+        assert [m["content"] for m in reloaded.messages] == ["a", "b"]
+        assert reloaded.last_consolidated == 1
+
+    def test_clear_replaces_messages(self, tmp_path) -> None:
+        manager = self._manager(tmp_path)
+        session = manager.get_or_create("telegram:1")
+        session.add_message("user", "old")
+        manager.save(session)
+        session.clear()
+        session.add_message("user", "new")
+        manager.save(session)
+
+        reloaded = self._manager(tmp_path).get_or_create("telegram:1")
+        assert [m["content"] for m in reloaded.messages] == ["new"]
+
+    def test_tail_loading_pages_older_rows(self, tmp_path) -> None:
+        manager = self._manager(tmp_path)
+        session = manager.get_or_create("telegram:1")
+        for i in range(50):
+            session.add_message("user", f"m{i}")
+        session.last_consolidated = 45
+        manager.save(session)
+
+        store = SqliteSessionStore(tmp_path / "sessions.db", tail_messages=10, page_size=7)
+        reloaded = store.load("telegram:1")
+        assert reloaded is not None
+        assert isinstance(reloaded.messages, PagedMessages)
+        assert reloaded.messages.loaded == 10
+        assert reloaded.messages[0]["content"] == "m0"
+        assert len(reloaded.messages) == 50
+
+    def test_list_sessions_ordered_by_update(self, tmp_path) -> None:
+        manager = self._manager(tmp_path)
+        for key in ("telegram:1", "telegram:2"):
+            session = manager.get_or_create(key)
+            session.add_message("user", "hi")
+            manager.save(session)
+
+        sessions = manager.list_sessions(limit=1)
+        assert [s["key"] for s in sessions] == ["telegram:2"]
+        assert manager.store.count() == 2
+
+    def test_migrate_jsonl_to_sqlite_and_back(self, tmp_path) -> None:
+        jsonl = JsonlSessionStore(tmp_path / "sessions")
+        manager = SessionManager(tmp_path, store=jsonl)
+        session = manager.get_or_create("cron:job_1")
+        session.add_message("user", "a")
+        session.last_consolidated = 1
+        manager.save(session)
+
+        sqlite = SqliteSessionStore(tmp_path / "sessions.db")
+        assert copy_sessions(jsonl, sqlite) == 1
+        migrated = sqlite.load("cron:job_1")
+        assert migrated is not None
+        assert [m["content"] for m in migrated.messages] == ["a"]
+        assert migrated.last_consolidated == 1
+
+        exported = JsonlSessionStore(tmp_path / "exported")
+        assert copy_sessions(sqlite, exported) == 1
+        back = exported.load("cron:job_1")
+        assert back is not None
+        assert [m["content"] for m in back.messages] == ["a"]
@@ -0,0 +1,209 @@
+"""Tests for streamed LLM replies and their delivery through the bus."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+
+from banabot.agent.loop import AgentLoop
+from banabot.bus.events import InboundMessage, OutboundMessage
+from banabot.bus.queue import MessageBus
+from banabot.channels.base import BaseChannel
+from banabot.channels.manager import ChannelManager
+from banabot.config.schema import Config
+from banabot.providers.base import (
+    LLMProvider,
+    LLMResponse,
+    StreamAssembler,
+    StreamChunk,
+    ToolCallRequest,
+)
+from banabot.providers.openai_codex_provider import _consume_sse
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None, usage=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)], usage=usage
+    )
+
+
+def _tool_delta(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments)
+    )
+
+
+class ScriptedProvider(LLMProvider):
+    """Streams a fixed list of answers, one per call, word by word."""
+
+    def __init__(self, answers: list[LLMResponse]):
+        super().__init__()
+        self.answers = answers
+
+    async def chat(self, messages, tools=None, model=None, max_tokens=4096, temperature=0.7):
+        return self.answers.pop(0)
+
+    async def chat_stream(self, messages, tools=None, model=None, max_tokens=4096, temperature=0.7):
+        response = self.answers.pop(0)
+        for word in (response.content or "").split(" "):
+            yield StreamChunk(delta=word + " ")
+        yield StreamChunk(response=response)
+
+    def get_default_model(self) -> str:
+        return "test-model"
+
+
+def _drain(bus: MessageBus) -> list[OutboundMessage]:
+    out = []
+    while bus.outbound_size:
+        out.append(bus.outbound.get_nowait())
+    return out
+
+
+class TestStreamAssembler:
+    def test_assembles_text_tool_calls_and_usage(self) -> None:
+        assembler = StreamAssembler()
+        chunks = [
+            _chunk(content="Let me "),
+            _chunk(content="check."),
+            _chunk(tool_calls=[_tool_delta(0, id="call_1", name="read_file", arguments='{"pa')]),
+            _chunk(tool_calls=[_tool_delta(0, arguments='th": "a.txt"}')]),
+            _chunk(tool_calls=[_tool_delta(1, id="call_2", name="list_dir", arguments="{}")]),
+            _chunk(finish_reason="tool_calls"),
+            SimpleNamespace(
+                choices=[],
+                usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+            ),
+        ]
+
+        deltas = [assembler.add(c) for c in chunks]
+        response = assembler.response()
+
+        assert "".join(deltas) == "Let me check."
+        assert response.content == "Let me check."
+        assert [(tc.id, tc.name, tc.arguments) for tc in response.tool_calls] == [
+            ("call_1", "read_file", {"path": "a.txt"}),
+            ("call_2", "list_dir", {}),
+        ]
+        assert response.finish_reason == "tool_calls"
+        assert response.usage["total_tokens"] == 15
+
+    async def test_default_chat_stream_falls_back_to_chat(self) -> None:
+        provider = ScriptedProvider([LLMResponse(content="whole answer")])
+        chunks = [c async for c in LLMProvider.chat_stream(provider, [])]
+
+        assert [c.delta for c in chunks] == ["whole answer", ""]
+        assert chunks[-1].response.content == "whole answer"
+
+    async def test_codex_sse_yields_deltas_then_response(self) -> None:
+        events = [
+            {"type": "response.output_text.delta", "delta": "Hel"},
+            {"type": "response.output_text.delta", "delta": "lo"},
+            {"type": "response.completed", "response": {"status": "completed"}},
+        ]
+        body = "".join(f"data: {json.dumps(e)}\n\n" for e in events)
+        response = httpx.Response(200, content=body.encode())
+
+        chunks = [c async for c in _consume_sse(response)]
+
+        assert [c.delta for c in chunks[:-1]] == ["Hel", "lo"]
+        assert chunks[-1].response.content == "Hello"
+        assert chunks[-1].response.finish_reason == "stop"
+
+
+class TestAgentStreaming:
+    def _loop(self, tmp_path, answers) -> AgentLoop:
+        return AgentLoop(
+            bus=MessageBus(),
+            provider=ScriptedProvider(answers),
+            workspace=tmp_path,
+            stream_interval=0,
+        )
+
+    async def test_bus_reply_is_streamed_then_finalized(self, tmp_path) -> None:
+        loop = self._loop(tmp_path, [LLMResponse(content="one two three")])
+        msg = InboundMessage(channel="telegram", sender_id="u", chat_id="1", content="hi")
+
+        final = await loop._process_message(msg)
+        updates = _drain(loop.bus)
+
+        assert [u.content for u in updates] == ["one", "one two", "one two three"]
+        assert all(u.is_partial for u in updates)
+        assert len({u.stream_id for u in updates}) == 1
+        assert final.content == "one two three"
+        assert final.stream_id == updates[0].stream_id
+        assert not final.is_partial
+
+    async def test_tool_turn_settles_its_own_stream(self, tmp_path) -> None:
+        loop = self._loop(
+            tmp_path,
+            [
+                LLMResponse(
+                    content="Looking",
+                    tool_calls=[ToolCallRequest(id="c1", name="list_dir", arguments={"path": "."})],
+                ),
+                LLMResponse(content="Done"),
+            ],
+        )
+        msg = InboundMessage(channel="telegram", sender_id="u", chat_id="1", content="ls")
+
+        final = await loop._process_message(msg)
+        updates = _drain(loop.bus)
+
+        settled = [u for u in updates if not u.is_partial]
+        assert [u.content for u in settled] == ["Looking"]
+        assert final.content == "Done"
+        assert final.stream_id not in (None, settled[0].stream_id)
+
+    async def test_process_direct_does_not_stream(self, tmp_path) -> None:
+        loop = self._loop(tmp_path, [LLMResponse(content="quiet answer")])
+
+        assert await loop.process_direct("hi") == "quiet answer"
+        assert loop.bus.outbound_size == 0
+
+
+class RecordingChannel(BaseChannel):
+    def __init__(self, name: str, supports_edits: bool):
+        super().__init__(SimpleNamespace(), MessageBus())
+        self.name = name
+        self.supports_edits = supports_edits
+        self.sent: list[OutboundMessage] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, msg: OutboundMessage) -> None:
+        self.sent.append(msg)
+
+
+async def test_partial_updates_only_reach_channels_with_edits() -> None:
+    bus = MessageBus()
+    config = Config()
+    config.gateway.outbound.coalesce = False  # keep the superseded partial update
+    manager = ChannelManager(config, bus)
+    editable = manager.channels["slack"] = RecordingChannel("slack", True)
+    plain = manager.channels["email"] = RecordingChannel("email", False)
+    for channel in ("slack", "email"):
+        for partial in (True, False):
+            await bus.publish_outbound(
+                OutboundMessage(
+                    channel=channel,
+                    chat_id="c",
+                    content="x",
+                    metadata={"_stream": {"id": "s1", "partial": partial}},
+                )
+            )
+
+    task = asyncio.create_task(manager._dispatch_outbound())
+    while bus.outbound_size:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    assert [m.is_partial for m in editable.sent] == [True, False]
+    assert [m.is_partial for m in plain.sent] == [False]
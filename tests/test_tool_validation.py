@@ -1,7 +1,14 @@
+import asyncio
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from banabot.agent.loop import AgentLoop
 from banabot.agent.tools.base import Tool
 from banabot.agent.tools.registry import ToolRegistry
+from banabot.bus.queue import MessageBus
+from banabot.providers.base import LLMResponse
 
 
 class SampleTool(Tool):
@@ -86,3 +93,266 @@ async def test_registry_returns_validation_error() -> None:
     reg.register(SampleTool())
     result = await reg.execute("sample", {"query": "hi"})
     assert "Invalid parameters" in result
+
+
+class SleepTool(Tool):
+    """Records start/finish order; sleeps for the requested delay."""
+
+    def __init__(self, name: str, parallel_safe: bool, log: list[str]):
+        self._name = name
+        self.parallel_safe = parallel_safe
+        self.log = log
+        self.running = 0
+        self.peak = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "sleep"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"delay": {"type": "number"}}}
+
+    async def execute(self, delay: float = 0.0, **kwargs: Any) -> str:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.log.append(f"start {self.name} {delay}")
+        await asyncio.sleep(delay)
+        self.running -= 1
+        self.log.append(f"end {self.name} {delay}")
+        return f"{self.name} {delay}"
+
+
+async def test_execute_many_runs_parallel_safe_calls_concurrently() -> None:
+    log: list[str] = []
+    reg = ToolRegistry()
+    reg.register(SleepTool("read", True, log))
+    calls = [("read", {"delay": d}) for d in (0.03, 0.01, 0.02)]
+
+    results = await reg.execute_many(calls)
+
+    assert results == ["read 0.03", "read 0.01", "read 0.02"]
+    assert log[:3] == ["start read 0.03", "start read 0.01", "start read 0.02"]
+
+
+async def test_execute_many_respects_concurrency_limit() -> None:
+    reg = ToolRegistry()
+    tool = SleepTool("read", True, [])
+    reg.register(tool)
+
+    await reg.execute_many([("read", {"delay": 0.01})] * 5, max_concurrency=2)
+
+    assert tool.peak == 2
+
+
+async def test_execute_many_serializes_unsafe_calls() -> None:
+    log: list[str] = []
+    reg = ToolRegistry()
+    reg.register(SleepTool("read", True, log))
+    reg.register(SleepTool("write", False, log))
+
+    results = await reg.execute_many(
+        [("read", {"delay": 0.02}), ("write", {"delay": 0}), ("read", {"delay": 0})]
+    )
+
+    assert results == ["read 0.02", "write 0", "read 0"]
+    assert log == [
+        "start read 0.02",
+        "end read 0.02",
+        "start write 0",
+        "end write 0",
+        "start read 0",
+        "end read 0",
+    ]
+
+
+async def test_execute_many_keeps_unknown_tool_errors_in_place() -> None:
+    reg = ToolRegistry()
+    reg.register(SleepTool("read", True, []))
+
+    results = await reg.execute_many([("read", {}), ("missing", {}), ("read", {})])
+
+    assert results[1] == "Error: Tool 'missing' not found"
+    assert results[0] == results[2] == "read 0.0"
+
+
+class NamedTool(SampleTool):
+    def __init__(self, name: str, description: str = "sample tool"):
+        self._name = name
+        self._description = description
+        self.schema_builds = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    def to_schema(self) -> dict[str, Any]:
+        self.schema_builds += 1
+        return super().to_schema()
+
+
+def test_definitions_are_cached_until_registry_changes() -> None:
+    reg = ToolRegistry()
+    tool = NamedTool("a")
+    reg.register(tool)
+
+    first = reg.get_definitions()
+    assert reg.get_definitions() is first
+    assert tool.schema_builds == 1
+
+    version = reg.version
+    reg.register(NamedTool("b"))
+    assert reg.version == version + 1
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["a", "b"]
+
+    reg.unregister("a")
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["b"]
+
+
+def test_definitions_subset_keeps_registration_order() -> None:
+    reg = ToolRegistry()
+    for name in ("a", "b", "c"):
+        reg.register(NamedTool(name))
+
+    subset = reg.get_definitions(["c", "a", "missing"])
+
+    assert [d["function"]["name"] for d in subset] == ["a", "c"]
+
+
+def test_select_ranks_by_keyword_overlap() -> None:
+    reg = ToolRegistry()
+    reg.register(NamedTool("read_file", "Read a file"))
+    reg.register(NamedTool("mcp_github_create_issue", "Create a GitHub issue"))
+    reg.register(NamedTool("mcp_calendar_add_event", "Add a calendar event"))
+    reg.register(NamedTool("mcp_github_list_pulls", "List pull requests"))
+
+    names = reg.select("please open an issue on github", limit=2, pinned=["read_file"])
+
+    assert names == ["read_file", "mcp_github_create_issue"]
+    assert reg.select("anything", limit=0) == reg.tool_names
+
+
+def _reference_validate(val: Any, schema: dict[str, Any], path: str = "") -> list[str]:
+    """The original schema-walking validator, kept to check compiled output."""
+    t, label = schema.get("type"), path or "parameter"
+    if t in Tool._TYPE_MAP and not isinstance(val, Tool._TYPE_MAP[t]):
+        return [f"{label} should be {t}"]
+    errors = []
+    if "enum" in schema and val not in schema["enum"]:
+        errors.append(f"{label} must be one of {schema['enum']}")
+    if t in ("integer", "number"):
+        if "minimum" in schema and val < schema["minimum"]:
+            errors.append(f"{label} must be >= {schema['minimum']}")
+        if "maximum" in schema and val > schema["maximum"]:
+            errors.append(f"{label} must be <= {schema['maximum']}")
+    if t == "string":
+        if "minLength" in schema and len(val) < schema["minLength"]:
+            errors.append(f"{label} must be at least {schema['minLength']} chars")
+        if "maxLength" in schema and len(val) > schema["maxLength"]:
+            errors.append(f"{label} must be at most {schema['maxLength']} chars")
+    if t == "object":
+        props = schema.get("properties", {})
+        for k in schema.get("required", []):
+            if k not in val:
+                errors.append(f"missing required {path + '.' + k if path else k}")
+        for k, v in val.items():
+            if k in props:
+                errors.extend(_reference_validate(v, props[k], path + "." + k if path else k))
+    if t == "array" and "items" in schema:
+        for i, item in enumerate(val):
+            errors.extend(
+                _reference_validate(item, schema["items"], f"{path}[{i}]" if path else f"[{i}]")
+            )
+    return errors
+
+
+VALIDATION_CASES = [
+    {"query": "hi", "count": 2},
+    {"query": "hi"},
+    {"query": "h", "count": 0, "mode": "slow"},
+    {"query": 3, "count": "2"},
+    {"query": "hi", "count": 11, "meta": {"flags": [1, "ok", 2]}},
+    {"query": "hi", "count": 2, "meta": "nope"},
+    {"query": "hi", "count": True, "extra": {"x": 1}},
+    {},
+]
+
+
+def test_compiled_validator_matches_reference_messages() -> None:
+    tool = SampleTool()
+    for params in VALIDATION_CASES:
+        assert tool.validate_params(params) == _reference_validate(params, tool.parameters)
+
+
+def test_validator_is_compiled_once() -> None:
+    tool = SampleTool()
+    tool.validate_params({"query": "hi", "count": 2})
+    validator = tool._validator
+
+    tool.validate_params({"query": "h"})
+
+    assert tool._validator is validator
+
+
+@pytest.mark.benchmark
+def test_compiled_validator_benchmark() -> None:
+    import timeit
+
+    tool = SampleTool()
+    tool.validate_params({})
+
+    def compiled() -> None:
+        for params in VALIDATION_CASES:
+            tool.validate_params(params)
+
+    def reference() -> None:
+        for params in VALIDATION_CASES:
+            _reference_validate(params, {**tool.parameters, "type": "object"})
+
+    compiled_time = min(timeit.repeat(compiled, number=500, repeat=5))
+    reference_time = min(timeit.repeat(reference, number=500, repeat=5))
+    assert compiled_time < reference_time, (
+        f"validate_params x4000: compiled {compiled_time:.4f}s, reference {reference_time:.4f}s"
+    )
+
+
+def test_agent_turn_limit_counts_mcp_tools_only(tmp_path) -> None:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    loop = AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path, max_tools_per_turn=1)
+    builtins = list(loop.tools.tool_names)
+    loop.tools.register(NamedTool("mcp_github_create_issue", "Create a GitHub issue"))
+    loop.tools.register(NamedTool("mcp_calendar_add_event", "Add a calendar event"))
+
+    selected = loop._select_tools("open a github issue")
+
+    assert selected == builtins + ["mcp_github_create_issue"]
+    definitions = loop._tool_definitions(selected, ["mcp_github_create_issue"])
+    assert len(definitions) == len(selected)
+
+
+async def test_agent_turn_ranks_tools_on_the_raw_message(tmp_path) -> None:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    provider.chat = AsyncMock(return_value=LLMResponse(content="done"))
+    loop = AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path, max_tools_per_turn=1)
+    loop.tools.register(NamedTool("mcp_github_create_issue", "Create a GitHub issue"))
+    loop.tools.register(NamedTool("mcp_calendar_add_event", "Add a calendar event"))
+    text = "open a github issue"
+    context = "<context>\nChat: calendar\nMemory: add the team event to the calendar\n</context>"
+    prompt = f"{context}\n\n{text}"
+    assert "mcp_calendar_add_event" in loop._select_tools(prompt)
+
+    await loop._run_agent_loop([{"role": "user", "content": prompt}], query=text)
+
+    offered = [d["function"]["name"] for d in provider.chat.call_args.kwargs["tools"]]
+    assert "mcp_github_create_issue" in offered
+    assert "mcp_calendar_add_event" not in offered
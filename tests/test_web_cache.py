@@ -0,0 +1,142 @@
+"""Tests for the web_search / web_fetch response cache."""
+
+import json
+import time
+
+import httpx
+
+from banabot.agent.tools.http_pool import HttpPool
+from banabot.agent.tools.web import WebFetchTool, WebSearchTool
+from banabot.agent.tools.web_cache import WebCache, http_ttl
+
+
+class MockPool(HttpPool):
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+class CountingBackend:
+    calls = 0
+
+    async def search(self, query: str, count: int) -> str:
+        CountingBackend.calls += 1
+        return f"Results for: {query}"
+
+
+class TestWebCache:
+    def test_entries_persist_across_instances(self, tmp_path) -> None:
+        cache = WebCache(tmp_path)
+        cache.put("search", "k", "value", ttl=60, etag='"v1"')
+        cache.close()
+
+        entry = WebCache(tmp_path).get("search", "k")
+        assert entry is not None
+        assert entry.value == "value"
+        assert entry.fresh
+        assert entry.etag == '"v1"'
+
+    def test_expired_entries_are_returned_stale(self, tmp_path) -> None:
+        cache = WebCache(tmp_path)
+        cache.put("fetch", "k", {"text": "x"}, ttl=0)
+
+        entry = cache.get("fetch", "k")
+        assert entry is not None and not entry.fresh
+        assert cache.stats["misses"] == 1
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path) -> None:
+        cache = WebCache(tmp_path, max_entries=2)
+        cache.put("search", "a", 1, ttl=60)
+        time.sleep(0.01)
+        cache.put("search", "b", 2, ttl=60)
+        time.sleep(0.01)
+        cache.put("search", "a", 1, ttl=60)
+        time.sleep(0.01)
+        cache.put("search", "c", 3, ttl=60)
+
+        assert cache.stats["entries"] == 2
+        fresh = WebCache(tmp_path, max_entries=2)
+        assert fresh.get("search", "b") is None
+        assert fresh.get("search", "a") is not None
+
+    def test_http_ttl(self) -> None:
+        assert http_ttl({}, 900) == 900
+        assert http_ttl({"cache-control": "public, max-age=60"}, 900) == 60
+        assert http_ttl({"cache-control": "max-age=86400"}, 900) == 900
+        assert http_ttl({"cache-control": "no-cache"}, 900) == 0
+        assert http_ttl({"cache-control": "no-store"}, 900) is None
+        assert http_ttl({"expires": "Thu, 01 Jan 1970 00:00:00 GMT"}, 900) == 0
+
+
+class TestCachedTools:
+    async def test_search_results_are_cached_per_normalized_query(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        CountingBackend.calls = 0
+        tool = WebSearchTool(cache=WebCache(tmp_path))
+        monkeypatch.setattr(tool, "_get_backend", lambda name: CountingBackend())
+
+        first = await tool.execute("Banana  Bread")
+        second = await tool.execute("banana bread")
+
+        assert first == second
+        assert CountingBackend.calls == 1
+
+    async def test_fetch_is_served_from_cache(self, tmp_path) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"n": 1}, headers={"content-type": "application/json"})
+
+        tool = WebFetchTool(http=MockPool(handler), cache=WebCache(tmp_path))
+
+        first = json.loads(await tool.execute("https://api.example/data"))
+        second = json.loads(await tool.execute("https://api.example/data", maxChars=100))
+
+        assert len(requests) == 1
+        assert first["text"] == second["text"]
+
+    async def test_stale_fetch_is_revalidated_with_etag(self, tmp_path) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                text="plain body",
+                headers={"content-type": "text/plain", "etag": '"v1"', "cache-control": "no-cache"},
+            )
+
+        tool = WebFetchTool(http=MockPool(handler), cache=WebCache(tmp_path))
+
+        await tool.execute("https://example.com/a.txt")
+        result = json.loads(await tool.execute("https://example.com/a.txt"))
+
+        assert len(requests) == 2
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert result["text"] == "plain body"
+
+    async def test_no_store_responses_are_not_cached(self, tmp_path) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200,
+                text="secret",
+                headers={"content-type": "text/plain", "cache-control": "no-store"},
+            )
+
+        tool = WebFetchTool(http=MockPool(handler), cache=WebCache(tmp_path))
+
+        await tool.execute("https://example.com/private")
+        await tool.execute("https://example.com/private")
+
+        assert calls == 2
@@ -0,0 +1,89 @@
+"""Tests for streaming, size-bounded web_fetch."""
+
+import json
+import threading
+
+import httpx
+
+from banabot.agent.tools.http_pool import HttpPool
+from banabot.agent.tools.web import WebFetchTool, _is_text_content
+
+
+class MockPool(HttpPool):
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+class ChunkedBody(httpx.AsyncByteStream):
+    """Endless-ish body that counts how many chunks were pulled."""
+
+    def __init__(self, chunk: bytes, count: int):
+        self.chunk = chunk
+        self.count = count
+        self.pulled = 0
+
+    async def __aiter__(self):
+        for _ in range(self.count):
+            self.pulled += 1
+            yield self.chunk
+
+
+async def test_download_stops_at_byte_budget() -> None:
+    body = ChunkedBody(b"x" * 1000, count=1000)
+    pool = MockPool(
+        lambda request: httpx.Response(200, headers={"content-type": "text/plain"}, stream=body)
+    )
+    tool = WebFetchTool(http=pool, max_bytes=5000)
+
+    result = json.loads(await tool.execute("https://example.com/big.txt"))
+
+    assert body.pulled <= 6
+    assert result["length"] == 5000
+    assert result["truncated"] is True
+
+
+async def test_non_text_content_is_rejected_before_download() -> None:
+    body = ChunkedBody(b"\x89PNG", count=100)
+    pool = MockPool(
+        lambda request: httpx.Response(200, headers={"content-type": "image/png"}, stream=body)
+    )
+
+    result = json.loads(await WebFetchTool(http=pool).execute("https://example.com/cat.png"))
+
+    assert "Unsupported content type: image/png" in result["error"]
+    assert body.pulled == 0
+
+
+async def test_html_is_extracted_off_the_event_loop() -> None:
+    threads: list[str] = []
+
+    class RecordingFetch(WebFetchTool):
+        def _extract(self, text, ctype, extract_mode):
+            threads.append(threading.current_thread().name)
+            return super()._extract(text, ctype, extract_mode)
+
+    page = "<html><head><title>T</title></head><body><p>Hello <b>world</b></p></body></html>"
+    pool = MockPool(
+        lambda request: httpx.Response(
+            200, headers={"content-type": "text/html; charset=utf-8"}, text=page
+        )
+    )
+
+    result = json.loads(await RecordingFetch(http=pool).execute("https://example.com/"))
+
+    assert result["extractor"] == "readability"
+    assert "Hello" in result["text"]
+    assert threads and threads[0] != threading.main_thread().name
+
+
+def test_text_content_types() -> None:
+    assert _is_text_content("text/html; charset=utf-8")
+    assert _is_text_content("application/json")
+    assert _is_text_content("application/ld+json")
+    assert _is_text_content("")
+    assert not _is_text_content("application/pdf")
+    assert not _is_text_content("video/mp4")